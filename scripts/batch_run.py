@@ -5,25 +5,23 @@ This script will find all `*.yaml` files in the `inputs/` directory (recursively
 load each one, and run a prediction using the package CLI programmatic API.
 
 Usage:
-  python scripts/batch_run.py [--inputs inputs] [--output structures] [--split]
+  python scripts/batch_run.py [--inputs inputs] [--output structures] [--split] [--workers N]
 
 Notes:
 - Requires that your environment has BOLTZ2_API_KEY set (in .env or environment).
-- Runs sequentially; consider parallelizing if needed.
+- Runs up to --workers predictions concurrently (default: 4).
 """
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src to path for local development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from boltz2 import load_payload_from_yaml, Boltz2Client
-
-
-def find_yaml_files(inputs_dir: Path):
-    return sorted(inputs_dir.rglob("*.yaml"))
+from boltz2.io import find_yaml_files
 
 
 def run_yaml(client: Boltz2Client, yaml_path: Path, output_dir: Path, split: bool):
@@ -42,6 +40,7 @@ def main():
     parser.add_argument("--split", action="store_true", help="Split outputs into artifacts")
     parser.add_argument("--api-key", help="API key (overrides .env file)")
     parser.add_argument("--timeout", type=int, default=600, help="Request timeout in seconds")
+    parser.add_argument("--workers", type=int, default=4, help="Number of concurrent predictions (default: 4)")
 
     args = parser.parse_args()
 
@@ -57,16 +56,22 @@ def main():
 
     # Initialize client
     try:
-        client = Boltz2Client(api_key=args.api_key, timeout=args.timeout)
+        client = Boltz2Client(api_key=args.api_key, timeout=args.timeout, max_connections=args.workers)
     except RuntimeError as e:
         print(f"Error initializing client: {e}", file=sys.stderr)
         sys.exit(1)
 
-    for yf in yaml_files:
-        try:
-            run_yaml(client, yf, args.output, args.split)
-        except Exception as e:
-            print(f"Error running {yf}: {e}", file=sys.stderr)
+    with client, ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(run_yaml, client, yf, args.output, args.split): yf
+            for yf in yaml_files
+        }
+        for future in as_completed(futures):
+            yf = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error running {yf}: {e}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,7 @@ import sys
 from pathlib import Path
 
 from boltz2 import Boltz2Client
-from boltz2.logging_config import get_logger, setup_logging
+from boltz2.logging_config import configure_once, get_logger
 
 logger = get_logger("generate")
 
@@ -65,19 +65,19 @@ def main():
 
     # Setup logging
     if args.verbose:
-        setup_logging(level="DEBUG")
+        configure_once(level="DEBUG")
 
     # Initialize client
     try:
         client = Boltz2Client(api_key=args.api_key, timeout=args.timeout)
     except (RuntimeError, ValueError) as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
     # Generate structure
     logger.info("Generating protein+ligand structure...")
-    logger.info(f"  Sequence: {args.sequence[:50]}{'...' if len(args.sequence) > 50 else ''}")
-    logger.info(f"  Ligand: {args.ligand_smiles}")
+    logger.info("  Sequence: %s%s", args.sequence[:50], "..." if len(args.sequence) > 50 else "")
+    logger.info("  Ligand: %s", args.ligand_smiles)
 
     try:
         result = client.generate_protein_ligand(
@@ -88,18 +88,18 @@ def main():
             split_outputs=args.split,
         )
     except (RuntimeError, ValueError) as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
     logger.info("Generation complete!")
-    logger.info(f"  Output directory: {result['dir']}")
-    logger.info(f"  mmCIF: {result['mmcif']}")
-    logger.info(f"  JSON: {result['json']}")
+    logger.info("  Output directory: %s", result['dir'])
+    logger.info("  mmCIF: %s", result['mmcif'])
+    logger.info("  JSON: %s", result['json'])
 
     if args.split and "artifacts" in result:
         logger.info("Artifacts:")
         for key, path in result["artifacts"].items():
-            logger.info(f"  {key}: {path}")
+            logger.info("  %s: %s", key, path)
 
 
 if __name__ == "__main__":
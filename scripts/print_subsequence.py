@@ -4,25 +4,162 @@
 Usage examples:
   python scripts/print_subsequence.py inputs/cdPDE3A.fasta 678 1141
   python scripts/print_subsequence.py inputs/cdPDE3A.fasta 100 -w 80
+  python scripts/print_subsequence.py inputs/cdPDE3A.fasta 678 1141 --no-index
 
-The residue coordinates are 1-based and inclusive.
+The residue coordinates are 1-based and inclusive. Records in multi-record
+files are concatenated, as if the headers were removed.
+
+For random access the FASTA is indexed in samtools' ``.fai`` format (written
+next to the file and rebuilt when the FASTA is newer), then memory-mapped so
+only the pages holding the requested residues are read. Files with irregular
+line lengths cannot be indexed and fall back to a streaming read.
 """
 import argparse
+import mmap
+import os
+import re
 import sys
 
+READ_BLOCK_SIZE = 1 << 16
+_HEADER_RE = re.compile(rb"(?m)^>.*(?:\n|$)")
+_WHITESPACE = b" \t\r\n\x0b\x0c"
+
+
+def read_fasta(path, end=None):
+    """Read sequence residues from a FASTA file, skipping header lines.
 
-def read_fasta(path):
-    seq_lines = []
+    The file is processed in large blocks: header lines are removed with one
+    regex pass and whitespace with one bytes.translate per block, rather than
+    stripping each line in Python. If ``end`` is given, reading stops once
+    ``end`` residues have been collected, so the result may be longer than
+    ``end`` (up to one block) or shorter if the file runs out first.
+    """
+    buf = bytearray()
+    pending = b""
     try:
-        with open(path, "r") as fh:
-            for line in fh:
-                if line.startswith(">"):
-                    continue
-                seq_lines.append(line.strip())
+        with open(path, "rb") as fh:
+            while True:
+                block = fh.read(READ_BLOCK_SIZE)
+                if block:
+                    # Only process complete lines; carry the tail forward
+                    data = pending + block
+                    cut = data.rfind(b"\n") + 1
+                    pending = data[cut:]
+                    data = data[:cut]
+                else:
+                    data, pending = pending, b""
+                buf += _HEADER_RE.sub(b"", data).translate(None, _WHITESPACE)
+                if not block or (end is not None and len(buf) >= end):
+                    break
     except FileNotFoundError:
         print(f"Error: file not found: {path}", file=sys.stderr)
         sys.exit(2)
-    return "".join(seq_lines)
+    return buf.decode("ascii")
+
+
+def build_fai(path):
+    """Scan a FASTA file and build samtools-style index records.
+
+    Each record is a tuple of (name, length, offset, linebases, linewidth),
+    where ``offset`` is the byte offset of the first residue. Returns None if
+    the file cannot be indexed (sequence before the first header, whitespace
+    inside a sequence line, or lines of varying length other than the last
+    line of a record).
+    """
+    records = []
+    current = None
+    offset = 0
+    with open(path, "rb") as fh:
+        for line in fh:
+            if line.startswith(b">"):
+                if current is not None:
+                    records.append(tuple(current[:5]))
+                name = line[1:].split()[0].decode("ascii") if line[1:].strip() else ""
+                # [name, length, offset, linebases, linewidth, short_line_seen]
+                current = [name, 0, offset + len(line), 0, 0, False]
+            else:
+                if current is None:
+                    return None
+                residues = line.rstrip(b"\r\n")
+                if residues.translate(None, _WHITESPACE) != residues:
+                    # Offsets would count the stray whitespace as residues
+                    return None
+                bases = len(residues)
+                if current[3] == 0 and not current[5]:
+                    if bases == 0:
+                        current[5] = True
+                    else:
+                        current[3] = bases
+                        current[4] = len(line)
+                elif current[5] and bases > 0:
+                    # Only the last line of a record may be short
+                    return None
+                elif bases != current[3] or len(line) != current[4]:
+                    if bases > current[3]:
+                        return None
+                    current[5] = True
+                current[1] += bases
+            offset += len(line)
+    if current is not None:
+        records.append(tuple(current[:5]))
+    return records
+
+
+def load_fai(path):
+    """Load the ``.fai`` index for a FASTA file, building it if needed.
+
+    The index is rebuilt when missing or older than the FASTA. Failure to
+    write the index (e.g. a read-only directory) is not an error.
+    """
+    fai_path = f"{path}.fai"
+    try:
+        if os.path.getmtime(fai_path) >= os.path.getmtime(path):
+            records = []
+            with open(fai_path, "r") as fh:
+                for line in fh:
+                    name, length, offset, linebases, linewidth = line.rstrip("\n").split("\t")
+                    records.append((name, int(length), int(offset), int(linebases), int(linewidth)))
+            return records
+    except (OSError, ValueError):
+        pass
+
+    records = build_fai(path)
+    if records is not None:
+        try:
+            with open(fai_path, "w") as fh:
+                for rec in records:
+                    fh.write("\t".join(str(v) for v in rec) + "\n")
+        except OSError:
+            pass
+    return records
+
+
+def read_fasta_indexed(path, start, end, records):
+    """Read residues ``start..end`` (1-based, inclusive) using the index.
+
+    Returns a tuple of (subsequence, total_length). The subsequence is empty
+    if the range is invalid for the total length.
+    """
+    total = sum(rec[1] for rec in records)
+    if start < 1 or end < start or end > total:
+        return "", total
+
+    out = bytearray()
+    with open(path, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Residue window as 0-based half-open [lo, hi) over the concatenation
+        lo, hi = start - 1, end
+        base = 0
+        for _name, length, offset, linebases, linewidth in records:
+            r0, r1 = max(lo - base, 0), min(hi - base, length)
+            if r0 < r1:
+                b0 = offset + (r0 // linebases) * linewidth + r0 % linebases
+                last = r1 - 1
+                b1 = offset + (last // linebases) * linewidth + last % linebases + 1
+                out += mm[b0:b1].translate(None, b"\r\n")
+            base += length
+            if base >= hi:
+                break
+    return out.decode("ascii"), total
 
 
 def main():
@@ -31,28 +168,41 @@ def main():
     p.add_argument("start", type=int, help="Start residue (1-based)")
     p.add_argument("end", type=int, nargs="?", help="End residue (1-based, inclusive). If omitted, prints only the start residue")
     p.add_argument("-w", "--width", type=int, default=0, help="Wrap output to this column width (0 = no wrap)")
+    p.add_argument("--no-index", action="store_true", help="Do not build or use a .fai index; stream the file instead")
     args = p.parse_args()
 
-    seq = read_fasta(args.fasta)
-    n = len(seq)
-
     if args.end is None:
         end = args.start
     else:
         end = args.end
     start = args.start
 
+    records = None
+    if not args.no_index:
+        try:
+            records = load_fai(args.fasta)
+        except FileNotFoundError:
+            print(f"Error: file not found: {args.fasta}", file=sys.stderr)
+            sys.exit(2)
+
+    if records is not None:
+        sub, n = read_fasta_indexed(args.fasta, start, end, records)
+    else:
+        # Only a valid range can stop early; otherwise read everything so the
+        # error message reports the full sequence length.
+        valid_order = 1 <= start <= end
+        seq = read_fasta(args.fasta, end=end if valid_order else None)
+        n = len(seq)
+        sub = seq[start - 1 : end]
+
     if start < 1 or end < start or end > n:
         print(f"Error: invalid range {start}-{end} for sequence length {n}", file=sys.stderr)
         sys.exit(2)
 
-    sub = seq[start - 1 : end]
-
+    # Build the wrapped output once and hand it to stdout in a single write
     if args.width and args.width > 0:
-        for i in range(0, len(sub), args.width):
-            print(sub[i : i + args.width])
-    else:
-        print(sub)
+        sub = "\n".join(sub[i : i + args.width] for i in range(0, len(sub), args.width))
+    sys.stdout.write(sub + "\n")
 
 
 if __name__ == "__main__":
@@ -13,21 +13,47 @@ Example:
     python renumber.py input.mmcif --start 672 --output output.mmcif
     python renumber.py input.pdb --start 672 --output output.pdb
     python renumber.py input.mmcif --start 672 --chain A --output output.mmcif
+    python renumber.py predictions/ --start 672 --jobs 8
 """
 
 import argparse
+import glob
 import sys
 from pathlib import Path
+from typing import List
 
-from boltz2.logging_config import get_logger, setup_logging
+from boltz2.logging_config import configure_once, get_logger
 from boltz2.renumber import (
     detect_file_format,
     renumber_mmcif,
     renumber_pdb,
+    renumber_structures,
 )
 
 logger = get_logger("renumber_cli")
 
+STRUCTURE_SUFFIXES = (".mmcif", ".cif", ".pdb")
+
+
+def _expand_inputs(spec: str) -> List[Path]:
+    """Expand an input argument into a sorted list of structure files.
+
+    A directory yields every structure file directly inside it (skipping
+    previous ``*_renumbered`` outputs), a glob pattern yields its matches,
+    and anything else is treated as a single file path.
+    """
+    path = Path(spec)
+    if path.is_dir():
+        return sorted(
+            p for p in path.iterdir()
+            if p.suffix.lower() in STRUCTURE_SUFFIXES
+            and not p.stem.endswith("_renumbered")
+            and p.is_file()
+        )
+    if glob.has_magic(spec):
+        return sorted(Path(p) for p in glob.glob(spec) if Path(p).is_file())
+    return [path]
+
 
 def main():
     """Main entry point for the renumber CLI."""
@@ -44,9 +70,15 @@ Examples:
 
   # Specify output file
   python renumber.py input.mmcif --start 672 --output renumbered.mmcif
+
+  # Renumber every structure in a directory on 8 processes
+  python renumber.py predictions/ --start 672 --jobs 8 --output renumbered/
         """,
     )
-    parser.add_argument("input", type=Path, help="Input structure file (mmCIF or PDB)")
+    parser.add_argument(
+        "input",
+        help="Input structure file (mmCIF or PDB), directory, or glob pattern",
+    )
     parser.add_argument(
         "--start",
         "-s",
@@ -66,7 +98,15 @@ Examples:
         "-o",
         type=Path,
         default=None,
-        help="Output file path (default: input_renumbered.ext)",
+        help="Output file path, or output directory when renumbering "
+        "several files (default: input_renumbered.ext)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for multiple inputs (default: 1)",
     )
     parser.add_argument(
         "--format",
@@ -85,16 +125,24 @@ Examples:
 
     # Setup logging
     if args.verbose:
-        setup_logging(level="DEBUG")
+        configure_once(level="DEBUG")
+
+    inputs = _expand_inputs(args.input)
+    if not inputs:
+        logger.error("No structure files found for: %s", args.input)
+        return 1
+    if len(inputs) > 1 or Path(args.input).is_dir():
+        return _renumber_many(inputs, args)
 
+    args.input = inputs[0]
     if not args.input.exists():
-        logger.error(f"Input file not found: {args.input}")
+        logger.error("Input file not found: %s", args.input)
         return 1
 
     # Detect format
     if args.format == "auto":
         file_format = detect_file_format(args.input)
-        logger.debug(f"Auto-detected format: {file_format}")
+        logger.debug("Auto-detected format: %s", file_format)
     else:
         file_format = args.format
 
@@ -105,9 +153,9 @@ Examples:
         args.output = args.input.parent / f"{stem}_renumbered{suffix}"
 
     # Perform renumbering
-    logger.info(f"Renumbering {args.input} starting from residue {args.start}")
+    logger.info("Renumbering %s starting from residue %d", args.input, args.start)
     if args.chain:
-        logger.info(f"  Chain filter: {args.chain}")
+        logger.info("  Chain filter: %s", args.chain)
 
     if file_format == "mmcif":
         renumber_mmcif(args.input, args.start, args.output, args.chain)
@@ -117,5 +165,26 @@ Examples:
     return 0
 
 
+def _renumber_many(inputs: List[Path], args: argparse.Namespace) -> int:
+    """Renumber several files, in parallel when ``--jobs`` is above one."""
+    logger.info(
+        "Renumbering %d files starting from residue %d (%d jobs)",
+        len(inputs), args.start, args.jobs,
+    )
+    outputs = renumber_structures(
+        inputs,
+        args.start,
+        output_dir=args.output,
+        chain_id=args.chain,
+        file_format=args.format,
+        max_workers=args.jobs,
+    )
+
+    for output_path in outputs:
+        logger.debug("Saved %s", output_path)
+    logger.info("Renumbered %d files", len(outputs))
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
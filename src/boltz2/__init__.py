@@ -10,28 +10,67 @@ Example:
     >>> result = client.generate_protein_ligand("MKTAY...", "CCO")
 """
 
-from boltz2.client import Boltz2Client
-from boltz2.io import create_run_directory, save_json, save_mmcif
-from boltz2.logging_config import get_logger, setup_logging
-from boltz2.parser import extract_all_mmcifs, split_structure_file
-from boltz2.payload import (
-    build_payload,
-    build_protein_only_payload,
-    extract_metadata_name,
-    load_payload_from_yaml,
-)
-from boltz2.renumber import (
-    detect_file_format,
-    renumber_mmcif,
-    renumber_pdb,
-    renumber_structure,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from boltz2.async_client import AsyncBoltz2Client
+    from boltz2.cache import PredictionCache
+    from boltz2.client import Boltz2Client
+    from boltz2.io import create_run_directory, save_json, save_mmcif
+    from boltz2.logging_config import configure_once, get_logger, setup_logging
+    from boltz2.parser import extract_all_mmcifs, split_structure_file
+    from boltz2.payload import (
+        build_payload,
+        build_protein_only_payload,
+        extract_metadata_name,
+        load_payload_and_meta,
+        load_payload_from_yaml,
+    )
+    from boltz2.renumber import (
+        detect_file_format,
+        renumber_mmcif,
+        renumber_pdb,
+        renumber_structure,
+        renumber_structures,
+    )
+    from boltz2.yaml_cache import load_payload_from_yaml_cached
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, or a CLI that only needs one submodule, does not pull in the HTTP
+# client, YAML parser, and everything else up front.
+_LAZY_IMPORTS = {
+    "AsyncBoltz2Client": "boltz2.async_client",
+    "Boltz2Client": "boltz2.client",
+    "PredictionCache": "boltz2.cache",
+    "create_run_directory": "boltz2.io",
+    "save_json": "boltz2.io",
+    "save_mmcif": "boltz2.io",
+    "configure_once": "boltz2.logging_config",
+    "get_logger": "boltz2.logging_config",
+    "setup_logging": "boltz2.logging_config",
+    "extract_all_mmcifs": "boltz2.parser",
+    "split_structure_file": "boltz2.parser",
+    "build_payload": "boltz2.payload",
+    "build_protein_only_payload": "boltz2.payload",
+    "extract_metadata_name": "boltz2.payload",
+    "load_payload_and_meta": "boltz2.payload",
+    "load_payload_from_yaml": "boltz2.payload",
+    "detect_file_format": "boltz2.renumber",
+    "renumber_mmcif": "boltz2.renumber",
+    "renumber_pdb": "boltz2.renumber",
+    "renumber_structure": "boltz2.renumber",
+    "renumber_structures": "boltz2.renumber",
+    "load_payload_from_yaml_cached": "boltz2.yaml_cache",
+}
 
 __version__ = "0.1.0"
 
 __all__ = [
     # Client
     "Boltz2Client",
+    "AsyncBoltz2Client",
+    "PredictionCache",
     # Parsing
     "extract_all_mmcifs",
     "split_structure_file",
@@ -39,17 +78,35 @@ __all__ = [
     "build_payload",
     "build_protein_only_payload",
     "extract_metadata_name",
+    "load_payload_and_meta",
     "load_payload_from_yaml",
+    "load_payload_from_yaml_cached",
     # I/O
     "create_run_directory",
     "save_mmcif",
     "save_json",
     # Renumbering
     "renumber_structure",
+    "renumber_structures",
     "renumber_mmcif",
     "renumber_pdb",
     "detect_file_format",
     # Logging
     "setup_logging",
+    "configure_once",
     "get_logger",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
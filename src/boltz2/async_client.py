@@ -0,0 +1,245 @@
+"""Asyncio interface to the Boltz-2 API client.
+
+This module wraps Boltz2Client for use from an asyncio event loop. Each
+request runs in a worker thread over the client's pooled session, so many
+predictions can be awaited together while the loop stays responsive.
+
+Example:
+    >>> from boltz2.async_client import AsyncBoltz2Client, run
+    >>> async def main():
+    ...     async with AsyncBoltz2Client() as client:
+    ...         return await client.generate_many([
+    ...             {"sequence": "MKTAYIAKQRQISFVK...", "ligand_smiles": "CCO"},
+    ...             {"sequence": "MKTAYIAKQRQISFVK...", "ligand_smiles": "CCN"},
+    ...         ])
+    >>> results = run(main())
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, TypeVar
+
+from boltz2.client import POOL_MAXSIZE, Boltz2Client
+from boltz2.config import Boltz2Config
+from boltz2.logging_config import get_logger
+
+# uvloop is an optional, faster event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+logger = get_logger("async_client")
+
+T = TypeVar("T")
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel the tasks still pending on loop and wait for them to finish.
+
+    Mirrors the cleanup asyncio.run() performs before closing its loop, so
+    leftover tasks are not destroyed while pending.
+    """
+    to_cancel = asyncio.all_tasks(loop)
+    if not to_cancel:
+        return
+    for task in to_cancel:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*to_cancel, return_exceptions=True))
+    for task in to_cancel:
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            loop.call_exception_handler({
+                "message": "unhandled exception during boltz2.async_client.run() shutdown",
+                "exception": task.exception(),
+                "task": task,
+            })
+
+
+def run(main: Awaitable[T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    This is a drop-in replacement for asyncio.run(). Unlike installing
+    uvloop globally, it only affects the loop it creates.
+
+    Args:
+        main: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Example:
+        >>> results = run(client.generate_many(specs))
+    """
+    if uvloop is None:
+        return asyncio.run(main)
+
+    loop = uvloop.new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+class AsyncBoltz2Client:
+    """Asyncio client for the NVIDIA Boltz-2 structure prediction API.
+
+    Methods mirror Boltz2Client but are coroutines. At most
+    ``max_connections`` requests are in flight at once, matching the size
+    of the underlying connection pool.
+
+    Attributes:
+        client: The wrapped synchronous Boltz2Client.
+
+    Example:
+        >>> async with AsyncBoltz2Client(api_key="nvapi-xxx") as client:
+        ...     result = await client.generate_from_payload(payload)
+    """
+
+    def __init__(
+        self,
+        config: Optional[Boltz2Config] = None,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 600,
+        max_connections: int = POOL_MAXSIZE,
+    ):
+        """Initialize the async client.
+
+        Args:
+            config: Pre-built config object. Takes precedence over other args.
+            api_key: API key for authentication. If not provided, will be
+                loaded from BOLTZ2_API_KEY environment variable.
+            base_url: API endpoint URL. Defaults to NVIDIA's production API.
+            timeout: Request timeout in seconds. Defaults to 600.
+            max_connections: Maximum number of concurrent requests and pooled
+                connections. Defaults to 16.
+
+        Raises:
+            ValueError: If no API key is found in config, parameters, or
+                environment variables.
+        """
+        self.client = Boltz2Client(
+            config=config,
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_connections=max_connections,
+        )
+        self._max_connections = max(1, max_connections)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _call(self, func, *args, **kwargs) -> Any:
+        """Run a blocking client method in a worker thread."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            # A semaphore is bound to the loop it is first used on, so a
+            # client reused across asyncio.run() calls needs a fresh one
+            self._semaphore = asyncio.Semaphore(self._max_connections)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.client.close()
+
+    async def __aenter__(self) -> "AsyncBoltz2Client":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def predict(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a prediction request to the API.
+
+        Args:
+            payload: Complete request payload as a dictionary.
+
+        Returns:
+            Parsed JSON response from the API.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        return await self._call(self.client.predict, payload)
+
+    async def generate_from_payload(
+        self,
+        payload: Dict[str, Any],
+        *,
+        output_dir: Path = Path("structures"),
+        output_name: Optional[str] = None,
+        split_outputs: bool = False,
+        full_response: bool = True,
+    ) -> Dict[str, Any]:
+        """Generate a structure prediction from a pre-built payload.
+
+        See Boltz2Client.generate_from_payload for the arguments and the
+        returned dictionary.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        return await self._call(
+            self.client.generate_from_payload,
+            payload,
+            output_dir=output_dir,
+            output_name=output_name,
+            split_outputs=split_outputs,
+            full_response=full_response,
+        )
+
+    async def generate_protein_ligand(self, sequence: str, ligand_smiles: str, **kwargs) -> Dict[str, Any]:
+        """Generate a protein+ligand structure prediction.
+
+        See Boltz2Client.generate_protein_ligand for the keyword arguments
+        and the returned dictionary.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        return await self._call(self.client.generate_protein_ligand, sequence, ligand_smiles, **kwargs)
+
+    async def generate_protein(self, sequence: str, **kwargs) -> Dict[str, Any]:
+        """Generate a protein-only structure prediction.
+
+        See Boltz2Client.generate_protein for the keyword arguments and the
+        returned dictionary.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        return await self._call(self.client.generate_protein, sequence, **kwargs)
+
+    async def generate_many(
+        self, specs: Sequence[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Any]:
+        """Run several protein+ligand predictions concurrently.
+
+        Args:
+            specs: Keyword arguments for generate_protein_ligand, one
+                dictionary per prediction.
+            return_exceptions: If True, a failed prediction's exception is
+                returned in its slot instead of being raised.
+
+        Returns:
+            Result dictionaries in the same order as specs.
+
+        Raises:
+            RuntimeError: If a prediction fails and return_exceptions is False.
+        """
+        logger.debug("Running %d predictions concurrently", len(specs))
+        return await asyncio.gather(
+            *(self.generate_protein_ligand(**spec) for spec in specs),
+            return_exceptions=return_exceptions,
+        )
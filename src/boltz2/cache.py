@@ -0,0 +1,124 @@
+"""Content-addressed on-disk cache of prediction responses.
+
+Notebook iteration and parameter sweeps often resubmit exactly the same
+payload. This module stores each raw API response under a hash of the
+endpoint and the canonical payload, so a repeated request can be answered
+from disk without a network round trip or server-side inference.
+
+Diffusion sampling is stochastic, so the cache is opt-in: a cached response
+replays the earlier samples rather than drawing new ones.
+
+Example:
+    >>> from boltz2.cache import PredictionCache
+    >>> cache = PredictionCache(Path(".boltz2_cache"))
+    >>> hit = cache.get(base_url, payload)
+"""
+
+import hashlib
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from boltz2.io import atomic_write
+from boltz2.logging_config import get_logger
+
+logger = get_logger("cache")
+
+
+class PredictionCache:
+    """On-disk cache of raw prediction responses keyed by payload.
+
+    Attributes:
+        root: Directory holding one ``<digest>.json`` file per entry.
+        ttl: Maximum entry age in seconds, or None for no expiry.
+
+    Example:
+        >>> cache = PredictionCache(Path(".boltz2_cache"), ttl=86400)
+        >>> cache.put_file(base_url, payload, Path("out/run.json"))
+    """
+
+    def __init__(self, root: Path, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory. Created on first write.
+            ttl: Maximum entry age in seconds. Older entries are treated as
+                misses. Defaults to None (entries never expire).
+        """
+        self.root = Path(root)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(base_url: str, payload: Dict[str, Any]) -> str:
+        """Hash an endpoint and payload into a cache key.
+
+        The payload is serialized with sorted keys and no whitespace, so
+        dictionaries that differ only in key order share an entry.
+
+        Args:
+            base_url: API endpoint the payload is sent to.
+            payload: Request payload.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        raw = f"{base_url}\n{canonical}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=20).hexdigest()
+
+    def get(self, base_url: str, payload: Dict[str, Any]) -> Optional[Path]:
+        """Look up a cached response.
+
+        Args:
+            base_url: API endpoint the payload is sent to.
+            payload: Request payload.
+
+        Returns:
+            Path to the cached response file, or None on a miss.
+        """
+        path = self.root / f"{self.key(base_url, payload)}.json"
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        if self.ttl is not None and time.time() - st.st_mtime > self.ttl:
+            logger.debug("Prediction cache entry expired: %s", path.name)
+            return None
+        logger.debug("Prediction cache hit: %s", path.name)
+        return path
+
+    def put_bytes(self, base_url: str, payload: Dict[str, Any], data: bytes) -> None:
+        """Store a raw response body.
+
+        Args:
+            base_url: API endpoint the payload was sent to.
+            payload: Request payload.
+            data: Raw JSON response body.
+        """
+        self._write(base_url, payload, lambda f: f.write(data))
+
+    def put_file(self, base_url: str, payload: Dict[str, Any], source: Path) -> None:
+        """Store a response that has already been written to disk.
+
+        Args:
+            base_url: API endpoint the payload was sent to.
+            payload: Request payload.
+            source: Path to the raw JSON response file.
+        """
+
+        def copy(f):
+            with open(source, "rb") as src:
+                shutil.copyfileobj(src, f)
+
+        self._write(base_url, payload, copy)
+
+    def _write(self, base_url: str, payload: Dict[str, Any], writer) -> None:
+        """Atomically write an entry; failures are logged and ignored."""
+        target = self.root / f"{self.key(base_url, payload)}.json"
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            atomic_write(target, writer)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write prediction cache entry: %s", e)
@@ -1,34 +1,45 @@
 """CLI entry points for Boltz-2 package.
 
 This module provides command-line interfaces for the Boltz-2 package:
+    - boltz2: Single dispatcher for the subcommands below
     - boltz2-generate: Generate structure predictions from YAML config
     - boltz2-split: Split output files into separate artifacts
     - boltz2-batch: Batch process multiple YAML inputs
+    - boltz2 renumber: Restore biological residue numbering
 
 Example:
     $ boltz2-generate inputs/my_protein.yaml -o structures
     $ boltz2-split structures/my_prediction/my_prediction.mmcif
     $ boltz2-batch --inputs inputs --output structures
+    $ boltz2 renumber structure.mmcif --start 672
 """
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
-from boltz2 import Boltz2Client, split_structure_file
-from boltz2.logging_config import get_logger, setup_logging
-from boltz2.payload import extract_metadata_name, load_payload_from_yaml
+from boltz2.logging_config import configure_once, get_logger
+
+# The client, parser and YAML modules pull in requests and PyYAML, so each
+# entry point imports only what it needs after its arguments are parsed
 
 logger = get_logger("cli")
 
 
-def generate_main():
+def generate_main(argv: Optional[List[str]] = None):
     """CLI entry point for generating protein+ligand structures.
 
     This function is the main entry point for the boltz2-generate command.
     It parses command-line arguments, loads the YAML configuration, and
     submits a prediction request to the Boltz-2 API.
+
+    Args:
+        argv: Argument list to parse. Defaults to sys.argv[1:].
     """
     parser = argparse.ArgumentParser(
         description="Generate structure prediction using Boltz-2 API"
@@ -52,6 +63,27 @@ def generate_main():
         action="store_true",
         help="Disable automatic splitting of outputs into separate artifact files",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Re-indent the saved JSON response for readability "
+        "(default: keep the server's bytes as-is)",
+    )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write split JSON artifacts without indentation",
+    )
+    parser.add_argument(
+        "--binary-matrices",
+        action="store_true",
+        help="Write score matrices as float32 arrays to a .npz file (requires numpy)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse the YAML input without reading or writing the on-disk YAML cache",
+    )
     parser.add_argument(
         "--api-key",
         help="API key (overrides .env file)",
@@ -68,11 +100,14 @@ def generate_main():
         help="Enable verbose (debug) logging",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    from boltz2.client import Boltz2Client
+    from boltz2.yaml_cache import load_payload_from_yaml_cached
 
     # Configure logging based on verbosity
     if args.verbose:
-        setup_logging(level="DEBUG")
+        configure_once(level="DEBUG")
 
     # Validate input file
     if not args.input_yaml.exists():
@@ -81,14 +116,21 @@ def generate_main():
 
     # Initialize client
     try:
-        client = Boltz2Client(api_key=args.api_key, timeout=args.timeout)
+        client = Boltz2Client(
+            api_key=args.api_key,
+            timeout=args.timeout,
+            compact_json=args.compact_json,
+            binary_matrices=args.binary_matrices,
+        )
     except (ValueError, RuntimeError) as e:
         logger.error("Failed to initialize client: %s", e)
         sys.exit(1)
 
     # Load payload from YAML
     try:
-        payload = load_payload_from_yaml(args.input_yaml)
+        payload, meta_name = load_payload_from_yaml_cached(
+            args.input_yaml, use_cache=not args.no_cache
+        )
     except Exception as e:
         logger.error("Error loading YAML: %s", e)
         sys.exit(1)
@@ -100,7 +142,6 @@ def generate_main():
     if args.name:
         output_name = args.name
     else:
-        meta_name = extract_metadata_name(args.input_yaml)
         output_name = meta_name or args.input_yaml.stem
         if meta_name:
             logger.debug("Using metadata name from YAML: %s", meta_name)
@@ -111,16 +152,21 @@ def generate_main():
     logger.info("  Ligands: %d", len(payload.get('ligands', [])))
 
     try:
-        result = client.generate_from_payload(
-            payload=payload,
-            output_dir=Path(args.output_dir),
-            output_name=output_name,
-            split_outputs=not args.no_split,
-        )
+        with client:
+            result = client.generate_from_payload(
+                payload=payload,
+                output_dir=Path(args.output_dir),
+                output_name=output_name,
+                split_outputs=not args.no_split,
+                full_response=False,
+            )
     except RuntimeError as e:
         logger.error("Generation failed: %s", e)
         sys.exit(1)
 
+    if args.pretty:
+        _prettify_json(result['json'])
+
     logger.info("Generation complete!")
     logger.info("  Output directory: %s", result['dir'])
     mmcif_paths = result.get('mmcifs', [result['mmcif']])
@@ -141,11 +187,14 @@ def generate_main():
                 logger.info("  %s: %s", key, value)
 
 
-def split_main():
+def split_main(argv: Optional[List[str]] = None):
     """CLI entry point for splitting Boltz-2 output files.
 
     This function is the main entry point for the boltz2-split command.
     It splits a Boltz-2 output file into separate artifact files.
+
+    Args:
+        argv: Argument list to parse. Defaults to sys.argv[1:].
     """
     parser = argparse.ArgumentParser(
         description="Split Boltz-2 output file into separate artifacts"
@@ -155,17 +204,29 @@ def split_main():
         type=Path,
         help="Path to mmCIF or JSON file from Boltz-2 API",
     )
+    parser.add_argument(
+        "--compact-json",
+        action="store_true",
+        help="Write JSON artifacts without indentation",
+    )
+    parser.add_argument(
+        "--binary-matrices",
+        action="store_true",
+        help="Write score matrices as float32 arrays to a .npz file (requires numpy)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
         help="Enable verbose (debug) logging",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    from boltz2.parser import split_structure_file
 
     # Configure logging based on verbosity
     if args.verbose:
-        setup_logging(level="DEBUG")
+        configure_once(level="DEBUG")
 
     if not args.input_file.exists():
         logger.error("File not found: %s", args.input_file)
@@ -174,7 +235,11 @@ def split_main():
     logger.info("Splitting: %s", args.input_file)
 
     try:
-        artifacts = split_structure_file(args.input_file)
+        artifacts = split_structure_file(
+            args.input_file,
+            compact_json=args.compact_json,
+            binary_matrices=args.binary_matrices,
+        )
     except RuntimeError as e:
         logger.error("Split failed: %s", e)
         sys.exit(1)
@@ -184,7 +249,40 @@ def split_main():
         logger.info("  %s: %s", key, path)
 
 
-def batch_main():
+def _prettify_json(json_path: Path) -> None:
+    """Rewrite a saved JSON response with two-space indentation.
+
+    Args:
+        json_path: Path to the raw JSON response file.
+    """
+    from boltz2.io import load_json, save_json
+
+    save_json(load_json(json_path), json_path, indent=2)
+
+
+def _load_yaml(
+    yaml_path: Path, use_cache: bool = True
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Exception]]:
+    """Load a YAML input for the batch preflight, capturing any error.
+
+    Args:
+        yaml_path: Path to the YAML input file.
+        use_cache: Whether to use the on-disk YAML cache.
+
+    Returns:
+        Tuple of (payload, meta_name, error). On failure payload and
+        meta_name are None and error holds the exception.
+    """
+    from boltz2.yaml_cache import load_payload_from_yaml_cached
+
+    try:
+        payload, meta_name = load_payload_from_yaml_cached(yaml_path, use_cache=use_cache)
+    except Exception as e:
+        return None, None, e
+    return payload, meta_name, None
+
+
+def batch_main(argv: Optional[List[str]] = None):
     """CLI entry point to batch-run all YAML inputs under a directory.
 
     This function is the main entry point for the boltz2-batch command.
@@ -193,49 +291,172 @@ def batch_main():
 
     Usage:
         boltz2-batch --inputs inputs --output structures [--no-split] [--api-key KEY]
+            [--concurrency N] [--pretty] [--compact-json] [--binary-matrices] [--no-cache]
+
+    Args:
+        argv: Argument list to parse. Defaults to sys.argv[1:].
     """
     parser = argparse.ArgumentParser(description="Batch-run Boltz-2 YAML inputs")
     parser.add_argument("--inputs", type=Path, default=Path("inputs"), help="Inputs root directory (default: inputs)")
     parser.add_argument("--output", type=Path, default=Path("structures"), help="Output root directory (default: structures)")
     parser.add_argument("--no-split", action="store_true", help="Disable automatic splitting of outputs into artifacts")
+    parser.add_argument("--pretty", action="store_true", help="Re-indent saved JSON responses for readability")
+    parser.add_argument("--compact-json", action="store_true", help="Write split JSON artifacts without indentation")
+    parser.add_argument("--binary-matrices", action="store_true", help="Write score matrices to a .npz file (requires numpy)")
+    parser.add_argument("--no-cache", action="store_true", help="Parse YAML inputs without the on-disk YAML cache")
     parser.add_argument("--api-key", help="API key (overrides .env file)")
     parser.add_argument("--timeout", type=int, default=600, help="Request timeout in seconds")
+    parser.add_argument("--concurrency", "--workers", dest="concurrency", type=int, default=4, help="Number of predictions to run concurrently (default: 4)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (debug) logging")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    from boltz2.client import Boltz2Client
+    from boltz2.io import find_yaml_files
 
     # Configure logging based on verbosity
     if args.verbose:
-        setup_logging(level="DEBUG")
+        configure_once(level="DEBUG")
 
     inputs_dir = args.inputs
     if not inputs_dir.exists():
         logger.error("No inputs directory found: %s", inputs_dir)
         sys.exit(1)
 
-    yaml_files = sorted(inputs_dir.rglob("*.yaml"))
+    yaml_files = find_yaml_files(inputs_dir)
     if not yaml_files:
         logger.warning("No YAML files found under %s", inputs_dir)
         sys.exit(0)
 
+    # Load and validate every input up front so a broken YAML is reported
+    # before any API time is spent on the rest of the batch
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        loaded = list(executor.map(partial(_load_yaml, use_cache=not args.no_cache), yaml_files))
+
+    jobs = []
+    for yf, (payload, meta_name, error) in zip(yaml_files, loaded):
+        if error is not None:
+            logger.error("Error loading YAML %s: %s", yf, error)
+            continue
+        # Use metadata name from YAML if available, otherwise use filename
+        if meta_name:
+            logger.debug("Using metadata name from YAML for %s: %s", yf, meta_name)
+        jobs.append((yf, payload, meta_name or yf.stem))
+
+    if not jobs:
+        logger.error("No valid YAML inputs under %s", inputs_dir)
+        sys.exit(1)
+
+    # Predictions are network-bound, so worker threads sharing the client's
+    # pooled session keep several requests in flight at once. The pool holds
+    # one keep-alive connection per worker so none is dropped between calls.
+    workers = max(1, args.concurrency)
+
     # Initialize client
     try:
-        client = Boltz2Client(api_key=args.api_key, timeout=args.timeout)
+        client = Boltz2Client(
+            api_key=args.api_key,
+            timeout=args.timeout,
+            max_connections=workers,
+            compact_json=args.compact_json,
+            binary_matrices=args.binary_matrices,
+        )
     except (ValueError, RuntimeError) as e:
         logger.error("Error initializing client: %s", e)
         sys.exit(1)
 
-    for yf in yaml_files:
-        try:
-            logger.info("Running: %s", yf)
-
-            payload = load_payload_from_yaml(yf)
-            # Use metadata name from YAML if available, otherwise use filename
-            meta_name = extract_metadata_name(yf)
-            output_name = meta_name or yf.stem
-            if meta_name:
-                logger.debug("Using metadata name from YAML: %s", meta_name)
-            result = client.generate_from_payload(payload, output_dir=args.output, output_name=output_name, split_outputs=not args.no_split)
+    logger.info("Running %d predictions, %d at a time", len(jobs), workers)
+    with client:
+        results = client.generate_from_payloads(
+            [payload for _, payload, _ in jobs],
+            output_dir=args.output,
+            output_names=[output_name for _, _, output_name in jobs],
+            split_outputs=not args.no_split,
+            full_response=False,
+            max_workers=workers,
+        )
+
+    for (yf, _, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            logger.error("Error running %s: %s", yf, result)
+        else:
+            if args.pretty:
+                _prettify_json(result['json'])
             logger.info("Finished: %s -> %s", yf, result['dir'])
-        except Exception as e:
-            logger.error("Error running %s: %s", yf, e)
+
+
+def renumber_main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point for renumbering residues in structure files.
+
+    Boltz-2 always numbers residues from 1; this restores the biological
+    numbering in an mmCIF or PDB file.
+
+    Args:
+        argv: Argument list to parse. Defaults to sys.argv[1:].
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Renumber residues in Boltz-2 output structure files"
+    )
+    parser.add_argument("input", type=Path, help="Input structure file (mmCIF or PDB)")
+    parser.add_argument("-s", "--start", type=int, required=True, help="Starting residue number (the number that residue 1 should become)")
+    parser.add_argument("-c", "--chain", default=None, help="Chain ID to renumber (default: all chains)")
+    parser.add_argument("-o", "--output", type=Path, default=None, help="Output file path (default: input_renumbered.ext)")
+    parser.add_argument("-f", "--format", choices=["mmcif", "pdb", "auto"], default="auto", help="File format (default: auto-detect)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose (debug) logging")
+
+    args = parser.parse_args(argv)
+
+    from boltz2.renumber import renumber_structure
+
+    # Configure logging based on verbosity
+    if args.verbose:
+        configure_once(level="DEBUG")
+
+    if not args.input.exists():
+        logger.error("Input file not found: %s", args.input)
+        return 1
+
+    logger.info("Renumbering %s starting from residue %d", args.input, args.start)
+    if args.chain:
+        logger.info("  Chain filter: %s", args.chain)
+
+    renumber_structure(
+        args.input,
+        args.start,
+        output_path=args.output,
+        chain_id=args.chain,
+        file_format=args.format,
+    )
+    return 0
+
+
+# Subcommands of the `boltz2` dispatcher
+COMMANDS = {
+    "generate": generate_main,
+    "split": split_main,
+    "batch": batch_main,
+    "renumber": renumber_main,
+}
+
+
+def main(argv: Optional[List[str]] = None):
+    """CLI entry point for the `boltz2` command.
+
+    Dispatches `boltz2 generate|split|batch|renumber ...` to the matching
+    entry point, passing the remaining arguments through unchanged.
+
+    Args:
+        argv: Argument list to parse. Defaults to sys.argv[1:].
+    """
+    parser = argparse.ArgumentParser(
+        prog="boltz2",
+        description="Boltz-2 structure prediction toolkit",
+    )
+    parser.add_argument("command", choices=list(COMMANDS), help="Subcommand to run")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the subcommand")
+
+    args = parser.parse_args(argv)
+    sys.exit(COMMANDS[args.command](args.args))
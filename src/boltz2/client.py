@@ -13,19 +13,58 @@ Example:
     >>> print(result['mmcif'])
 """
 
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from boltz2.cache import PredictionCache
 from boltz2.config import Boltz2Config, load_config
-from boltz2.io import create_run_directory, save_json, save_mmcif
+from boltz2.io import (
+    atomic_write,
+    create_run_directory,
+    decode_json,
+    encode_json,
+    load_json,
+    bundle_output_path,
+    mmcif_output_paths,
+    write_text_bundle,
+    write_text_files,
+)
 from boltz2.logging_config import get_logger
-from boltz2.parser import extract_all_mmcifs, split_structure_file
+from boltz2.parser import build_split_artifacts, extract_all_mmcifs, load_mmcifs_from_json
 from boltz2.payload import build_payload, build_protein_only_payload
 
 logger = get_logger("client")
 
+# Connection pool sizing and retry policy for the shared HTTP session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Chunk size used when streaming response bodies to disk
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class _PredictionRetry(Retry):
+    """Retry policy that never re-submits a prediction on an ambiguous failure.
+
+    GET requests are retried on read errors and on every status in
+    ``RETRY_STATUS_CODES``. POST requests are retried only on connection
+    errors (the request never reached the server) and on 429, where the
+    server has explicitly refused the job.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return bool(self.total) and status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
 
 class Boltz2Client:
     """Client for interacting with the NVIDIA Boltz-2 API.
@@ -34,6 +73,11 @@ class Boltz2Client:
     requests to the Boltz-2 API and handling the responses. It supports
     protein-only predictions as well as protein-ligand complex predictions.
 
+    A single HTTP session is kept for the lifetime of the client so that
+    consecutive requests to the same host reuse the pooled TCP/TLS
+    connection. Call close() when done, or use the client as a context
+    manager.
+
     Attributes:
         config: The Boltz2Config instance containing API settings.
 
@@ -49,6 +93,11 @@ class Boltz2Client:
         ...     sequence="MKTAYIAKQRQISFVK...",
         ...     ligand_smiles="CCO"
         ... )
+        >>>
+        >>> # Reuse one connection across many predictions
+        >>> with Boltz2Client() as client:
+        ...     for payload in payloads:
+        ...         client.generate_from_payload(payload)
     """
 
     def __init__(
@@ -57,6 +106,12 @@ class Boltz2Client:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = 600,
+        max_connections: int = POOL_MAXSIZE,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: Optional[float] = None,
+        bundle_outputs: bool = False,
+        compact_json: bool = False,
+        binary_matrices: bool = False,
     ):
         """Initialize the Boltz-2 client.
 
@@ -66,6 +121,27 @@ class Boltz2Client:
                 loaded from BOLTZ2_API_KEY environment variable.
             base_url: API endpoint URL. Defaults to NVIDIA's production API.
             timeout: Request timeout in seconds. Defaults to 600.
+            max_connections: Maximum number of pooled keep-alive connections
+                to the API host. Set this to at least the number of threads
+                sharing the client so no connection is discarded after use.
+                Defaults to 16.
+            cache_dir: Directory for caching raw responses by payload. When
+                set, repeating an identical request replays the cached
+                response (including its diffusion samples) instead of
+                calling the API. Defaults to None (no caching).
+            cache_ttl: Maximum age in seconds of cached responses. Defaults
+                to None (entries never expire).
+            bundle_outputs: If True, each run's mmCIF files and split
+                artifacts are written as members of a single
+                ``<run_name>.mmcif.tar`` archive instead of separate files.
+                Result paths then give where each member lands when the
+                archive is extracted into the run directory. Defaults to
+                False.
+            compact_json: If True, split JSON artifacts are written without
+                indentation. Defaults to False.
+            binary_matrices: If True, split score matrices are written as
+                float32 arrays to ``<name>_matrices.npz``. Requires numpy.
+                Defaults to False.
 
         Raises:
             ValueError: If no API key is found in config, parameters, or
@@ -78,9 +154,91 @@ class Boltz2Client:
             self.config = config
         else:
             self.config = load_config(api_key=api_key, base_url=base_url, timeout=timeout)
+        self._session = self._create_session(max_connections)
+        self._session.headers.update(self.config.headers)
+        self._cache = PredictionCache(cache_dir, ttl=cache_ttl) if cache_dir else None
+        self.bundle_outputs = bundle_outputs
+        self.compact_json = compact_json
+        self.binary_matrices = binary_matrices
         logger.debug("Boltz2Client initialized with base_url=%s", self.config.base_url)
 
-    def predict(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _create_session(max_connections: int = POOL_MAXSIZE) -> requests.Session:
+        """Create the pooled HTTP session used for all API requests.
+
+        Rate limiting and transient gateway errors are retried with
+        exponential backoff, honouring any Retry-After header. A prediction
+        POST starts a GPU job of up to 600 s, and retrying it after a read
+        error or a 5xx would submit that job again, so POST is only retried
+        on connection errors and on 429 (see ``_PredictionRetry``).
+
+        Args:
+            max_connections: Maximum number of connections kept per host.
+
+        Returns:
+            A configured requests.Session instance.
+        """
+        retry = _PredictionRetry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=max(1, max_connections),
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "Boltz2Client":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _check_response(response: requests.Response) -> None:
+        """Raise a RuntimeError describing a failed API response.
+
+        Args:
+            response: Response returned by the API.
+
+        Raises:
+            RuntimeError: If the response status is not successful.
+        """
+        if response.ok:
+            return
+        try:
+            err = response.json()
+        except Exception:
+            err = response.text
+        logger.error("API request failed: %s %s", response.status_code, err)
+        raise RuntimeError(f"Prediction request failed: {response.status_code} {err}")
+
+    def _cache_store(self, payload: Dict[str, Any], json_path: Path) -> None:
+        """Store a downloaded response file that has already parsed successfully."""
+        if self._cache is not None:
+            self._cache.put_file(self.config.base_url, payload, json_path)
+
+    def _cache_lookup(self, payload: Dict[str, Any], no_cache: bool) -> Optional[Path]:
+        """Return the cached response file for payload, if caching applies."""
+        if self._cache is None or no_cache:
+            return None
+        cached = self._cache.get(self.config.base_url, payload)
+        if cached is not None:
+            logger.info("Using cached prediction response: %s", cached)
+        return cached
+
+    def predict(self, payload: Dict[str, Any], no_cache: bool = False) -> Dict[str, Any]:
         """Send a prediction request to the API.
 
         This is the low-level method for submitting requests. For most use
@@ -90,6 +248,7 @@ class Boltz2Client:
             payload: Complete request payload as a dictionary. Should include
                 'polymers' and optionally 'ligands' keys, plus prediction
                 parameters.
+            no_cache: If True, bypass the response cache for this request.
 
         Returns:
             Parsed JSON response from the API containing structure predictions
@@ -103,24 +262,262 @@ class Boltz2Client:
             >>> payload = {"polymers": [...], "sampling_steps": 50}
             >>> response = client.predict(payload)
         """
+        cached = self._cache_lookup(payload, no_cache)
+        if cached is not None:
+            return load_json(cached)
+
         logger.debug("Sending prediction request to %s", self.config.base_url)
-        response = requests.post(
+        response = self._session.post(
             self.config.base_url,
-            json=payload,
-            headers=self.config.headers,
+            data=encode_json(payload, indent=None),
             timeout=self.config.timeout,
         )
 
-        if not response.ok:
-            try:
-                err = response.json()
-            except Exception:
-                err = response.text
-            logger.error("API request failed: %s %s", response.status_code, err)
-            raise RuntimeError(f"Prediction request failed: {response.status_code} {err}")
+        self._check_response(response)
 
         logger.debug("Received successful response from API")
-        return response.json()
+        # Decode before caching so a malformed body is never replayed
+        response_data = decode_json(response.content)
+        if self._cache is not None:
+            self._cache.put_bytes(self.config.base_url, payload, response.content)
+        return response_data
+
+    def predict_to_file(
+        self, payload: Dict[str, Any], json_path: Path, no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """Send a prediction request and stream the raw response to disk.
+
+        The response body is copied to json_path in chunks as it arrives and
+        then decoded once. Unlike predict() followed by save_json(), the
+        embedded mmCIF text is never re-serialized, and the saved file is the
+        server's response byte for byte.
+
+        Args:
+            payload: Complete request payload as a dictionary.
+            json_path: Path to write the raw JSON response to.
+            no_cache: If True, bypass the response cache for this request.
+
+        Returns:
+            Parsed JSON response from the API.
+
+        Raises:
+            RuntimeError: If the API request fails. Nothing is written to
+                json_path in that case.
+
+        Example:
+            >>> response = client.predict_to_file(payload, Path("out/run.json"))
+        """
+        fetched = self._download(payload, Path(json_path), no_cache)
+        response_data = load_json(json_path)
+        if fetched:
+            self._cache_store(payload, json_path)
+        return response_data
+
+    def _download(self, payload: Dict[str, Any], json_path: Path, no_cache: bool = False) -> bool:
+        """Stream the raw response for payload to json_path, or copy it from the cache.
+
+        The downloaded file is not cached here; callers store it with
+        _cache_store once it has parsed, so a truncated or malformed body
+        is never replayed.
+
+        Returns:
+            True if the response was fetched from the API, False if it was
+            copied from the cache.
+        """
+        cached = self._cache_lookup(payload, no_cache)
+        if cached is not None:
+            shutil.copyfile(cached, json_path)
+            return False
+
+        logger.debug("Sending prediction request to %s", self.config.base_url)
+        with self._session.post(
+            self.config.base_url,
+            data=encode_json(payload, indent=None),
+            timeout=self.config.timeout,
+            stream=True,
+        ) as response:
+            self._check_response(response)
+            size = 0
+
+            def stream(f):
+                nonlocal size
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+
+            # A dropped connection mid-stream must not leave a partial file
+            atomic_write(json_path, stream)
+
+            logger.debug(
+                "Received successful response from API -> %s (%d bytes, "
+                "content-encoding=%s, content-length=%s)",
+                json_path,
+                size,
+                response.headers.get("content-encoding", "identity"),
+                response.headers.get("content-length", "unknown"),
+            )
+        return True
+
+    def _fetch_response(
+        self,
+        payload: Dict[str, Any],
+        json_path: Path,
+        full_response: bool,
+        split_outputs: bool,
+    ) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+        """Save the response for payload and return it with its mmCIF texts.
+
+        Unless the full response is needed (full_response, or split outputs
+        that derive artifacts from it), only the structures are read back
+        from the saved file, so large score matrices are never materialized.
+
+        Returns:
+            Tuple of (response_data, mmcif_texts); response_data is None
+            when only the structures were read.
+        """
+        if full_response or split_outputs:
+            response_data = self.predict_to_file(payload, json_path)
+            return response_data, extract_all_mmcifs(response_data)
+        fetched = self._download(payload, json_path)
+        # ijson walks the whole document, so a truncated body fails here
+        # before it can reach the cache
+        mmcif_texts = load_mmcifs_from_json(json_path)
+        if fetched:
+            self._cache_store(payload, json_path)
+        return None, mmcif_texts
+
+    def _save_outputs(
+        self,
+        run_dir: Path,
+        run_name: str,
+        mmcif_texts: List[str],
+        response_data: Optional[Dict[str, Any]],
+        split_outputs: bool,
+    ) -> Tuple[List[Path], Optional[Dict[str, Any]]]:
+        """Write a run's mmCIF files and optional split artifacts in one batch.
+
+        Artifacts are derived from the in-memory response rather than by
+        re-reading the files just written, and every output file is handed
+        to write_text_files together so the writes overlap. With
+        bundle_outputs set, the same files are stored as members of a single
+        tar archive instead.
+
+        Args:
+            run_dir: Run output directory.
+            run_name: Base name for the output files.
+            mmcif_texts: mmCIF structures from the response, in sample order.
+            response_data: Parsed API response, used for JSON artifacts.
+            split_outputs: Whether to produce split artifacts.
+
+        Returns:
+            Tuple of (mmcif_paths, artifacts). artifacts is None unless
+            split_outputs is set and the response contained structures; with
+            several samples it is keyed by ``sample_<n>``.
+        """
+        mmcif_paths = mmcif_output_paths(run_dir, run_name, len(mmcif_texts))
+        files = list(zip(mmcif_paths, mmcif_texts or [""]))
+
+        artifacts: Optional[Dict[str, Any]] = None
+        if split_outputs and mmcif_texts:
+            artifacts = {}
+            # Only a single-sample run has a JSON file named after its mmCIF,
+            # so only then do the JSON-derived artifacts apply
+            full_json = response_data if len(mmcif_paths) == 1 else None
+            for i, (mmcif_path, mmcif_text) in enumerate(zip(mmcif_paths, mmcif_texts), start=1):
+                pending = build_split_artifacts(
+                    mmcif_text,
+                    mmcif_path,
+                    full_json,
+                    compact_json=self.compact_json,
+                    binary_matrices=self.binary_matrices,
+                )
+                files.extend((path, content) for _, path, content in pending)
+                sample = {"mmcif": mmcif_path}
+                sample.update((key, path) for key, path, _ in pending)
+                if len(mmcif_paths) == 1:
+                    artifacts.update(sample)
+                else:
+                    artifacts[f"sample_{i}"] = sample
+
+        if self.bundle_outputs:
+            write_text_bundle(
+                bundle_output_path(run_dir, run_name),
+                [(path.name, content) for path, content in files],
+            )
+        else:
+            write_text_files(files, max_workers=8)
+        return mmcif_paths, artifacts
+
+    def _run_and_save(
+        self,
+        payload: Dict[str, Any],
+        *,
+        output_dir: Path,
+        output_name: Optional[str],
+        prefix: str,
+        split_outputs: bool,
+        full_response: bool,
+    ) -> Dict[str, Any]:
+        """Submit a payload, save its outputs, and build the result dictionary.
+
+        Shared by the generate_* methods once they have a payload.
+
+        Args:
+            payload: Complete API payload dictionary.
+            output_dir: Base directory for output files.
+            output_name: Custom name for output files, or None for a
+                timestamped name.
+            prefix: Prefix of the timestamped name.
+            split_outputs: Whether to produce split artifacts.
+            full_response: Whether to keep the parsed response.
+
+        Returns:
+            The result dictionary described by the generate_* methods.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        # Create output directory
+        run_dir, run_name = create_run_directory(
+            base_dir=output_dir,
+            output_name=output_name,
+            prefix=prefix,
+        )
+
+        logger.info("Sending predict request to: %s", self.config.base_url)
+
+        # Send request, streaming the raw JSON response to disk
+        json_path = run_dir / f"{run_name}.json"
+        response_data, mmcif_texts = self._fetch_response(
+            payload, json_path, full_response, split_outputs
+        )
+
+        # Save all mmCIF structures, plus split artifacts
+        mmcif_paths, artifacts = self._save_outputs(
+            run_dir, run_name, mmcif_texts, response_data, split_outputs
+        )
+
+        logger.info("Saved outputs -> dir: %s, mmCIF files: %d, JSON: %s",
+                    run_dir, len(mmcif_paths), json_path.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            for p in mmcif_paths:
+                logger.debug("  - %s", p.name)
+
+        result = {
+            "mmcif": mmcif_paths[0],  # First structure for backwards compatibility
+            "mmcifs": mmcif_paths,    # All structures
+            "json": json_path,
+            "dir": run_dir,
+            "name": run_name,
+            "response": response_data,
+        }
+
+        if artifacts is not None:
+            result["artifacts"] = artifacts
+        if self.bundle_outputs:
+            result["bundle"] = bundle_output_path(run_dir, run_name)
+
+        return result
 
     def generate_protein_ligand(
         self,
@@ -131,6 +528,7 @@ class Boltz2Client:
         output_name: Optional[str] = None,
         payload_overrides: Optional[Dict[str, Any]] = None,
         split_outputs: bool = False,
+        full_response: bool = True,
     ) -> Dict[str, Any]:
         """Generate a protein+ligand structure prediction.
 
@@ -148,6 +546,10 @@ class Boltz2Client:
                 such as 'sampling_steps' or 'diffusion_samples'.
             split_outputs: If True, automatically split outputs into separate
                 artifact files (protein-only mmCIF, confidence scores, etc.).
+            full_response: If False, the parsed response is not kept: only
+                the structures are read back from the saved JSON, and
+                'response' in the result is None. Ignored when splitting
+                outputs. Defaults to True.
 
         Returns:
             Dictionary containing:
@@ -156,7 +558,9 @@ class Boltz2Client:
                 - json: Path to JSON file containing raw API response
                 - dir: Path to the output directory
                 - name: The run name used for file naming
-                - response: Raw API response dictionary
+                - response: Raw API response dictionary (None if
+                  full_response=False)
+                - bundle: Path to the tar archive (only if bundle_outputs)
                 - artifacts: Split artifact paths (only if split_outputs=True)
 
         Raises:
@@ -178,70 +582,15 @@ class Boltz2Client:
             overrides=payload_overrides,
         )
 
-        # Create output directory
-        run_dir, run_name = create_run_directory(
-            base_dir=output_dir,
+        return self._run_and_save(
+            payload,
+            output_dir=output_dir,
             output_name=output_name,
             prefix="boltz2_protein_ligand",
+            split_outputs=split_outputs,
+            full_response=full_response,
         )
 
-        logger.info("Sending predict request to: %s", self.config.base_url)
-
-        # Send request
-        response_data = self.predict(payload)
-
-        # Save full JSON response
-        json_path = run_dir / f"{run_name}.json"
-        save_json(response_data, json_path)
-
-        # Extract and save all mmCIF structures
-        mmcif_texts = extract_all_mmcifs(response_data)
-        mmcif_paths: List[Path] = []
-
-        if len(mmcif_texts) == 0:
-            # No structures found - save empty file for backwards compatibility
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif("", mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        elif len(mmcif_texts) == 1:
-            # Single structure - no numbering needed
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif(mmcif_texts[0], mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        else:
-            # Multiple structures - number them
-            for i, mmcif_text in enumerate(mmcif_texts, start=1):
-                mmcif_path = run_dir / f"{run_name}_{i}.mmcif"
-                save_mmcif(mmcif_text, mmcif_path)
-                mmcif_paths.append(mmcif_path)
-
-        logger.info("Saved outputs -> dir: %s, mmCIF files: %d, JSON: %s",
-                    run_dir, len(mmcif_paths), json_path.name)
-        for p in mmcif_paths:
-            logger.debug("  - %s", p.name)
-
-        result = {
-            "mmcif": mmcif_paths[0],  # First structure for backwards compatibility
-            "mmcifs": mmcif_paths,    # All structures
-            "json": json_path,
-            "dir": run_dir,
-            "name": run_name,
-            "response": response_data,
-        }
-
-        # Optionally split outputs (for all structures)
-        if split_outputs and mmcif_texts:
-            all_artifacts: Dict[str, Any] = {}
-            for i, mmcif_path in enumerate(mmcif_paths, start=1):
-                artifacts = split_structure_file(mmcif_path)
-                if len(mmcif_paths) == 1:
-                    all_artifacts.update(artifacts)
-                else:
-                    all_artifacts[f"sample_{i}"] = artifacts
-            result["artifacts"] = all_artifacts
-
-        return result
-
     def generate_from_payload(
         self,
         payload: Dict[str, Any],
@@ -249,6 +598,7 @@ class Boltz2Client:
         output_dir: Path = Path("structures"),
         output_name: Optional[str] = None,
         split_outputs: bool = False,
+        full_response: bool = True,
     ) -> Dict[str, Any]:
         """Generate a structure prediction from a pre-built payload.
 
@@ -264,6 +614,10 @@ class Boltz2Client:
                 timestamped name is generated.
             split_outputs: If True, automatically split outputs into separate
                 artifact files (protein-only mmCIF, confidence scores, etc.).
+            full_response: If False, the parsed response is not kept: only
+                the structures are read back from the saved JSON, and
+                'response' in the result is None. Ignored when splitting
+                outputs. Defaults to True.
 
         Returns:
             Dictionary containing:
@@ -272,7 +626,9 @@ class Boltz2Client:
                 - json: Path to JSON file containing raw API response
                 - dir: Path to the output directory
                 - name: The run name used for file naming
-                - response: Raw API response dictionary
+                - response: Raw API response dictionary (None if
+                  full_response=False)
+                - bundle: Path to the tar archive (only if bundle_outputs)
                 - artifacts: Split artifact paths (only if split_outputs=True)
 
         Raises:
@@ -283,69 +639,86 @@ class Boltz2Client:
             >>> payload = load_payload_from_yaml("input.yaml")
             >>> result = client.generate_from_payload(payload, split_outputs=True)
         """
-        # Create output directory
-        run_dir, run_name = create_run_directory(
-            base_dir=output_dir,
+        return self._run_and_save(
+            payload,
+            output_dir=output_dir,
             output_name=output_name,
             prefix="boltz2",
+            split_outputs=split_outputs,
+            full_response=full_response,
         )
 
-        logger.info("Sending predict request to: %s", self.config.base_url)
-
-        # Send request
-        response_data = self.predict(payload)
+    def generate_from_payloads(
+        self,
+        payloads: Sequence[Dict[str, Any]],
+        *,
+        output_dir: Path = Path("structures"),
+        output_names: Optional[Sequence[Optional[str]]] = None,
+        split_outputs: bool = False,
+        full_response: bool = True,
+        max_workers: int = 4,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Generate structure predictions for several payloads at once.
 
-        # Save full JSON response
-        json_path = run_dir / f"{run_name}.json"
-        save_json(response_data, json_path)
-
-        # Extract and save all mmCIF structures
-        mmcif_texts = extract_all_mmcifs(response_data)
-        mmcif_paths: List[Path] = []
-
-        if len(mmcif_texts) == 0:
-            # No structures found - save empty file for backwards compatibility
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif("", mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        elif len(mmcif_texts) == 1:
-            # Single structure - no numbering needed
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif(mmcif_texts[0], mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        else:
-            # Multiple structures - number them
-            for i, mmcif_text in enumerate(mmcif_texts, start=1):
-                mmcif_path = run_dir / f"{run_name}_{i}.mmcif"
-                save_mmcif(mmcif_text, mmcif_path)
-                mmcif_paths.append(mmcif_path)
+        The API has no batch endpoint, so predictions are issued
+        concurrently from a thread pool sharing this client's pooled
+        session. Create the client with ``max_connections`` of at least
+        ``max_workers`` so each thread keeps its connection alive.
 
-        logger.info("Saved outputs -> dir: %s, mmCIF files: %d, JSON: %s",
-                    run_dir, len(mmcif_paths), json_path.name)
-        for p in mmcif_paths:
-            logger.debug("  - %s", p.name)
+        Args:
+            payloads: API payload dictionaries, one per prediction.
+            output_dir: Base directory for output files. Defaults to
+                'structures'.
+            output_names: Optional output name for each payload, in the same
+                order. None entries get a timestamped name.
+            split_outputs: If True, split each prediction's outputs into
+                separate artifact files.
+            full_response: Passed through to generate_from_payload.
+                Defaults to True.
+            max_workers: Number of predictions to run concurrently.
+                Defaults to 4.
 
-        result = {
-            "mmcif": mmcif_paths[0],  # First structure for backwards compatibility
-            "mmcifs": mmcif_paths,    # All structures
-            "json": json_path,
-            "dir": run_dir,
-            "name": run_name,
-            "response": response_data,
-        }
+        Returns:
+            One entry per payload, in input order: the result dictionary from
+            generate_from_payload, or the exception raised for that payload.
+            A failed prediction does not stop the others.
 
-        # Optionally split outputs (for all structures)
-        if split_outputs and mmcif_texts:
-            all_artifacts: Dict[str, Any] = {}
-            for i, mmcif_path in enumerate(mmcif_paths, start=1):
-                artifacts = split_structure_file(mmcif_path)
-                if len(mmcif_paths) == 1:
-                    all_artifacts.update(artifacts)
-                else:
-                    all_artifacts[f"sample_{i}"] = artifacts
-            result["artifacts"] = all_artifacts
+        Raises:
+            ValueError: If output_names and payloads differ in length.
 
-        return result
+        Example:
+            >>> results = client.generate_from_payloads(
+            ...     [payload_a, payload_b], output_names=["a", "b"]
+            ... )
+        """
+        if output_names is None:
+            output_names = [None] * len(payloads)
+        elif len(output_names) != len(payloads):
+            raise ValueError(
+                f"Got {len(output_names)} output names for {len(payloads)} payloads"
+            )
+
+        results: List[Any] = [None] * len(payloads)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    self.generate_from_payload,
+                    payload,
+                    output_dir=output_dir,
+                    output_name=name,
+                    split_outputs=split_outputs,
+                    full_response=full_response,
+                ): i
+                for i, (payload, name) in enumerate(zip(payloads, output_names))
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.debug("Prediction %d failed: %s", i + 1, e)
+                    results[i] = e
+        return results
 
     def generate_protein(
         self,
@@ -354,6 +727,7 @@ class Boltz2Client:
         output_dir: Path = Path("structures"),
         output_name: Optional[str] = None,
         payload_overrides: Optional[Dict[str, Any]] = None,
+        full_response: bool = True,
     ) -> Dict[str, Any]:
         """Generate a protein-only structure prediction.
 
@@ -367,6 +741,9 @@ class Boltz2Client:
                 timestamped name is generated.
             payload_overrides: Additional API parameters to override defaults,
                 such as 'sampling_steps' or 'diffusion_samples'.
+            full_response: If False, the parsed response is not kept: only
+                the structures are read back from the saved JSON, and
+                'response' in the result is None. Defaults to True.
 
         Returns:
             Dictionary containing:
@@ -375,7 +752,9 @@ class Boltz2Client:
                 - json: Path to JSON file containing raw API response
                 - dir: Path to the output directory
                 - name: The run name used for file naming
-                - response: Raw API response dictionary
+                - response: Raw API response dictionary (None if
+                  full_response=False)
+                - bundle: Path to the tar archive (only if bundle_outputs)
 
         Raises:
             RuntimeError: If the API request fails.
@@ -392,53 +771,11 @@ class Boltz2Client:
             overrides=payload_overrides,
         )
 
-        # Create output directory
-        run_dir, run_name = create_run_directory(
-            base_dir=output_dir,
+        return self._run_and_save(
+            payload,
+            output_dir=output_dir,
             output_name=output_name,
             prefix="boltz2_protein",
+            split_outputs=False,
+            full_response=full_response,
         )
-
-        logger.info("Sending predict request to: %s", self.config.base_url)
-
-        # Send request
-        response_data = self.predict(payload)
-
-        # Save full JSON response
-        json_path = run_dir / f"{run_name}.json"
-        save_json(response_data, json_path)
-
-        # Extract and save all mmCIF structures
-        mmcif_texts = extract_all_mmcifs(response_data)
-        mmcif_paths: List[Path] = []
-
-        if len(mmcif_texts) == 0:
-            # No structures found - save empty file for backwards compatibility
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif("", mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        elif len(mmcif_texts) == 1:
-            # Single structure - no numbering needed
-            mmcif_path = run_dir / f"{run_name}.mmcif"
-            save_mmcif(mmcif_texts[0], mmcif_path)
-            mmcif_paths.append(mmcif_path)
-        else:
-            # Multiple structures - number them
-            for i, mmcif_text in enumerate(mmcif_texts, start=1):
-                mmcif_path = run_dir / f"{run_name}_{i}.mmcif"
-                save_mmcif(mmcif_text, mmcif_path)
-                mmcif_paths.append(mmcif_path)
-
-        logger.info("Saved outputs -> dir: %s, mmCIF files: %d, JSON: %s",
-                    run_dir, len(mmcif_paths), json_path.name)
-        for p in mmcif_paths:
-            logger.debug("  - %s", p.name)
-
-        return {
-            "mmcif": mmcif_paths[0],  # First structure for backwards compatibility
-            "mmcifs": mmcif_paths,    # All structures
-            "json": json_path,
-            "dir": run_dir,
-            "name": run_name,
-            "response": response_data,
-        }
@@ -16,11 +16,18 @@ Example:
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-from dotenv import load_dotenv
+from urllib3.util import make_headers
+
+# Content codings urllib3 can decode here: gzip and deflate always, plus br
+# and zstd when the brotli and zstandard packages are installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Whether the default .env search has already run in this process
+_dotenv_loaded = False
 
 
 @dataclass
@@ -45,18 +52,32 @@ class Boltz2Config:
     base_url: str = "https://health.api.nvidia.com/v1/biology/mit/boltz2/predict"
     timeout: int = 600
 
+    _headers: Optional[Tuple[str, Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def headers(self) -> Dict[str, str]:
-        """Generate HTTP headers for API requests.
+        """HTTP headers for API requests.
+
+        The accept-encoding header lists only the compression formats that
+        can be decoded in this environment, so mmCIF-heavy responses travel
+        compressed without risking an undecodable body. The headers are
+        built once and reused until api_key changes; each access returns a
+        copy, so callers may modify it.
 
         Returns:
             Dictionary containing required headers including Authorization.
         """
-        return {
-            "accept": "application/json",
-            "content-type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        if self._headers is None or self._headers[0] != self.api_key:
+            headers = {
+                "accept": "application/json",
+                "accept-encoding": ACCEPT_ENCODING,
+                "content-type": "application/json",
+                "Authorization": f"Bearer {self.api_key}",
+            }
+            self._headers = (self.api_key, headers)
+        return dict(self._headers[1])
 
 
 def load_config(
@@ -96,11 +117,24 @@ def load_config(
         >>> # Load from specific .env file
         >>> config = load_config(env_path=Path("/path/to/.env"))
     """
-    # Load .env file
+    global _dotenv_loaded
+
+    # Load .env file. An explicit env_path is always read. The default
+    # search walks up the directory tree, so it runs at most once per
+    # process, and only if a value is still missing; .env never overrides
+    # variables that are already set.
     if env_path:
+        from dotenv import load_dotenv
+
         load_dotenv(env_path)
-    else:
+    elif not _dotenv_loaded and not (
+        (api_key or os.getenv("BOLTZ2_API_KEY"))
+        and (base_url or os.getenv("BOLTZ2_API_URL"))
+    ):
+        from dotenv import load_dotenv
+
         load_dotenv()
+        _dotenv_loaded = True
 
     # Resolve API key with precedence: explicit > env var
     resolved_key = api_key or os.getenv("BOLTZ2_API_KEY")
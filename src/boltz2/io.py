@@ -9,12 +9,30 @@ Example:
     >>> save_mmcif(mmcif_content, run_dir / "structure.mmcif")
 """
 
+import io
 import json
+import mmap
+import os
+import tarfile
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Callable, List, Optional, Sequence, Tuple, Union
 
 from boltz2.utils import generate_run_name
 
+# Use orjson for JSON encoding and decoding when it is installed
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _as_path(path: Union[str, os.PathLike]) -> Path:
+    """Return path as a Path, without copying it if it already is one."""
+    return path if isinstance(path, Path) else Path(path)
+
 
 def create_run_directory(
     base_dir: Path,
@@ -28,6 +46,9 @@ def create_run_directory(
         output_name: Optional user-provided name for the run.
         prefix: Default prefix if no output_name provided. Defaults to "boltz2".
 
+    The run directory and any missing parents, including base_dir, are
+    created with a single mkdir call.
+
     Returns:
         Tuple of (run_directory_path, run_name) where run_directory_path
         is a Path object to the created directory.
@@ -37,21 +58,55 @@ def create_run_directory(
         >>> name
         'my_run'
     """
-    base_dir = Path(base_dir)
-    base_dir.mkdir(parents=True, exist_ok=True)
-
     run_name = generate_run_name(prefix=prefix, output_name=output_name)
-    run_dir = base_dir / run_name
+    run_dir = _as_path(base_dir) / run_name
     run_dir.mkdir(parents=True, exist_ok=True)
 
     return run_dir, run_name
 
 
-def save_mmcif(content: str, path: Path) -> Path:
+def find_yaml_files(root: Path) -> List[Path]:
+    """Recursively find all YAML input files under a directory.
+
+    Uses os.scandir so directory entries are classified from the data
+    returned by the directory listing, avoiding a separate stat call per
+    entry. Symlinked directories are not followed.
+
+    Args:
+        root: Directory to search.
+
+    Returns:
+        Sorted list of paths to files ending in '.yaml'.
+
+    Example:
+        >>> find_yaml_files(Path("inputs"))
+        [PosixPath('inputs/prod-PDE3A_ensifentrine.yaml')]
+    """
+    found: List[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".yaml") and entry.is_file():
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    found.sort()
+    return found
+
+
+def save_mmcif(content: Union[str, bytes], path: Path) -> Path:
     """Save mmCIF content to a file.
 
+    The text is encoded once and written in binary mode, which avoids the
+    incremental encoder of a text-mode file. Line endings are written as-is.
+
     Args:
-        content: mmCIF structure text.
+        content: mmCIF structure text, or text already encoded as UTF-8.
         path: Output file path.
 
     Returns:
@@ -60,12 +115,147 @@ def save_mmcif(content: str, path: Path) -> Path:
     Example:
         >>> path = save_mmcif("data_structure\\n...", Path("out.mmcif"))
     """
-    path = Path(path)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+    path = _as_path(path)
+    with open(path, "wb") as f:
+        f.write(content if isinstance(content, bytes) else content.encode("utf-8"))
     return path
 
 
+def write_text_files(
+    files: Sequence[Tuple[Path, Union[str, bytes]]], max_workers: int = 4
+) -> List[Path]:
+    """Write several text files, overlapping the writes on worker threads.
+
+    File writes release the GIL, so issuing them from a small thread pool
+    lets the OS flush several artifacts at once instead of one after another.
+    A single file is written inline.
+
+    Args:
+        files: Sequence of (path, content) pairs. Content may be text or
+            UTF-8 encoded bytes.
+        max_workers: Maximum number of concurrent writes. Defaults to 4.
+
+    Returns:
+        List of written paths, in the same order as the input.
+
+    Raises:
+        OSError: If any file cannot be written.
+
+    Example:
+        >>> write_text_files([(Path("a.json"), "{}"), (Path("b.json"), "[]")])
+        [PosixPath('a.json'), PosixPath('b.json')]
+    """
+    if len(files) <= 1:
+        return [save_mmcif(content, path) for path, content in files]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        futures = [executor.submit(save_mmcif, content, path) for path, content in files]
+        return [future.result() for future in futures]
+
+
+def mmcif_output_paths(run_dir: Path, run_name: str, count: int) -> List[Path]:
+    """Return the mmCIF paths written for a run with count samples.
+
+    A single structure is saved as ``<run_name>.mmcif``. Several structures
+    (one per diffusion sample) are numbered ``<run_name>_1.mmcif``,
+    ``<run_name>_2.mmcif``, ... If there are no structures, an empty
+    ``<run_name>.mmcif`` is still written for backwards compatibility.
+
+    Args:
+        run_dir: Run output directory.
+        run_name: Base name for the output files.
+        count: Number of structures in the run.
+
+    Returns:
+        ``[<run_name>.mmcif]`` for zero or one structure, otherwise
+        ``<run_name>_1.mmcif`` through ``<run_name>_<count>.mmcif``.
+    """
+    run_dir = _as_path(run_dir)
+    if count <= 1:
+        return [run_dir / f"{run_name}.mmcif"]
+    return [run_dir / f"{run_name}_{i}.mmcif" for i in range(1, count + 1)]
+
+
+def write_text_bundle(
+    bundle_path: Path, files: Sequence[Tuple[str, Union[str, bytes]]]
+) -> Path:
+    """Write several text files as members of a single tar archive.
+
+    One archive replaces one create/write/close per file, which matters on
+    filesystems with high small-file overhead.
+
+    Args:
+        bundle_path: Output tar file path.
+        files: Sequence of (member_name, content) pairs. Content may be
+            text or UTF-8 encoded bytes.
+
+    Returns:
+        Path to the written archive.
+
+    Raises:
+        OSError: If the archive cannot be written.
+
+    Example:
+        >>> write_text_bundle(Path("run.tar"), [("a.mmcif", "data_a")])
+        PosixPath('run.tar')
+    """
+    bundle_path = _as_path(bundle_path)
+    mtime = time.time()
+    with open(bundle_path, "wb") as f, tarfile.open(fileobj=f, mode="w|") as tar:
+        for name, content in files:
+            data = content if isinstance(content, bytes) else content.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = mtime
+            info.mode = 0o644
+            tar.addfile(info, io.BytesIO(data))
+    return bundle_path
+
+
+def bundle_output_path(run_dir: Path, run_name: str) -> Path:
+    """Return the archive path used when a run's outputs are bundled."""
+    return _as_path(run_dir) / f"{run_name}.mmcif.tar"
+
+
+def encode_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """Serialize data to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and the indent is one it supports
+    (None or 2), otherwise the standard library encoder.
+
+    Args:
+        data: Data to serialize (must be JSON-serializable).
+        indent: JSON indentation level, or None for compact output.
+            Defaults to 2.
+
+    Returns:
+        Encoded JSON document.
+
+    Raises:
+        TypeError: If data is not JSON-serializable.
+    """
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text.
+
+    Args:
+        data: Encoded JSON document.
+
+    Returns:
+        Parsed JSON data.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def save_json(data: Any, path: Path, indent: int = 2) -> Path:
     """Save data as JSON to a file.
 
@@ -80,12 +270,67 @@ def save_json(data: Any, path: Path, indent: int = 2) -> Path:
     Example:
         >>> save_json({"score": 0.95}, Path("confidence.json"))
     """
-    path = Path(path)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent)
+    path = _as_path(path)
+    with open(path, "wb") as f:
+        f.write(encode_json(data, indent=indent))
     return path
 
 
+def atomic_write(path: Path, writer: Callable[[BinaryIO], Any]) -> Path:
+    """Write a file so that readers never see it partially written.
+
+    The content goes to a temporary file in the same directory, which then
+    replaces path in a single rename. The directory must already exist.
+
+    Args:
+        path: Output file path.
+        writer: Callable that writes the content to the binary file object
+            it is given.
+
+    Returns:
+        Path to the written file.
+
+    Raises:
+        OSError: If the file cannot be written. The temporary file is
+            removed and any error raised by writer is re-raised.
+
+    Example:
+        >>> atomic_write(Path("entry.json"), lambda f: f.write(b"{}"))
+    """
+    path = _as_path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def atomic_write_json(path: Path, obj: Any) -> Path:
+    """Atomically save data as compact JSON.
+
+    Args:
+        path: Output file path.
+        obj: Data to serialize (must be JSON-serializable).
+
+    Returns:
+        Path to the saved file.
+
+    Raises:
+        TypeError: If obj is not JSON-serializable.
+        OSError: If the file cannot be written.
+
+    Example:
+        >>> atomic_write_json(Path("entry.json"), {"score": 0.95})
+    """
+    data = encode_json(obj, indent=None)
+    return atomic_write(path, lambda f: f.write(data))
+
+
 def load_json(path: Path) -> Any:
     """Load JSON data from a file.
 
@@ -102,9 +347,14 @@ def load_json(path: Path) -> Any:
     Example:
         >>> data = load_json(Path("confidence.json"))
     """
-    path = Path(path)
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > 0:
+            # Parse straight from the page cache instead of copying the
+            # whole file into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return decode_json(f.read())
 
 
 def read_text(path: Path) -> str:
@@ -122,5 +372,5 @@ def read_text(path: Path) -> str:
     Example:
         >>> content = read_text(Path("structure.mmcif"))
     """
-    path = Path(path)
-    return path.read_text(encoding="utf-8")
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
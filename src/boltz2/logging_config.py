@@ -28,6 +28,9 @@ SIMPLE_FORMAT = "%(levelname)s: %(message)s"
 # Package logger
 logger = logging.getLogger("boltz2")
 
+# Set once an entry point has applied its logging configuration
+_configured = False
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -37,7 +40,9 @@ def setup_logging(
     """Configure logging for the Boltz-2 package.
 
     This function sets up the root logger for the boltz2 package. It can be
-    called multiple times to reconfigure logging.
+    called multiple times to reconfigure logging; a call that would install
+    the same level, format and stream as the current handler leaves the
+    existing configuration in place.
 
     Args:
         level: Logging level as string (DEBUG, INFO, WARNING, ERROR, CRITICAL).
@@ -65,6 +70,20 @@ def setup_logging(
     if format_string is None:
         format_string = SIMPLE_FORMAT if numeric_level >= logging.INFO else DEFAULT_FORMAT
 
+    stream = stream or sys.stderr
+
+    # Nothing to do if our handler is already set up the same way
+    if len(logger.handlers) == 1:
+        current = logger.handlers[0]
+        if (
+            getattr(current, "_boltz2_handler", False)
+            and logger.level == numeric_level
+            and current.level == numeric_level
+            and current.stream is stream
+            and current.formatter._fmt == format_string
+        ):
+            return logger
+
     # Configure the package logger
     logger.setLevel(numeric_level)
 
@@ -72,9 +91,10 @@ def setup_logging(
     logger.handlers.clear()
 
     # Create handler
-    handler = logging.StreamHandler(stream or sys.stderr)
+    handler = logging.StreamHandler(stream)
     handler.setLevel(numeric_level)
     handler.setFormatter(logging.Formatter(format_string))
+    handler._boltz2_handler = True
 
     logger.addHandler(handler)
 
@@ -84,6 +104,31 @@ def setup_logging(
     return logger
 
 
+def configure_once(level: Optional[str] = None) -> logging.Logger:
+    """Configure logging for an entry point, at most once per process.
+
+    The first call applies setup_logging(level); later calls are no-ops, so
+    entry points invoked repeatedly (e.g. through the `boltz2` dispatcher or
+    programmatically) do not rebuild handlers each time. Use setup_logging
+    directly to force a reconfiguration.
+
+    Args:
+        level: Logging level as string, passed to setup_logging.
+
+    Returns:
+        The logger instance for the boltz2 package.
+
+    Example:
+        >>> from boltz2.logging_config import configure_once
+        >>> logger = configure_once(level="DEBUG")
+    """
+    global _configured
+    if not _configured:
+        setup_logging(level=level)
+        _configured = True
+    return logger
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger instance for use within the boltz2 package.
 
@@ -104,5 +149,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return logger
 
 
-# Initialize logging with defaults on module import
-setup_logging()
+# Initialize logging with defaults on first import. The flag lives on the
+# logger, which survives module reloads, so re-importing this module (e.g.
+# notebook autoreload) keeps any handlers configured since.
+if not getattr(logger, "_boltz2_configured", False):
+    setup_logging()
+    logger._boltz2_configured = True
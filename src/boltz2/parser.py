@@ -10,25 +10,66 @@ Example:
     >>> artifacts = split_structure_file(Path("output.mmcif"))
 """
 
+import io
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AnyStr, Dict, List, Optional, Tuple, Union
 
+from boltz2.io import decode_json, encode_json, load_json, write_text_files
 from boltz2.logging_config import get_logger
 
+# ijson lets structures be pulled out of a saved response without parsing
+# the rest of it; fall back to a full parse when it is not installed
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
 logger = get_logger("parser")
 
+# JSON documents at least this large (in characters or bytes) are scanned
+# for structures incrementally instead of being parsed in full
+STREAM_THRESHOLD = 1 << 20
+
+# Response fields copied into the confidence and matrix artifacts
+_CONFIDENCE_KEYS = (
+    "confidence_scores",
+    "ptm_scores",
+    "iptm_scores",
+    "complex_plddt_scores",
+    "complex_iplddt_scores",
+    "ma_qa_metric_local",
+    "ma_qa_metric",
+)
+_MATRIX_KEYS = ("pair_chains_iptm_scores", "complex_iplddt_scores")
+_CONFIDENCE_KEY_SET = frozenset(_CONFIDENCE_KEYS)
+_MATRIX_KEY_SET = frozenset(_MATRIX_KEYS)
+
+# Markers of mmCIF content in raw text that is not a JSON response
+_MMCIF_ANCHOR_RE = re.compile(r"data_|loop_|_entry\.id")
+_MMCIF_BLOCK_RE = re.compile(r"data_|loop_")
+_MMCIF_BLOCK_RE_BYTES = re.compile(rb"data_|loop_")
+
+# Block size used when filtering large mmCIF files from disk
+_STREAM_BLOCK_SIZE = 1 << 20
+
+# ASCII characters str.splitlines() treats as line breaks besides "\n"
+_OTHER_LINE_BREAKS = ("\r", "\v", "\f", "\x1c", "\x1d", "\x1e")
+_OTHER_LINE_BREAKS_BYTES = tuple(ch.encode("ascii") for ch in _OTHER_LINE_BREAKS)
+
 
 def extract_all_mmcifs(response_data: Any) -> List[str]:
     """Extract all mmCIF structures from API response.
 
     This function handles both JSON API responses and raw mmCIF text input.
     When the response contains multiple diffusion samples, all structures
-    are returned.
+    are returned. Large JSON documents are scanned incrementally with ijson
+    when it is installed, so score matrices are never materialized.
 
     Args:
         response_data: Either a parsed JSON response dictionary from the API,
-            a JSON string, or raw mmCIF text.
+            a JSON string or bytes, or raw mmCIF text.
 
     Returns:
         List of mmCIF structure strings. Returns an empty list if no
@@ -41,17 +82,24 @@ def extract_all_mmcifs(response_data: Any) -> List[str]:
         >>> len(mmcifs)
         1
     """
-    if isinstance(response_data, str):
-        # Try parsing as JSON
+    if isinstance(response_data, (str, bytes)):
+        is_bytes = isinstance(response_data, bytes)
+        if not _starts_with_brace(response_data):
+            # Already mmCIF text - return as single-element list
+            return [response_data.decode("utf-8") if is_bytes else response_data]
+
+        if ijson is not None and len(response_data) >= STREAM_THRESHOLD:
+            raw = response_data if is_bytes else response_data.encode("utf-8")
+            try:
+                return _iter_structures(io.BytesIO(raw))
+            except ijson.JSONError:
+                pass  # Handled by the full parse below
+
         try:
-            if response_data.lstrip().startswith("{"):
-                response_data = json.loads(response_data)
-            else:
-                # Already mmCIF text - return as single-element list
-                return [response_data]
+            response_data = decode_json(response_data)
         except json.JSONDecodeError:
             # Assume it's raw mmCIF
-            return [response_data]
+            return [response_data.decode("utf-8") if is_bytes else response_data]
 
     # Extract all structures from JSON
     mmcifs = []
@@ -65,6 +113,53 @@ def extract_all_mmcifs(response_data: Any) -> List[str]:
     return mmcifs
 
 
+def _starts_with_brace(data: Union[str, bytes]) -> bool:
+    """Return True if data starts with "{" after leading whitespace.
+
+    Only a short prefix is stripped, so a large mmCIF string is not copied.
+    """
+    head = data[:64].lstrip()
+    if not head:
+        # Unusually long leading whitespace; strip the whole text
+        head = data.lstrip()
+    return head[:1] in ("{", b"{")
+
+
+def _iter_structures(f) -> List[str]:
+    """Collect the mmCIF strings of a JSON response stream using ijson."""
+    return [
+        struct["structure"]
+        for struct in ijson.items(f, "structures.item")
+        if isinstance(struct, dict) and struct.get("structure")
+    ]
+
+
+def load_mmcifs_from_json(json_path: Path) -> List[str]:
+    """Read only the mmCIF structures from a saved API response file.
+
+    With ijson installed, the file is parsed incrementally and only the
+    ``structures`` entries are materialized, so large score matrices in the
+    response are skipped. Otherwise the file is parsed in full.
+
+    Args:
+        json_path: Path to a raw JSON response from the API.
+
+    Returns:
+        List of mmCIF structure strings, in sample order.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+
+    Example:
+        >>> mmcifs = load_mmcifs_from_json(Path("structures/run/run.json"))
+    """
+    if ijson is None:
+        return extract_all_mmcifs(load_json(json_path))
+
+    with open(json_path, "rb") as f:
+        return _iter_structures(f)
+
+
 def extract_confidence_data(response_data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract confidence scores from API response.
 
@@ -82,16 +177,7 @@ def extract_confidence_data(response_data: Dict[str, Any]) -> Dict[str, Any]:
         >>> confidence["ptm_scores"]
         [0.85]
     """
-    confidence_keys = [
-        "confidence_scores",
-        "ptm_scores",
-        "iptm_scores",
-        "complex_plddt_scores",
-        "complex_iplddt_scores",
-        "ma_qa_metric_local",
-        "ma_qa_metric",
-    ]
-    return {k: response_data.get(k) for k in confidence_keys if response_data.get(k) is not None}
+    return _present_values(response_data, _CONFIDENCE_KEYS)
 
 
 def extract_affinity_data(response_data: Dict[str, Any]) -> Optional[Any]:
@@ -130,11 +216,161 @@ def extract_matrix_data(response_data: Dict[str, Any]) -> Dict[str, Any]:
         >>> "pair_chains_iptm_scores" in matrices
         True
     """
-    matrix_keys = ["pair_chains_iptm_scores", "complex_iplddt_scores"]
-    return {k: response_data.get(k) for k in matrix_keys if response_data.get(k) is not None}
+    return _present_values(response_data, _MATRIX_KEYS)
+
+
+def _split_response(
+    response_data: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Optional[Any], Dict[str, Any]]:
+    """Route response fields to the confidence, affinity and matrix artifacts.
+
+    Equivalent to calling extract_confidence_data, extract_affinity_data and
+    extract_matrix_data, but walks the response once. Fields keep the order
+    they have in the response.
+
+    Returns:
+        Tuple of (confidence_data, affinity_data, matrix_data).
+    """
+    confidence: Dict[str, Any] = {}
+    matrices: Dict[str, Any] = {}
+    affinity = None
+    for key, value in response_data.items():
+        if value is None:
+            continue
+        if key in _CONFIDENCE_KEY_SET:
+            confidence[key] = value
+        if key in _MATRIX_KEY_SET:
+            # complex_iplddt_scores belongs to both artifacts
+            matrices[key] = value
+        elif key == "affinities":
+            affinity = value
+    return confidence, affinity, matrices
+
+
+def _present_values(response_data: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Return the entries of response_data for keys whose value is not None."""
+    present = {}
+    get = response_data.get
+    for key in keys:
+        value = get(key)
+        if value is not None:
+            present[key] = value
+    return present
+
+
+def remove_hetatm_lines(mmcif_text: str) -> str:
+    """Remove HETATM records from mmCIF text.
+
+    The text is scanned for ``\\nHETATM`` and the spans between matches are
+    copied in slices, so no per-line strings are created. Text with line
+    breaks other than ``\\n`` is split line by line instead. In both cases
+    the result is joined with ``\\n`` and has no trailing newline.
 
+    Args:
+        mmcif_text: mmCIF structure content.
 
-def split_structure_file(input_path: Path) -> Dict[str, Path]:
+    Returns:
+        The mmCIF content without HETATM lines.
+
+    Example:
+        >>> remove_hetatm_lines("data_x\\nATOM 1\\nHETATM 2\\n")
+        'data_x\\nATOM 1'
+    """
+    if not mmcif_text.isascii() or any(ch in mmcif_text for ch in _OTHER_LINE_BREAKS):
+        return "\n".join(ln for ln in mmcif_text.splitlines() if not ln.startswith("HETATM"))
+
+    if "HETATM" in mmcif_text:
+        protein = "".join(_hetatm_free_parts(mmcif_text))
+    else:
+        # Common for protein-only predictions: nothing to cut out
+        protein = mmcif_text
+    return protein[:-1] if protein.endswith("\n") else protein
+
+
+def _hetatm_free_parts(data: AnyStr) -> List[AnyStr]:
+    """Return the spans of data left after cutting out HETATM lines.
+
+    data must start at a line boundary and use ``\\n`` line breaks. Kept
+    lines retain their line terminators.
+    """
+    newline, marker = ("\n", "HETATM") if isinstance(data, str) else (b"\n", b"HETATM")
+    parts = []
+    start = 0
+    end = len(data)
+    while True:
+        # Skip HETATM lines beginning at the current position
+        while data.startswith(marker, start):
+            next_line = data.find(newline, start)
+            start = end if next_line == -1 else next_line + 1
+        hit = data.find(newline + marker, start)
+        if hit == -1:
+            break
+        parts.append(data[start:hit + 1])
+        start = hit + 1
+    parts.append(data[start:])
+    return parts
+
+
+def _stream_protein_mmcif(input_path: Path, protein_path: Path) -> bool:
+    """Write a protein-only copy of an mmCIF file without loading it whole.
+
+    The file is filtered in blocks of _STREAM_BLOCK_SIZE bytes and the output
+    matches remove_hetatm_lines. Only plain mmCIF is handled: the first
+    block must contain ``data_`` or ``loop_`` and must not look like JSON,
+    and the file must be ASCII with ``\\n`` line breaks. Otherwise False is
+    returned and the caller should fall back to the in-memory path, which
+    overwrites anything written here.
+
+    Args:
+        input_path: mmCIF file to filter.
+        protein_path: Output path for the protein-only mmCIF.
+
+    Returns:
+        True if the protein-only file was written.
+    """
+    with open(input_path, "rb") as fin:
+        block = fin.read(_STREAM_BLOCK_SIZE)
+        if (
+            _starts_with_brace(block)
+            or not _MMCIF_BLOCK_RE_BYTES.search(block)
+            or not _plain_ascii(block)
+        ):
+            return False
+
+        with open(protein_path, "wb") as fout:
+            carry = b""
+            # The final newline is held back so the output has no trailing
+            # newline, like remove_hetatm_lines
+            held_newline = False
+            while block:
+                data = carry + block
+                cut = data.rfind(b"\n") + 1
+                carry = data[cut:]
+                kept = b"".join(_hetatm_free_parts(data[:cut]))
+                if kept:
+                    if held_newline:
+                        fout.write(b"\n")
+                    fout.write(kept[:-1])
+                    held_newline = True
+                block = fin.read(_STREAM_BLOCK_SIZE)
+                if block and not _plain_ascii(block):
+                    return False
+            kept = b"".join(_hetatm_free_parts(carry))
+            if kept:
+                if held_newline:
+                    fout.write(b"\n")
+                fout.write(kept)
+    return True
+
+
+def _plain_ascii(block: bytes) -> bool:
+    """Return True if block is ASCII with no line breaks other than \\n."""
+    return block.isascii() and not any(ch in block for ch in _OTHER_LINE_BREAKS_BYTES)
+
+
+def split_structure_file(
+    input_path: Path, compact_json: bool = False, binary_matrices: bool = False
+) -> Dict[str, Path]:
     """Split a Boltz-2 output file into separate artifacts.
 
     Produces multiple output files from a combined Boltz-2 output:
@@ -144,16 +380,27 @@ def split_structure_file(input_path: Path) -> Dict[str, Path]:
       - Affinity JSON
       - Matrices JSON
 
+    A plain mmCIF input without a sidecar JSON is filtered in blocks straight
+    from disk, so large structures are never held in memory in full.
+
     Args:
         input_path: Path to mmCIF or JSON file from the Boltz-2 API.
+        compact_json: If True, JSON artifacts are written without
+            indentation, which is faster and smaller for large score
+            matrices. Defaults to False (2-space indentation).
+        binary_matrices: If True, numeric score matrices are written as
+            float32 arrays to ``<base>_matrices.npz`` instead of the matrices
+            JSON. Requires numpy. Defaults to False.
 
     Returns:
         Dictionary mapping artifact type to file path. Keys include:
         'mmcif', 'protein_mmcif', 'confidence_json', 'affinity_json',
-        'matrices_json'. Only successfully created artifacts are included.
+        'matrices_json' and 'matrices_npz'. Only successfully created
+        artifacts are included.
 
     Raises:
-        RuntimeError: If no mmCIF content can be found in the input file.
+        RuntimeError: If no mmCIF content can be found in the input file, or
+            binary_matrices is set and numpy is not installed.
 
     Example:
         >>> artifacts = split_structure_file(Path("prediction.mmcif"))
@@ -171,20 +418,28 @@ def split_structure_file(input_path: Path) -> Dict[str, Path]:
     json_candidate = input_path.with_suffix(".json")
     if json_candidate.exists() and json_candidate != input_path:
         try:
-            with open(json_candidate, "r", encoding="utf-8") as f:
-                full_json = json.load(f)
+            full_json = load_json(json_candidate)
         except Exception:
             pass
 
-    # Read input file
-    text = input_path.read_text(encoding="utf-8")
-
-    # If input looks like JSON, parse it
-    if full_json is None and text.lstrip().startswith("{"):
-        try:
-            full_json = json.loads(text)
-        except Exception:
-            pass
+    # A plain mmCIF input with nothing else to extract is filtered straight
+    # from disk instead of being loaded into memory
+    if full_json is None and input_path.suffix.lower() == ".mmcif":
+        protein_path = out_dir / f"{base}_protein.mmcif"
+        if _stream_protein_mmcif(input_path, protein_path):
+            return {"mmcif": input_path, "protein_mmcif": protein_path}
+
+    # The input is only read when the sidecar JSON does not supply the mmCIF
+    text = None
+    if full_json is None:
+        text = input_path.read_text(encoding="utf-8")
+
+        # If input looks like JSON, parse it
+        if _starts_with_brace(text):
+            try:
+                full_json = decode_json(text)
+            except Exception:
+                pass
 
     # Extract mmCIF text
     mmcif_text = None
@@ -194,62 +449,160 @@ def split_structure_file(input_path: Path) -> Dict[str, Path]:
             mmcif_text = mmcifs[0]
 
     if mmcif_text is None:
-        # Try to find mmCIF content in raw text
-        if "data_" in text or "loop_" in text:
+        if text is None:
+            text = input_path.read_text(encoding="utf-8")
+        # Try to find mmCIF content in raw text. The whole text is used if it
+        # has a data_ or loop_ block anywhere; failing that, it is cut at the
+        # first _entry.id. A single scan finds the first anchor of any kind.
+        match = _MMCIF_ANCHOR_RE.search(text)
+        if match is None:
+            raise RuntimeError("Could not find mmCIF content in input file")
+        if match.group() != "_entry.id" or _MMCIF_BLOCK_RE.search(text, match.end()):
             mmcif_text = text
         else:
-            idx = text.find("data_")
-            if idx == -1:
-                idx = text.find("_entry.id")
-            if idx != -1:
-                mmcif_text = text[idx:]
-            else:
-                raise RuntimeError("Could not find mmCIF content in input file")
+            mmcif_text = text[match.start():]
 
     generated: Dict[str, Path] = {}
+    # Artifacts are collected first and written together at the end
+    pending: List[Tuple[str, Path, Union[str, bytes]]] = []
 
     # Reuse existing mmCIF input file instead of writing another full mmCIF.
     # When input is JSON (or other format), materialize the extracted mmCIF.
+    mmcif_path = out_dir / f"{base}.mmcif"
     if input_path.suffix.lower() == ".mmcif":
         generated["mmcif"] = input_path
     else:
-        mmcif_out = out_dir / f"{base}.mmcif"
-        with open(mmcif_out, "w", encoding="utf-8") as f:
-            f.write(mmcif_text)
-        generated["mmcif"] = mmcif_out
+        pending.append(("mmcif", mmcif_path, mmcif_text))
+
+    pending.extend(build_split_artifacts(
+        mmcif_text, mmcif_path, full_json, compact_json, binary_matrices
+    ))
+
+    write_text_files([(path, content) for _, path, content in pending])
+    for key, path, _ in pending:
+        generated[key] = path
+
+    return generated
+
+
+def build_split_artifacts(
+    mmcif_text: str,
+    mmcif_path: Path,
+    full_json: Optional[Dict[str, Any]] = None,
+    compact_json: bool = False,
+    binary_matrices: bool = False,
+) -> List[Tuple[str, Path, Union[str, bytes]]]:
+    """Build the derived artifacts for an mmCIF structure without writing them.
+
+    This is the in-memory half of split_structure_file. Callers that already
+    hold the mmCIF text and API response can use it to avoid re-reading them
+    from disk, then write the results with boltz2.io.write_text_files.
+
+    Args:
+        mmcif_text: mmCIF structure content.
+        mmcif_path: Path the full mmCIF is (or will be) saved at. Artifact
+            names are derived from its stem and directory.
+        full_json: Parsed API response, if available. Confidence, affinity
+            and matrix artifacts are only produced when it is given.
+        compact_json: If True, JSON artifacts are encoded without
+            indentation. Defaults to False.
+        binary_matrices: If True, numeric score matrices are packed as
+            float32 arrays into a ``<base>_matrices.npz`` artifact; only
+            values that are not numeric arrays stay in the matrices JSON.
+            Defaults to False.
+
+    Returns:
+        List of (artifact_key, path, content) tuples, protein-only mmCIF
+        first. Keys are 'protein_mmcif', 'confidence_json',
+        'affinity_json', 'matrices_json' and 'matrices_npz'; empty
+        artifacts are omitted. JSON and npz contents are bytes.
+
+    Raises:
+        RuntimeError: If binary_matrices is set and numpy is not installed.
+
+    Example:
+        >>> pending = build_split_artifacts(text, Path("out/run.mmcif"), response)
+        >>> [key for key, _, _ in pending]
+        ['protein_mmcif', 'confidence_json']
+    """
+    mmcif_path = Path(mmcif_path)
+    base = mmcif_path.stem
+    out_dir = mmcif_path.parent
+    pending: List[Tuple[str, Path, Union[str, bytes]]] = []
+    indent = None if compact_json else 2
 
     # Produce protein-only mmCIF (remove HETATM lines)
-    lines = mmcif_text.splitlines()
-    protein_lines = [ln for ln in lines if not ln.startswith("HETATM")]
-    protein_out = out_dir / f"{base}_protein.mmcif"
-    with open(protein_out, "w", encoding="utf-8") as f:
-        f.write("\n".join(protein_lines))
-    generated["protein_mmcif"] = protein_out
+    pending.append(("protein_mmcif", out_dir / f"{base}_protein.mmcif", remove_hetatm_lines(mmcif_text)))
 
     # Extract JSON artifacts if available
     if full_json:
+        # One pass over the response collects all three artifacts
+        confidence_data, affinity_data, matrix_data = _split_response(full_json)
+
         # Confidence data
-        confidence_data = extract_confidence_data(full_json)
         if confidence_data:
-            conf_out = out_dir / f"{base}_confidence.json"
-            with open(conf_out, "w", encoding="utf-8") as f:
-                json.dump(confidence_data, f, indent=2)
-            generated["confidence_json"] = conf_out
+            pending.append((
+                "confidence_json",
+                out_dir / f"{base}_confidence.json",
+                encode_json(confidence_data, indent=indent),
+            ))
 
         # Affinity data
-        affinity_data = extract_affinity_data(full_json)
         if affinity_data:  # Only write if non-empty
-            aff_out = out_dir / f"{base}_affinity.json"
-            with open(aff_out, "w", encoding="utf-8") as f:
-                json.dump(affinity_data, f, indent=2)
-            generated["affinity_json"] = aff_out
+            pending.append((
+                "affinity_json",
+                out_dir / f"{base}_affinity.json",
+                encode_json(affinity_data, indent=indent),
+            ))
 
         # Matrix data
-        matrix_data = extract_matrix_data(full_json)
+        if matrix_data and binary_matrices:
+            npz_data, matrix_data = _pack_matrices(matrix_data)
+            if npz_data is not None:
+                pending.append(("matrices_npz", out_dir / f"{base}_matrices.npz", npz_data))
         if matrix_data:
-            mat_out = out_dir / f"{base}_matrices.json"
-            with open(mat_out, "w", encoding="utf-8") as f:
-                json.dump(matrix_data, f, indent=2)
-            generated["matrices_json"] = mat_out
+            pending.append((
+                "matrices_json",
+                out_dir / f"{base}_matrices.json",
+                encode_json(matrix_data, indent=indent),
+            ))
 
-    return generated
+    return pending
+
+
+def _pack_matrices(matrix_data: Dict[str, Any]) -> Tuple[Optional[bytes], Dict[str, Any]]:
+    """Pack numeric matrices into compressed float32 .npz bytes.
+
+    Returns:
+        Tuple of (npz_bytes, remaining) where npz_bytes is None if no value
+        could be converted, and remaining holds the values that were not.
+
+    Raises:
+        RuntimeError: If numpy is not installed.
+    """
+    # numpy is only needed for this opt-in path, so it is imported lazily
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise RuntimeError(
+            "Binary matrices require numpy. Install with: pip install numpy"
+        ) from e
+
+    arrays = {}
+    remaining: Dict[str, Any] = {}
+    for key, value in matrix_data.items():
+        try:
+            array = np.asarray(value, dtype=np.float32)
+        except (TypeError, ValueError):
+            # Ragged or non-numeric values stay in the JSON artifact
+            array = None
+        if array is None or array.ndim == 0:
+            remaining[key] = value
+        else:
+            arrays[key] = array
+
+    if not arrays:
+        return None, remaining
+    buf = io.BytesIO()
+    np.savez_compressed(buf, **arrays)
+    return buf.getvalue(), remaining
@@ -9,43 +9,135 @@ Example:
     >>> yaml_payload = load_payload_from_yaml(Path("input.yaml"))
 """
 
+import copy
+import re
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader
+
+# Prediction parameters read from YAML configs, with their defaults
+_PARAM_DEFAULTS = MappingProxyType({
+    "recycling_steps": 3,
+    "sampling_steps": 50,
+    "diffusion_samples": 1,
+    "step_scale": 1.638,
+    "without_potentials": False,
+    "output_format": "mmcif",
+    "concatenate_msas": False,
+    "sampling_steps_affinity": 200,
+    "diffusion_samples_affinity": 5,
+    "affinity_mw_correction": False,
+})
+_PARAM_KEYS = frozenset(_PARAM_DEFAULTS)
+
+# Cheap client-side input checks, so malformed inputs fail immediately
+# instead of after a full API round trip. Sequences are uppercased first,
+# so lowercase input keeps working as it did before the check existed
+_PROTEIN_RE = re.compile(r"[A-Z]+")
+_SMILES_RE = re.compile(r"[A-Za-z0-9@+\-\[\]()=#$%.:*/\\]+")
+
+
+def _normalize_protein_sequence(sequence: str) -> str:
+    """Return sequence uppercased, or raise ValueError unless it is one-letter amino acid codes."""
+    if isinstance(sequence, str):
+        normalized = sequence.upper()
+        if _PROTEIN_RE.fullmatch(normalized):
+            return normalized
+    raise ValueError(
+        f"Invalid protein sequence {sequence!r}: expected one-letter amino "
+        "acid codes"
+    )
+
+
+def _check_smiles(smiles: str) -> None:
+    """Raise ValueError if smiles contains characters SMILES never uses."""
+    if not isinstance(smiles, str) or not _SMILES_RE.fullmatch(smiles):
+        raise ValueError(f"Invalid ligand SMILES {smiles!r}")
+
 
 def extract_metadata_name(yaml_path: Path) -> Optional[str]:
     """Extract the metadata name from a YAML configuration file.
 
     Looks for the `meta.name` field in the YAML file. This is useful for
     determining the output folder name based on the user's specified name
-    rather than the filename.
+    rather than the filename. The lookup shares the load_payload_and_meta
+    memo, so a later load of the same unchanged file does not re-parse it.
+    The name is returned even if the rest of the config would fail payload
+    validation.
 
     Args:
         yaml_path: Path to the YAML configuration file.
 
     Returns:
-        The metadata name if found, otherwise None.
+        The metadata name if found, otherwise None. None is also returned
+        if the file cannot be read or is not valid YAML.
 
     Example:
         >>> name = extract_metadata_name(Path("protein_ligand.yaml"))
         >>> print(name)
         'prod-PDE3A-ensifentrine'
     """
-    yaml_path = Path(yaml_path)
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        if config and isinstance(config, dict):
-            meta = config.get("meta", {})
-            if isinstance(meta, dict):
-                return meta.get("name")
-    except Exception:
-        pass
+        return _load_payload_and_meta_cached(*file_identity(Path(yaml_path)))[1]
+    except (OSError, yaml.YAMLError):
+        return None
+
+
+def _metadata_name(config: Any) -> Optional[str]:
+    """Return ``meta.name`` from a parsed YAML config, if present."""
+    if config and isinstance(config, dict):
+        meta = config.get("meta", {})
+        if isinstance(meta, dict):
+            return meta.get("name")
     return None
 
 
+def file_identity(yaml_path: Path) -> Tuple[str, int, int]:
+    """Return the key identifying one version of a YAML file.
+
+    The key is what load_payload_and_meta memoizes on. Callers that also
+    need it for their own bookkeeping (such as the on-disk YAML cache) can
+    compute it once and pass it to load_payload_and_meta_for_identity.
+
+    Args:
+        yaml_path: Path to the YAML configuration file.
+
+    Returns:
+        Tuple of (resolved path, mtime_ns, size).
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+
+    Example:
+        >>> identity = file_identity(Path("protein_ligand.yaml"))
+    """
+    st = yaml_path.stat()
+    return str(yaml_path.resolve()), st.st_mtime_ns, st.st_size
+
+
+def _check_yaml_config(config: Any, path_str: str) -> Dict[str, Any]:
+    """Return a parsed YAML config after checking it is a mapping.
+
+    Raises:
+        ValueError: If the YAML file is empty or doesn't contain a mapping
+            at the root level.
+    """
+    if config is None:
+        raise ValueError(f"YAML file is empty or invalid: {path_str}")
+    if not isinstance(config, dict):
+        raise ValueError(f"YAML root must be a mapping/dictionary: {path_str}")
+    return config
+
+
 def load_payload_from_yaml(yaml_path: Path) -> Dict[str, Any]:
     """Load a Boltz-2 payload from a YAML file.
 
@@ -56,6 +148,7 @@ def load_payload_from_yaml(yaml_path: Path) -> Dict[str, Any]:
         Dictionary suitable for the Boltz-2 API request.
 
     Raises:
+        FileNotFoundError: If the file doesn't exist.
         ValueError: If the YAML file is empty, invalid, or doesn't
             contain a mapping at the root level.
 
@@ -64,16 +157,142 @@ def load_payload_from_yaml(yaml_path: Path) -> Dict[str, Any]:
         >>> "polymers" in payload
         True
     """
-    yaml_path = Path(yaml_path)
-    with open(yaml_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    return load_payload_and_meta(yaml_path)[0]
 
-    if config is None:
-        raise ValueError(f"YAML file is empty or invalid: {yaml_path}")
-    if not isinstance(config, dict):
-        raise ValueError(f"YAML root must be a mapping/dictionary: {yaml_path}")
 
-    return build_payload_from_config(config)
+def load_payload_and_meta(yaml_path: Path) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Load a Boltz-2 payload and its metadata name with a single parse.
+
+    Equivalent to calling load_payload_from_yaml and extract_metadata_name,
+    but the YAML file is parsed once. Results are memoized per path,
+    modification time and size, so reloading an unchanged file in the same
+    process does not parse it again.
+
+    Args:
+        yaml_path: Path to the YAML configuration file.
+
+    Returns:
+        Tuple of (payload, meta_name) where meta_name is None if the YAML
+        has no ``meta.name`` field. The payload is a fresh copy that the
+        caller may modify.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        ValueError: If the YAML file is empty, invalid, or doesn't
+            contain a mapping at the root level.
+
+    Example:
+        >>> payload, name = load_payload_and_meta(Path("protein_ligand.yaml"))
+        >>> name
+        'prod-PDE3A-ensifentrine'
+    """
+    return load_payload_and_meta_for_identity(file_identity(Path(yaml_path)))
+
+
+def load_payload_and_meta_for_identity(
+    identity: Tuple[str, int, int],
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Load a payload and its metadata name for a key from file_identity.
+
+    Behaves like load_payload_and_meta without stat-ing or resolving the
+    file again.
+
+    Args:
+        identity: Key returned by file_identity for the YAML file.
+
+    Returns:
+        Tuple of (payload, meta_name), as for load_payload_and_meta. The
+        payload is a fresh copy that the caller may modify.
+
+    Raises:
+        ValueError: If the YAML file is empty, invalid, or doesn't
+            contain a mapping at the root level.
+
+    Example:
+        >>> payload, name = load_payload_and_meta_for_identity(identity)
+    """
+    payload, meta_name, error = _load_payload_and_meta_cached(*identity)
+    if error is not None:
+        raise ValueError(error)
+    return copy.deepcopy(payload), meta_name
+
+
+@lru_cache(maxsize=256)
+def _load_payload_and_meta_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+    """Memoized worker for load_payload_and_meta, keyed on file identity.
+
+    Returns (payload, meta_name, error). A ValueError from checking or
+    building the payload is kept as its message instead of being raised,
+    so extract_metadata_name still sees ``meta.name`` for such a config.
+    """
+    # Bytes are handed to the loader as-is; it detects the encoding itself,
+    # which saves a separate decoding pass in text mode
+    with open(path_str, "rb") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    meta_name = _metadata_name(config)
+    try:
+        payload = build_payload_from_config(_check_yaml_config(config, path_str))
+    except ValueError as e:
+        return None, meta_name, str(e)
+    return payload, meta_name, None
+
+
+def _add_protein(
+    protein: Dict[str, Any], polymers: List[Dict[str, Any]], ligands: List[Dict[str, Any]]
+) -> None:
+    """Append a YAML protein entry to the payload polymers."""
+    polymers.append({
+        "molecule_type": "protein",
+        "sequence": _normalize_protein_sequence(protein.get("sequence", "")),
+        "cyclic": protein.get("cyclic", False),
+    })
+
+
+def _add_rna(
+    rna: Dict[str, Any], polymers: List[Dict[str, Any]], ligands: List[Dict[str, Any]]
+) -> None:
+    """Append a YAML RNA entry to the payload polymers."""
+    polymers.append({
+        "molecule_type": "rna",
+        "sequence": rna.get("sequence", ""),
+    })
+
+
+def _add_dna(
+    dna: Dict[str, Any], polymers: List[Dict[str, Any]], ligands: List[Dict[str, Any]]
+) -> None:
+    """Append a YAML DNA entry to the payload polymers."""
+    polymers.append({
+        "molecule_type": "dna",
+        "sequence": dna.get("sequence", ""),
+    })
+
+
+def _add_ligand(
+    lig: Dict[str, Any], polymers: List[Dict[str, Any]], ligands: List[Dict[str, Any]]
+) -> None:
+    """Append a YAML ligand entry to the payload ligands."""
+    ligand_entry: Dict[str, Any] = {
+        "name": lig.get("id", lig.get("name", "ligand")),
+    }
+    if "smiles" in lig:
+        _check_smiles(lig["smiles"])
+        ligand_entry["smiles"] = lig["smiles"]
+    elif "ccd" in lig:
+        ligand_entry["ccd"] = lig["ccd"]
+    ligands.append(ligand_entry)
+
+
+# Handlers for the entries of a YAML ``sequences`` list, in priority order
+_SEQUENCE_HANDLERS = {
+    "protein": _add_protein,
+    "rna": _add_rna,
+    "dna": _add_dna,
+    "ligand": _add_ligand,
+}
 
 
 def build_payload_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -88,7 +307,13 @@ def build_payload_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
 
     Returns:
         Complete payload dictionary ready for API request, with 'polymers'
-        and 'ligands' lists plus prediction parameters.
+        and 'ligands' lists plus prediction parameters. A list with no
+        entries is omitted rather than sent empty. Protein sequences are
+        uppercased.
+
+    Raises:
+        ValueError: If a protein sequence is not one-letter amino acid codes
+            or a ligand SMILES string contains invalid characters.
 
     Example:
         >>> config = {"sequences": [{"protein": {"sequence": "MKTAY"}}]}
@@ -104,57 +329,21 @@ def build_payload_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
     ligands: List[Dict[str, Any]] = []
 
     for seq_item in sequences:
-        if "protein" in seq_item:
-            protein = seq_item["protein"]
-            polymers.append({
-                "molecule_type": "protein",
-                "sequence": protein.get("sequence", ""),
-                "cyclic": protein.get("cyclic", False),
-            })
-        elif "rna" in seq_item:
-            rna = seq_item["rna"]
-            polymers.append({
-                "molecule_type": "rna",
-                "sequence": rna.get("sequence", ""),
-            })
-        elif "dna" in seq_item:
-            dna = seq_item["dna"]
-            polymers.append({
-                "molecule_type": "dna",
-                "sequence": dna.get("sequence", ""),
-            })
-        elif "ligand" in seq_item:
-            lig = seq_item["ligand"]
-            ligand_entry: Dict[str, Any] = {
-                "name": lig.get("id", lig.get("name", "ligand")),
-            }
-            if "smiles" in lig:
-                ligand_entry["smiles"] = lig["smiles"]
-            elif "ccd" in lig:
-                ligand_entry["ccd"] = lig["ccd"]
-            ligands.append(ligand_entry)
+        # Handlers are tried in priority order; the first kind present wins
+        for kind, handler in _SEQUENCE_HANDLERS.items():
+            if kind in seq_item:
+                handler(seq_item[kind], polymers, ligands)
+                break
 
     if polymers:
         payload["polymers"] = polymers
     if ligands:
         payload["ligands"] = ligands
 
-    # Add optional parameters with defaults
-    param_defaults = {
-        "recycling_steps": 3,
-        "sampling_steps": 50,
-        "diffusion_samples": 1,
-        "step_scale": 1.638,
-        "without_potentials": False,
-        "output_format": "mmcif",
-        "concatenate_msas": False,
-        "sampling_steps_affinity": 200,
-        "diffusion_samples_affinity": 5,
-        "affinity_mw_correction": False,
-    }
-
-    for param, default in param_defaults.items():
-        payload[param] = config.get(param, default)
+    # Add optional parameters, overriding the defaults with any set in config
+    payload.update(_PARAM_DEFAULTS)
+    for param in _PARAM_KEYS & config.keys():
+        payload[param] = config[param]
 
     return payload
 
@@ -199,11 +388,19 @@ def build_payload(
     Returns:
         Complete payload dictionary ready for API request.
 
+    Raises:
+        ValueError: If the sequence is not one-letter amino acid codes
+            (either case; it is sent uppercased) or the SMILES string
+            contains invalid characters.
+
     Example:
         >>> payload = build_payload("MKTAYIAK", "CCO", ligand_name="ethanol")
         >>> payload["polymers"][0]["sequence"]
         'MKTAYIAK'
     """
+    sequence = _normalize_protein_sequence(sequence)
+    _check_smiles(ligand_smiles)
+
     payload = {
         "polymers": [
             {
@@ -266,11 +463,17 @@ def build_protein_only_payload(
     Returns:
         Complete payload dictionary ready for API request.
 
+    Raises:
+        ValueError: If the sequence is not one-letter amino acid codes
+            (either case; it is sent uppercased).
+
     Example:
         >>> payload = build_protein_only_payload("MKTAYIAK")
         >>> len(payload["polymers"])
         1
     """
+    sequence = _normalize_protein_sequence(sequence)
+
     payload = {
         "polymers": [
             {
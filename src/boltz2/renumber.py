@@ -11,13 +11,32 @@ Example:
     >>> renumber_pdb(Path("input.pdb"), 100, Path("output.pdb"), chain_id="A")
 """
 
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
 
 from boltz2.logging_config import get_logger
 
 logger = get_logger("renumber")
 
+# One mmCIF field: a quoted string running to its closing quote (or to the
+# end of the line if unterminated), or a run of characters other than space
+# and tab
+_FIELD_RE = re.compile(r'''"[^"]*"?|'[^']*'?|[^ \t]+''')
+
 
 def find_field_positions(line: str) -> List[Tuple[int, int, str]]:
     """Find the start position, end position, and value of each whitespace-separated field.
@@ -35,45 +54,38 @@ def find_field_positions(line: str) -> List[Tuple[int, int, str]]:
         >>> fields[0]
         (0, 4, 'ATOM')
     """
-    fields = []
-    i = 0
-    while i < len(line):
-        # Skip whitespace
-        while i < len(line) and line[i] in " \t":
-            i += 1
-        if i >= len(line):
-            break
+    if '"' in line or "'" in line:
+        return [(m.start(), m.end(), m.group()) for m in _FIELD_RE.finditer(line)]
 
-        # Found start of field
-        start = i
-
-        # Handle quoted strings
-        if line[i] in "\"'":
-            quote_char = line[i]
-            i += 1
-            while i < len(line) and line[i] != quote_char:
-                i += 1
-            if i < len(line):
-                i += 1  # Include closing quote
+    # Without quotes every field is a run of non-separator characters, so
+    # a C-level split on single spaces recovers them; each empty part marks
+    # one extra separator
+    fields = []
+    pos = 0
+    for part in line.replace("\t", " ").split(" "):
+        if part:
+            end = pos + len(part)
+            fields.append((pos, end, part))
+            pos = end + 1
         else:
-            # Regular field - find end
-            while i < len(line) and line[i] not in " \t":
-                i += 1
-
-        end = i
-        value = line[start:end]
-        fields.append((start, end, value))
-
+            pos += 1
     return fields
 
 
-def replace_field_preserve_format(line: str, field_idx: int, new_value: str) -> str:
+def replace_field_preserve_format(
+    line: str,
+    field_idx: int,
+    new_value: str,
+    fields: Optional[List[Tuple[int, int, str]]] = None,
+) -> str:
     """Replace a field in a line while preserving surrounding whitespace.
 
     Args:
         line: Original line of text.
         field_idx: 0-based index of the field to replace.
         new_value: New value to insert.
+        fields: Field positions of line from find_field_positions, if the
+            caller already has them. Defaults to None (tokenize the line).
 
     Returns:
         Modified line with field replaced.
@@ -82,7 +94,8 @@ def replace_field_preserve_format(line: str, field_idx: int, new_value: str) ->
         >>> replace_field_preserve_format("ATOM 1 CA", 1, "100")
         'ATOM 100 CA'
     """
-    fields = find_field_positions(line)
+    if fields is None:
+        fields = find_field_positions(line)
     if field_idx >= len(fields):
         return line
 
@@ -92,6 +105,387 @@ def replace_field_preserve_format(line: str, field_idx: int, new_value: str) ->
     return line[:start] + new_value + line[end:]
 
 
+# ASCII line breaks str.splitlines() honours but bytes.splitlines() does not
+_EXTRA_LINE_BREAKS = (b"\v", b"\f", b"\x1c", b"\x1d", b"\x1e")
+
+# Number of leading characters detect_file_format inspects
+_DETECT_HEAD_CHARS = 65536
+
+# Loop sections renumbered by renumber_mmcif besides _atom_site, in the
+# order their rows are processed: header prefix -> (chain ID column,
+# sequence-number columns). A None chain column means the section is
+# renumbered regardless of the chain filter.
+_LOOP_SECTIONS: Dict[str, Tuple[Optional[str], Tuple[str, ...]]] = {
+    "_pdbx_poly_seq_scheme.": ("asym_id", ("seq_id", "pdb_seq_num", "auth_seq_num")),
+    "_entity_poly_seq.": (None, ("num",)),
+    "_ma_qa_metric_local.": ("label_asym_id", ("label_seq_id",)),
+}
+
+# Loop header prefixes handled by renumber_mmcif
+_SECTION_PREFIXES = ("_atom_site.",) + tuple(_LOOP_SECTIONS)
+_SECTION_MARKERS = tuple(prefix.encode("ascii") for prefix in _SECTION_PREFIXES)
+
+# Block size for scanning and copying mmCIF files that need no renumbering
+_BLOCK_SIZE = 1 << 20
+
+# Line boundaries str.splitlines() honours besides "\n" and "\r", which
+# universal-newline reading already turns into "\n"
+_LINE_BREAK_TABLE = {ord(ch): "\n" for ch in "\v\f\x1c\x1d\x1e\x85\u2028\u2029"}
+
+
+def _atom_site_indices(
+    columns: List[str],
+) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
+    """Resolve the _atom_site columns used for renumbering.
+
+    Args:
+        columns: _atom_site column names, in header order.
+
+    Returns:
+        Indices of the group_PDB, label_seq_id, auth_seq_id, and
+        label_asym_id columns; None for any that are absent.
+    """
+    col_idx = {name: idx for idx, name in enumerate(columns)}
+    return (
+        col_idx.get("group_PDB"),
+        col_idx.get("label_seq_id"),
+        col_idx.get("auth_seq_id"),
+        col_idx.get("label_asym_id"),
+    )
+
+
+def _renumber_atom_site_row(
+    line: str,
+    n_columns: int,
+    indices: Tuple[Optional[int], Optional[int], Optional[int], Optional[int]],
+    chain_id: Optional[str],
+    offset: int,
+    shifted: Dict[str, str],
+) -> str:
+    """Renumber one _atom_site data row.
+
+    The row is tokenized once with both sequence-number edits spliced in
+    together. HETATM rows, rows outside the chain filter, and rows that do
+    not match the column layout are returned unchanged.
+
+    Args:
+        line: Non-blank data line following the _atom_site column headers
+            that does not start with an underscore.
+        n_columns: Number of _atom_site columns.
+        indices: Column indices from _atom_site_indices.
+        chain_id: Optional chain ID (label_asym_id) to restrict renumbering.
+        offset: Amount to add to each sequence number.
+        shifted: Cache of already renumbered values, see _shift_value.
+
+    Returns:
+        The renumbered row.
+    """
+    fields = find_field_positions(line)
+    if len(fields) < n_columns:
+        return line
+
+    group_pdb_idx, label_seq_idx, auth_seq_idx, label_asym_idx = indices
+
+    # Skip HETATM records
+    if group_pdb_idx is not None and fields[group_pdb_idx][2] == "HETATM":
+        return line
+
+    # Check chain filter
+    if chain_id is not None:
+        current_chain = fields[label_asym_idx][2] if label_asym_idx is not None else None
+        if current_chain != chain_id:
+            return line
+
+    # (start, end, new_value) edits; a failed label_seq_id parse leaves
+    # the row untouched, a failed auth_seq_id parse keeps the label edit
+    edits = []
+    try:
+        if label_seq_idx is not None and fields[label_seq_idx][2] != ".":
+            start, end, value = fields[label_seq_idx]
+            edits.append((start, end, _shift_value(value, offset, shifted)))
+        if auth_seq_idx is not None and fields[auth_seq_idx][2] != "?":
+            start, end, value = fields[auth_seq_idx]
+            edits.append((start, end, _shift_value(value, offset, shifted)))
+    except ValueError:
+        pass
+
+    return _splice_fields(line, edits) if edits else line
+
+
+def _shift_value(value: str, offset: int, shifted: Dict[str, str]) -> str:
+    """Add offset to a sequence-number field, memoizing the result.
+
+    Every atom of a residue carries the same number, so most rows repeat a
+    value already seen; the cache turns the int parse, add, and format into
+    one dict lookup.
+
+    Raises:
+        ValueError: If value is not an integer.
+    """
+    new_value = shifted.get(value)
+    if new_value is None:
+        new_value = shifted[value] = str(int(value) + offset)
+    return new_value
+
+
+def _splice_fields(line: str, edits: List[Tuple[int, int, str]]) -> str:
+    """Apply (start, end, new_value) field edits to a line in one pass."""
+    if len(edits) == 1:
+        start, end, new_value = edits[0]
+        return f"{line[:start]}{new_value}{line[end:]}"
+
+    edits.sort()
+    segments = []
+    pos = 0
+    for start, end, new_value in edits:
+        segments.append(line[pos:start])
+        segments.append(new_value)
+        pos = end
+    segments.append(line[pos:])
+    return "".join(segments)
+
+
+def _renumber_loop_row(
+    line: str,
+    n_columns: int,
+    chain_idx: Optional[int],
+    seq_indices: List[int],
+    chain_id: Optional[str],
+    offset: int,
+    shifted: Dict[str, str],
+) -> str:
+    """Shift the sequence-number fields of one loop data row.
+
+    The row is tokenized once and all edits are spliced in together. Rows
+    with fewer fields than columns, rows outside the chain filter, and rows
+    with a non-numeric sequence number are returned unchanged; ``.`` and
+    ``?`` values are left as they are.
+
+    Args:
+        line: Data row.
+        n_columns: Number of columns in the loop header.
+        chain_idx: Index of the chain ID column, or None if there is none.
+        seq_indices: Indices of the sequence-number columns to shift.
+        chain_id: Optional chain ID to restrict renumbering.
+        offset: Amount to add to each sequence number.
+        shifted: Cache of already renumbered values, see _shift_value.
+
+    Returns:
+        The renumbered row.
+    """
+    fields = find_field_positions(line)
+    if len(fields) < n_columns:
+        return line
+
+    if chain_id is not None:
+        current_chain = fields[chain_idx][2] if chain_idx is not None else None
+        if current_chain != chain_id:
+            return line
+
+    edits = []
+    for idx in seq_indices:
+        start, end, value = fields[idx]
+        if value in (".", "?"):
+            continue
+        try:
+            edits.append((start, end, _shift_value(value, offset, shifted)))
+        except ValueError:
+            return line
+    return _splice_fields(line, edits) if edits else line
+
+
+def _column_index(columns: List[str], name: str) -> Optional[int]:
+    """Return the index of a loop column, or None if it is absent."""
+    return columns.index(name) if name in columns else None
+
+
+def _column_indices(columns: List[str], names: Tuple[str, ...]) -> List[int]:
+    """Return the indices of the named loop columns that are present."""
+    return [columns.index(name) for name in names if name in columns]
+
+
+def _section_row_handler(
+    prefix: str,
+    columns: List[str],
+    chain_id: Optional[str],
+    offset: int,
+    shifted: Dict[str, str],
+) -> Callable[[str], str]:
+    """Build the data-row renumbering function for a loop section.
+
+    Column indices are resolved once here, when the section's header ends,
+    and captured by the returned closure.
+
+    Args:
+        prefix: Header prefix of the section, one of _SECTION_PREFIXES.
+        columns: Column names of the section, in header order.
+        chain_id: Optional chain ID to restrict renumbering.
+        offset: Amount to add to each sequence number.
+        shifted: Cache of already renumbered values, see _shift_value.
+
+    Returns:
+        Function mapping a data row to its renumbered form.
+    """
+    n_columns = len(columns)
+
+    if prefix == "_atom_site.":
+        indices = _atom_site_indices(columns)
+
+        def renumber_atom_site_row(line: str) -> str:
+            return _renumber_atom_site_row(line, n_columns, indices, chain_id, offset, shifted)
+
+        return renumber_atom_site_row
+
+    chain_column, seq_columns = _LOOP_SECTIONS[prefix]
+    chain_idx = _column_index(columns, chain_column) if chain_column else None
+    seq_indices = _column_indices(columns, seq_columns)
+    row_chain_id = chain_id if chain_column else None
+
+    def renumber_loop_row(line: str) -> str:
+        return _renumber_loop_row(
+            line, n_columns, chain_idx, seq_indices, row_chain_id, offset, shifted
+        )
+
+    return renumber_loop_row
+
+
+def _iter_lines(f: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a text stream without line endings.
+
+    Matches str.splitlines() on the whole text, including its extra line
+    boundaries such as form feeds, without holding the text in memory.
+    """
+    for raw in f:
+        yield from raw.splitlines()
+
+
+def _file_contains_any(path: Path, markers: Tuple[bytes, ...]) -> bool:
+    """Check whether a file contains any of the given byte strings.
+
+    The file is scanned in blocks, stopping at the first match.
+    """
+    overlap = max(len(marker) for marker in markers) - 1
+    tail = b""
+    with path.open("rb") as f:
+        while True:
+            block = f.read(_BLOCK_SIZE)
+            if not block:
+                return False
+            window = tail + block
+            if any(marker in window for marker in markers):
+                return True
+            tail = window[-overlap:]
+
+
+def _copy_lines(source: TextIO, fout: TextIO) -> None:
+    """Copy a text stream as renumber_mmcif would write it unchanged.
+
+    Every line boundary becomes a newline and the final one is dropped,
+    the same as joining the stream's splitlines() with newlines.
+    """
+    pending = ""
+    while True:
+        block = source.read(_BLOCK_SIZE)
+        if not block:
+            break
+        block = block.translate(_LINE_BREAK_TABLE)
+        fout.write(pending)
+        # Hold back a trailing newline until we know it is not the last
+        if block.endswith("\n"):
+            fout.write(block[:-1])
+            pending = "\n"
+        else:
+            fout.write(block)
+            pending = ""
+
+
+def _renumber_mmcif_lines(
+    source: TextIO,
+    fout: TextIO,
+    chain_id: Optional[str],
+    offset: int,
+) -> None:
+    """Renumber an mmCIF text stream line by line.
+
+    Args:
+        source: Input text stream.
+        fout: Output text stream. Lines are joined with newlines, with no
+            trailing newline.
+        chain_id: Optional chain ID to renumber.
+        offset: Amount to add to each sequence number.
+    """
+    shifted: Dict[str, str] = {}
+
+    # Loop header currently being read and its column names so far
+    header_prefix: Optional[str] = None
+    header_columns: List[str] = []
+
+    # _atom_site rows run until the next header or loop boundary; the other
+    # sections stay active until a loop boundary, keyed by header prefix
+    in_atom_site = False
+    atom_site_row: Callable[[str], str] = str
+    loop_rows: Dict[str, Callable[[str], str]] = {}
+    active_loop_rows: List[Callable[[str], str]] = []
+
+    sep = ""
+    for line in _iter_lines(source):
+        stripped = line.strip()
+
+        # Classify the line once: only lines starting with "_", "#"
+        # or "l" can open a header or end a loop
+        first = stripped[:1]
+        if first == "_":
+            is_section = stripped.startswith(_SECTION_PREFIXES)
+            is_boundary = False
+        elif first == "#" or first == "l":
+            is_section = False
+            is_boundary = stripped == "#" or stripped.startswith("loop_")
+        else:
+            is_section = is_boundary = False
+
+        # A line outside the current header ends it
+        if header_prefix is not None and not stripped.startswith(header_prefix):
+            handler = _section_row_handler(
+                header_prefix, header_columns, chain_id, offset, shifted
+            )
+            if header_prefix == "_atom_site.":
+                atom_site_row = handler
+                in_atom_site = True
+            else:
+                loop_rows[header_prefix] = handler
+                active_loop_rows = [
+                    loop_rows[prefix] for prefix in _LOOP_SECTIONS if prefix in loop_rows
+                ]
+            header_prefix = None
+
+        if header_prefix is not None:
+            header_columns.append(stripped.split(".")[1])
+        elif in_atom_site and not (is_section or is_boundary):
+            if first and first != "_":
+                line = atom_site_row(line)
+        else:
+            in_atom_site = False
+
+            # Start of a loop header we renumber
+            if is_section:
+                header_prefix = stripped[: stripped.index(".") + 1]
+                header_columns = [stripped.split(".")[1]]
+
+            # End of any loop section
+            elif is_boundary:
+                loop_rows.clear()
+                active_loop_rows = []
+
+            # Process loop data rows
+            elif first and first != "_":
+                for loop_row in active_loop_rows:
+                    line = loop_row(line)
+
+        fout.write(sep)
+        fout.write(line)
+        sep = "\n"
+
+
 def renumber_mmcif(
     input_path: Path,
     start_residue: int,
@@ -125,248 +519,22 @@ def renumber_mmcif(
         ...     chain_id="A"
         ... )
     """
-    text = input_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    output_lines = []
-
-    # Track which section we're in
-    in_atom_site = False
-    in_poly_seq_scheme = False
-    in_entity_poly_seq = False
-    in_ma_qa_metric_local = False
-    atom_site_columns: List[str] = []
-    poly_seq_scheme_columns: List[str] = []
-    entity_poly_seq_columns: List[str] = []
-    ma_qa_metric_local_columns: List[str] = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Detect start of _atom_site loop
-        if line.strip().startswith("_atom_site."):
-            atom_site_columns = []
-            while i < len(lines) and lines[i].strip().startswith("_atom_site."):
-                col_name = lines[i].strip().split(".")[1]
-                atom_site_columns.append(col_name)
-                output_lines.append(lines[i])
-                i += 1
-            in_atom_site = True
-            continue
-
-        # Detect start of _pdbx_poly_seq_scheme loop
-        if line.strip().startswith("_pdbx_poly_seq_scheme."):
-            poly_seq_scheme_columns = []
-            while i < len(lines) and lines[i].strip().startswith(
-                "_pdbx_poly_seq_scheme."
-            ):
-                col_name = lines[i].strip().split(".")[1]
-                poly_seq_scheme_columns.append(col_name)
-                output_lines.append(lines[i])
-                i += 1
-            in_poly_seq_scheme = True
-            continue
-
-        # Detect start of _entity_poly_seq loop
-        if line.strip().startswith("_entity_poly_seq."):
-            entity_poly_seq_columns = []
-            while i < len(lines) and lines[i].strip().startswith("_entity_poly_seq."):
-                col_name = lines[i].strip().split(".")[1]
-                entity_poly_seq_columns.append(col_name)
-                output_lines.append(lines[i])
-                i += 1
-            in_entity_poly_seq = True
-            continue
+    has_sections = _file_contains_any(input_path, _SECTION_MARKERS)
 
-        # Detect start of _ma_qa_metric_local loop (QA/pLDDT scores)
-        if line.strip().startswith("_ma_qa_metric_local."):
-            ma_qa_metric_local_columns = []
-            while i < len(lines) and lines[i].strip().startswith(
-                "_ma_qa_metric_local."
-            ):
-                col_name = lines[i].strip().split(".")[1]
-                ma_qa_metric_local_columns.append(col_name)
-                output_lines.append(lines[i])
-                i += 1
-            in_ma_qa_metric_local = True
-            continue
+    with input_path.open("r", encoding="utf-8") as fin:
+        source: TextIO = fin
+        # Renumbering in place must read everything before truncating
+        if output_path.exists() and input_path.samefile(output_path):
+            source = io.StringIO(fin.read())
 
-        # End of any loop section
-        if line.strip() == "#" or line.strip().startswith("loop_"):
-            in_atom_site = False
-            in_poly_seq_scheme = False
-            in_entity_poly_seq = False
-            in_ma_qa_metric_local = False
-            output_lines.append(line)
-            i += 1
-            continue
+        with output_path.open("w", encoding="utf-8") as fout:
+            if has_sections:
+                _renumber_mmcif_lines(source, fout, chain_id, start_residue - 1)
+            else:
+                # Nothing to renumber; copy the text through in blocks
+                _copy_lines(source, fout)
 
-        # Process atom_site data
-        if in_atom_site and line.strip() and not line.strip().startswith("_"):
-            fields = find_field_positions(line)
-            parts = [f[2] for f in fields]
-            if len(parts) >= len(atom_site_columns):
-                try:
-                    group_pdb_idx = (
-                        atom_site_columns.index("group_PDB")
-                        if "group_PDB" in atom_site_columns
-                        else None
-                    )
-                    label_seq_idx = (
-                        atom_site_columns.index("label_seq_id")
-                        if "label_seq_id" in atom_site_columns
-                        else None
-                    )
-                    auth_seq_idx = (
-                        atom_site_columns.index("auth_seq_id")
-                        if "auth_seq_id" in atom_site_columns
-                        else None
-                    )
-                    label_asym_idx = (
-                        atom_site_columns.index("label_asym_id")
-                        if "label_asym_id" in atom_site_columns
-                        else None
-                    )
-
-                    # Skip HETATM records
-                    record_type = (
-                        parts[group_pdb_idx] if group_pdb_idx is not None else None
-                    )
-                    if record_type == "HETATM":
-                        output_lines.append(line)
-                        i += 1
-                        continue
-
-                    # Check chain filter
-                    current_chain = (
-                        parts[label_asym_idx] if label_asym_idx is not None else None
-                    )
-                    if chain_id is None or current_chain == chain_id:
-                        if label_seq_idx is not None and parts[label_seq_idx] != ".":
-                            old_num = int(parts[label_seq_idx])
-                            new_num = old_num + start_residue - 1
-                            line = replace_field_preserve_format(
-                                line, label_seq_idx, str(new_num)
-                            )
-                            fields = find_field_positions(line)
-                            parts = [f[2] for f in fields]
-
-                        if auth_seq_idx is not None and parts[auth_seq_idx] != "?":
-                            old_num = int(parts[auth_seq_idx])
-                            new_num = old_num + start_residue - 1
-                            line = replace_field_preserve_format(
-                                line, auth_seq_idx, str(new_num)
-                            )
-
-                except (ValueError, IndexError):
-                    pass
-
-        # Process pdbx_poly_seq_scheme data
-        if in_poly_seq_scheme and line.strip() and not line.strip().startswith("_"):
-            fields = find_field_positions(line)
-            parts = [f[2] for f in fields]
-            if len(parts) >= len(poly_seq_scheme_columns):
-                try:
-                    asym_idx = (
-                        poly_seq_scheme_columns.index("asym_id")
-                        if "asym_id" in poly_seq_scheme_columns
-                        else None
-                    )
-                    seq_id_idx = (
-                        poly_seq_scheme_columns.index("seq_id")
-                        if "seq_id" in poly_seq_scheme_columns
-                        else None
-                    )
-                    pdb_seq_num_idx = (
-                        poly_seq_scheme_columns.index("pdb_seq_num")
-                        if "pdb_seq_num" in poly_seq_scheme_columns
-                        else None
-                    )
-                    auth_seq_num_idx = (
-                        poly_seq_scheme_columns.index("auth_seq_num")
-                        if "auth_seq_num" in poly_seq_scheme_columns
-                        else None
-                    )
-
-                    current_chain = parts[asym_idx] if asym_idx is not None else None
-                    if chain_id is None or current_chain == chain_id:
-                        indices_to_update = []
-                        for idx in [seq_id_idx, pdb_seq_num_idx, auth_seq_num_idx]:
-                            if idx is not None and parts[idx] not in (".", "?"):
-                                old_num = int(parts[idx])
-                                new_num = old_num + start_residue - 1
-                                indices_to_update.append((idx, str(new_num)))
-
-                        for idx, new_val in sorted(
-                            indices_to_update, key=lambda x: x[0], reverse=True
-                        ):
-                            line = replace_field_preserve_format(line, idx, new_val)
-
-                except (ValueError, IndexError):
-                    pass
-
-        # Process entity_poly_seq data
-        if in_entity_poly_seq and line.strip() and not line.strip().startswith("_"):
-            fields = find_field_positions(line)
-            parts = [f[2] for f in fields]
-            if len(parts) >= len(entity_poly_seq_columns):
-                try:
-                    num_idx = (
-                        entity_poly_seq_columns.index("num")
-                        if "num" in entity_poly_seq_columns
-                        else None
-                    )
-                    if num_idx is not None and parts[num_idx] not in (".", "?"):
-                        old_num = int(parts[num_idx])
-                        new_num = old_num + start_residue - 1
-                        line = replace_field_preserve_format(line, num_idx, str(new_num))
-
-                except (ValueError, IndexError):
-                    pass
-
-        # Process ma_qa_metric_local data
-        if (
-            in_ma_qa_metric_local
-            and line.strip()
-            and not line.strip().startswith("_")
-        ):
-            fields = find_field_positions(line)
-            parts = [f[2] for f in fields]
-            if len(parts) >= len(ma_qa_metric_local_columns):
-                try:
-                    label_asym_idx = (
-                        ma_qa_metric_local_columns.index("label_asym_id")
-                        if "label_asym_id" in ma_qa_metric_local_columns
-                        else None
-                    )
-                    label_seq_idx = (
-                        ma_qa_metric_local_columns.index("label_seq_id")
-                        if "label_seq_id" in ma_qa_metric_local_columns
-                        else None
-                    )
-
-                    current_chain = (
-                        parts[label_asym_idx] if label_asym_idx is not None else None
-                    )
-                    if chain_id is None or current_chain == chain_id:
-                        if (
-                            label_seq_idx is not None
-                            and parts[label_seq_idx] not in (".", "?")
-                        ):
-                            old_num = int(parts[label_seq_idx])
-                            new_num = old_num + start_residue - 1
-                            line = replace_field_preserve_format(
-                                line, label_seq_idx, str(new_num)
-                            )
-
-                except (ValueError, IndexError):
-                    pass
-
-        output_lines.append(line)
-        i += 1
-
-    output_path.write_text("\n".join(output_lines), encoding="utf-8")
-    logger.info(f"Renumbered mmCIF saved to: {output_path}")
+    logger.info("Renumbered mmCIF saved to: %s", output_path)
 
 
 def renumber_pdb(
@@ -396,7 +564,38 @@ def renumber_pdb(
         ...     chain_id="A"
         ... )
     """
-    text = input_path.read_text(encoding="utf-8")
+    raw = input_path.read_bytes()
+    offset = start_residue - 1
+
+    # Plain ASCII files are renumbered as bytes, skipping the decode and
+    # re-encode; anything else goes through the text path
+    if raw.isascii() and not any(ch in raw for ch in _EXTRA_LINE_BREAKS):
+        chain = chain_id.encode("utf-8") if chain_id is not None else None
+        # Residue-number field -> renumbered field; consecutive atoms of a
+        # residue share the field, so most rows skip the parse and format.
+        # Non-numeric fields map to themselves and are left as they are.
+        shifted: Dict[bytes, bytes] = {}
+        output = []
+        for line in raw.splitlines():
+            if line.startswith((b"ATOM", b"TER", b"ANISOU")) and len(line) >= 26:
+                current_chain = line[21:22]
+                if chain is None or current_chain == chain or current_chain == b" ":
+                    field = line[22:26]
+                    new_field = shifted.get(field)
+                    if new_field is None:
+                        try:
+                            new_field = b"%4d" % (int(field) + offset)
+                        except ValueError:
+                            new_field = field
+                        shifted[field] = new_field
+                    if new_field is not field:
+                        line = line[:22] + new_field + line[26:]
+            output.append(line)
+        output_path.write_bytes(b"\n".join(output))
+        logger.info("Renumbered PDB saved to: %s", output_path)
+        return
+
+    text = raw.decode("utf-8")
     lines = text.splitlines()
     output_lines = []
 
@@ -422,13 +621,14 @@ def renumber_pdb(
         output_lines.append(line)
 
     output_path.write_text("\n".join(output_lines), encoding="utf-8")
-    logger.info(f"Renumbered PDB saved to: {output_path}")
+    logger.info("Renumbered PDB saved to: %s", output_path)
 
 
 def detect_file_format(path: Path) -> str:
     """Detect whether a file is mmCIF or PDB format.
 
-    Uses content-based detection first, then falls back to file extension.
+    Uses content-based detection on the start of the file first, then
+    falls back to file extension.
 
     Args:
         path: Path to structure file.
@@ -440,10 +640,13 @@ def detect_file_format(path: Path) -> str:
         >>> detect_file_format(Path("structure.cif"))
         'mmcif'
     """
-    text = path.read_text(encoding="utf-8")
+    # The markers sit at the top of the file, so there is no need to read
+    # (or decode) a large structure in full
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        text = f.read(_DETECT_HEAD_CHARS)
     if "data_" in text or "_atom_site." in text:
         return "mmcif"
-    elif text.strip().startswith(
+    elif text.lstrip().startswith(
         ("ATOM", "HETATM", "HEADER", "TITLE", "REMARK", "CRYST")
     ):
         return "pdb"
@@ -512,3 +715,74 @@ def renumber_structure(
         renumber_pdb(input_path, start_residue, output_path, chain_id)
 
     return output_path
+
+
+def _renumber_structure_job(
+    job: Tuple[Path, int, Optional[Path], Optional[str], str],
+) -> Path:
+    """Renumber one file; module-level so worker processes can unpickle it."""
+    input_path, start_residue, output_path, chain_id, file_format = job
+    return renumber_structure(input_path, start_residue, output_path, chain_id, file_format)
+
+
+def renumber_structures(
+    input_paths: Sequence[Path],
+    start_residue: int,
+    output_dir: Optional[Path] = None,
+    chain_id: Optional[str] = None,
+    file_format: str = "auto",
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """Renumber residues in several structure files in parallel.
+
+    Renumbering is CPU-bound and files are independent, so each file is
+    handled by renumber_structure in a separate worker process.
+
+    Args:
+        input_paths: Paths to input structure files.
+        start_residue: Starting residue number (the number that residue 1
+            should become).
+        output_dir: Directory for the outputs, each named like its input
+            with "_renumbered" appended. Created if missing. If None, each
+            output is written next to its input.
+        chain_id: Optional chain ID to renumber. If None, all chains are
+            renumbered.
+        file_format: File format, one of "mmcif", "pdb", or "auto".
+            Defaults to "auto" (auto-detect each file).
+        max_workers: Maximum number of worker processes. Defaults to None
+            (one per CPU). With 1 or fewer, or a single input, files are
+            renumbered in the calling process.
+
+    Returns:
+        Paths to the output files, in the same order as input_paths.
+
+    Raises:
+        FileNotFoundError: If an input file doesn't exist.
+
+    Example:
+        >>> outputs = renumber_structures(
+        ...     sorted(Path("predictions").glob("*.mmcif")),
+        ...     start_residue=672,
+        ...     output_dir=Path("renumbered"),
+        ... )
+    """
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for input_path in input_paths:
+        input_path = Path(input_path)
+        output_path = None
+        if output_dir is not None:
+            output_path = output_dir / f"{input_path.stem}_renumbered{input_path.suffix}"
+        jobs.append((input_path, start_residue, output_path, chain_id, file_format))
+
+    if len(jobs) <= 1 or (max_workers is not None and max_workers <= 1):
+        return [_renumber_structure_job(job) for job in jobs]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    logger.debug("Renumbering %d files on %d processes", len(jobs), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_renumber_structure_job, jobs))
+
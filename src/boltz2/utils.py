@@ -9,8 +9,16 @@ Example:
     >>> run_name = generate_run_name(output_name="my_experiment")
 """
 
-from datetime import datetime
-from typing import Optional
+import re
+import time
+from typing import Optional, Tuple
+
+# Characters sanitize_name drops. Unicode \w is exactly str.isalnum() plus
+# the underscore, so Unicode letters and digits are kept
+_UNSAFE_RE = re.compile(r"[^\w.-]")
+
+# (epoch second, formatted timestamp) of the last generate_timestamp call
+_last_timestamp: Tuple[int, str] = (-1, "")
 
 
 def sanitize_name(name: str) -> str:
@@ -29,14 +37,15 @@ def sanitize_name(name: str) -> str:
         >>> sanitize_name("My Protein (v2)")
         'My_Protein_v2'
     """
-    safe = str(name).strip().replace(" ", "_")
-    safe = "".join(ch for ch in safe if (ch.isalnum() or ch in "-_."))
-    return safe
+    return _UNSAFE_RE.sub("", str(name).strip().replace(" ", "_"))
 
 
 def generate_timestamp() -> str:
     """Generate a UTC timestamp string for filenames.
 
+    The formatted string is reused for calls within the same second, as
+    happens when a batch creates many run directories at once.
+
     Returns:
         Timestamp in ISO-like format: YYYYMMDDTHHMMSSZ.
 
@@ -45,7 +54,13 @@ def generate_timestamp() -> str:
         >>> len(ts)
         16
     """
-    return datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    global _last_timestamp
+    now = int(time.time())
+    second, formatted = _last_timestamp
+    if second != now:
+        formatted = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(now))
+        _last_timestamp = (now, formatted)
+    return formatted
 
 
 def generate_run_name(prefix: str = "boltz2", output_name: Optional[str] = None) -> str:
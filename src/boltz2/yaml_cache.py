@@ -0,0 +1,111 @@
+"""On-disk cache for payloads parsed from YAML input files.
+
+Batch runs over a stable inputs directory re-parse the same YAML files on
+every invocation. This module caches the built payload together with the
+``meta.name`` field, keyed by the file's path, modification time, and size
+plus the package version, so unchanged inputs skip YAML parsing entirely
+and an upgrade never serves payloads built by an older release.
+
+Example:
+    >>> from boltz2.yaml_cache import load_payload_from_yaml_cached
+    >>> payload, meta_name = load_payload_from_yaml_cached(Path("input.yaml"))
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from boltz2 import __version__
+from boltz2.io import atomic_write_json
+from boltz2.logging_config import get_logger
+from boltz2.payload import file_identity, load_payload_and_meta, load_payload_and_meta_for_identity
+
+logger = get_logger("yaml_cache")
+
+
+def _default_cache_dir() -> Path:
+    """Return the per-user cache directory for parsed YAML payloads.
+
+    Returns:
+        ``$XDG_CACHE_HOME/boltz2/yaml``, or ``~/.cache/boltz2/yaml`` when
+        XDG_CACHE_HOME is unset.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "boltz2" / "yaml"
+
+
+def _cache_key(identity: Tuple[str, int, int]) -> str:
+    """Build a cache key from a file identity and the package version.
+
+    Args:
+        identity: The (resolved path, mtime_ns, size) tuple of the YAML file.
+
+    Returns:
+        Hex digest identifying this version of the file.
+    """
+    path_str, mtime_ns, size = identity
+    raw = f"{__version__}|{path_str}|{mtime_ns}|{size}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_payload_from_yaml_cached(
+    yaml_path: Path,
+    cache_dir: Optional[Path] = None,
+    use_cache: bool = True,
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Load a payload and its metadata name, using the on-disk cache.
+
+    On a cache miss the payload comes from the in-process
+    load_payload_and_meta memo, and the result is stored as JSON. Any
+    error while reading or writing the cache falls back to parsing the file.
+
+    Args:
+        yaml_path: Path to the YAML configuration file.
+        cache_dir: Directory for cache entries. Defaults to
+            ``$XDG_CACHE_HOME/boltz2/yaml`` (``~/.cache/boltz2/yaml``),
+            created readable by the current user only.
+        use_cache: If False, parse the file directly without reading or
+            writing any cache entry.
+
+    Returns:
+        Tuple of (payload, meta_name) where meta_name is None if the YAML
+        has no ``meta.name`` field.
+
+    Raises:
+        ValueError: If the YAML file is empty, invalid, or doesn't
+            contain a mapping at the root level.
+
+    Example:
+        >>> payload, name = load_payload_from_yaml_cached(Path("input.yaml"))
+        >>> "polymers" in payload
+        True
+    """
+    yaml_path = Path(yaml_path)
+    if not use_cache:
+        return load_payload_and_meta(yaml_path)
+
+    cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+    # Stat and resolve once; the same identity keys both the on-disk entry
+    # and the in-process memo
+    identity = file_identity(yaml_path)
+    cache_file = cache_dir / f"{_cache_key(identity)}.json"
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        logger.debug("YAML cache hit for %s", yaml_path)
+        return entry["payload"], entry["meta_name"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    payload, meta_name = load_payload_and_meta_for_identity(identity)
+
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        atomic_write_json(cache_file, {"payload": payload, "meta_name": meta_name})
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not write YAML cache entry for %s: %s", yaml_path, e)
+
+    return payload, meta_name
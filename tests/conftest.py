@@ -0,0 +1,32 @@
+"""Shared pytest fixtures for the boltz2 tests."""
+
+from typing import Any
+
+import pytest
+
+
+def _assert_subset(actual: Any, expected: Any, path: str = "value") -> None:
+    """Assert that expected is a subtree of actual.
+
+    Dicts may carry extra keys; lists must match element by element.
+    """
+    if isinstance(expected, dict):
+        assert isinstance(actual, dict), f"{path}: expected a dict, got {actual!r}"
+        for key, value in expected.items():
+            assert key in actual, f"{path}: missing key {key!r}"
+            _assert_subset(actual[key], value, f"{path}[{key!r}]")
+    elif isinstance(expected, list):
+        assert isinstance(actual, list), f"{path}: expected a list, got {actual!r}"
+        assert len(actual) == len(expected), (
+            f"{path}: expected {len(expected)} items, got {len(actual)}"
+        )
+        for idx, (item, expected_item) in enumerate(zip(actual, expected)):
+            _assert_subset(item, expected_item, f"{path}[{idx}]")
+    else:
+        assert actual == expected, f"{path}: {actual!r} != {expected!r}"
+
+
+@pytest.fixture
+def assert_subset():
+    """Recursive subset check for nested payload dicts and lists."""
+    return _assert_subset
@@ -0,0 +1,129 @@
+"""Tests for boltz2.async_client module."""
+
+import asyncio
+import io
+import json
+
+import pytest
+import requests
+
+from boltz2.async_client import AsyncBoltz2Client, run
+
+
+RESPONSE = {"structures": [{"structure": "data_one\nATOM 1 CA", "format": "mmcif"}] * 2}
+
+
+def _fake_response(body: bytes, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = AsyncBoltz2Client(api_key="nvapi-test", max_connections=2)
+    body = json.dumps(RESPONSE).encode("utf-8")
+    monkeypatch.setattr(client.client._session, "post", lambda *a, **kw: _fake_response(body))
+    return client
+
+
+class TestAsyncBoltz2Client:
+    def test_predict(self, client):
+        assert asyncio.run(client.predict({"polymers": []})) == RESPONSE
+
+    def test_generate_many_keeps_order(self, client, tmp_path):
+        specs = [
+            {"sequence": "ACDE", "ligand_smiles": "CCO", "output_dir": tmp_path, "output_name": name}
+            for name in ("a", "b", "c")
+        ]
+
+        async def run():
+            async with client:
+                return await client.generate_many(specs)
+
+        results = asyncio.run(run())
+
+        assert [r["name"] for r in results] == ["a", "b", "c"]
+        assert all(len(r["mmcifs"]) == 2 for r in results)
+
+    def test_generate_many_returns_exceptions(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            client.client._session, "post", lambda *a, **kw: _fake_response(b"busy", status=400)
+        )
+        specs = [{"sequence": "ACDE", "ligand_smiles": "CCO", "output_dir": tmp_path}]
+
+        results = asyncio.run(client.generate_many(specs, return_exceptions=True))
+
+        assert isinstance(results[0], RuntimeError)
+
+    def test_client_is_reusable_across_event_loops(self, client, tmp_path):
+        # Three specs over two connections makes the semaphore wait, which
+        # binds it to the running loop
+        def specs(run):
+            return [
+                {"sequence": "ACDE", "ligand_smiles": "CCO", "output_dir": tmp_path, "output_name": f"{run}{i}"}
+                for i in range(3)
+            ]
+
+        first = asyncio.run(client.generate_many(specs("a")))
+        second = asyncio.run(client.generate_many(specs("b")))
+
+        assert len(first) == len(second) == 3
+
+    def test_generate_from_payload_passes_full_response(self, client, tmp_path):
+        payload = {"polymers": [{"molecule_type": "protein", "sequence": "ACDE"}]}
+
+        result = asyncio.run(
+            client.generate_from_payload(payload, output_dir=tmp_path, full_response=False)
+        )
+
+        assert result["response"] is None
+        assert len(result["mmcifs"]) == 2
+
+
+class TestRun:
+    async def _answer(self):
+        await asyncio.sleep(0)
+        return 42
+
+    def test_without_uvloop(self, monkeypatch):
+        monkeypatch.setattr("boltz2.async_client.uvloop", None)
+        assert run(self._answer()) == 42
+
+    def test_uses_uvloop_loop_factory(self, monkeypatch):
+        created = []
+
+        class FakeUvloop:
+            @staticmethod
+            def new_event_loop():
+                loop = asyncio.new_event_loop()
+                created.append(loop)
+                return loop
+
+        monkeypatch.setattr("boltz2.async_client.uvloop", FakeUvloop)
+        assert run(self._answer()) == 42
+        assert len(created) == 1 and created[0].is_closed()
+
+    def test_uvloop_branch_cancels_leftover_tasks(self, monkeypatch):
+        class FakeUvloop:
+            new_event_loop = staticmethod(asyncio.new_event_loop)
+
+        monkeypatch.setattr("boltz2.async_client.uvloop", FakeUvloop)
+        cancelled = []
+
+        async def background():
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def main():
+            asyncio.ensure_future(background())
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            run(main())
+        assert cancelled == [True]
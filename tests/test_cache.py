@@ -0,0 +1,91 @@
+"""Tests for boltz2.cache module."""
+
+import io
+import json
+import os
+import time
+
+import requests
+
+import pytest
+
+from boltz2.cache import PredictionCache
+from boltz2.client import Boltz2Client
+
+URL = "https://example.invalid/predict"
+
+
+class TestPredictionCache:
+    def test_key_ignores_dict_order(self):
+        assert PredictionCache.key(URL, {"a": 1, "b": 2}) == PredictionCache.key(URL, {"b": 2, "a": 1})
+
+    def test_key_depends_on_endpoint(self):
+        assert PredictionCache.key(URL, {"a": 1}) != PredictionCache.key(URL + "2", {"a": 1})
+
+    def test_put_then_get(self, tmp_path):
+        cache = PredictionCache(tmp_path)
+        assert cache.get(URL, {"a": 1}) is None
+
+        cache.put_bytes(URL, {"a": 1}, b'{"ok": true}')
+
+        assert cache.get(URL, {"a": 1}).read_bytes() == b'{"ok": true}'
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = PredictionCache(tmp_path, ttl=60)
+        cache.put_bytes(URL, {"a": 1}, b"{}")
+        path = cache.get(URL, {"a": 1})
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        assert cache.get(URL, {"a": 1}) is None
+
+
+def _counting_post(calls, body):
+    def post(*args, **kwargs):
+        calls.append(1)
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(body)
+        return response
+
+    return post
+
+
+class TestClientCache:
+    def test_second_call_skips_network(self, tmp_path, monkeypatch):
+        calls = []
+        post = _counting_post(calls, json.dumps({"structures": []}).encode())
+
+        with Boltz2Client(api_key="nvapi-test", cache_dir=tmp_path / "cache") as client:
+            monkeypatch.setattr(client._session, "post", post)
+            first = client.predict_to_file({"polymers": []}, tmp_path / "a.json")
+            second = client.predict_to_file({"polymers": []}, tmp_path / "b.json")
+            client.predict({"polymers": []}, no_cache=True)
+
+        assert first == second == {"structures": []}
+        assert (tmp_path / "b.json").read_bytes() == (tmp_path / "a.json").read_bytes()
+        assert len(calls) == 2
+
+    def test_invalid_body_is_not_cached_by_predict(self, tmp_path, monkeypatch):
+        calls = []
+
+        with Boltz2Client(api_key="nvapi-test", cache_dir=tmp_path / "cache") as client:
+            monkeypatch.setattr(client._session, "post", _counting_post(calls, b"<html>gateway</html>"))
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    client.predict({"polymers": []})
+
+        assert len(calls) == 2
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_truncated_download_is_not_cached(self, tmp_path, monkeypatch):
+        calls = []
+
+        with Boltz2Client(api_key="nvapi-test", cache_dir=tmp_path / "cache") as client:
+            monkeypatch.setattr(client._session, "post", _counting_post(calls, b'{"structures": ['))
+            for name in ("a.json", "b.json"):
+                with pytest.raises(ValueError):
+                    client.predict_to_file({"polymers": []}, tmp_path / name)
+
+        assert len(calls) == 2
+        assert not list((tmp_path / "cache").glob("*.json"))
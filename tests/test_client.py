@@ -0,0 +1,200 @@
+"""Tests for boltz2.client module."""
+
+import io
+import json
+import tarfile
+
+import pytest
+import requests
+
+from boltz2.client import Boltz2Client
+
+
+RESPONSE = {
+    "structures": [
+        {"structure": "data_one\nATOM 1 CA", "format": "mmcif"},
+        {"structure": "data_two\nATOM 1 CA", "format": "mmcif"},
+    ],
+    "confidence_scores": [0.9, 0.8],
+}
+
+
+def _fake_response(body: bytes, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = Boltz2Client(api_key="nvapi-test")
+    body = json.dumps(RESPONSE).encode("utf-8")
+    monkeypatch.setattr(client._session, "post", lambda *a, **kw: _fake_response(body))
+    yield client
+    client.close()
+
+
+class TestSession:
+    def test_session_is_reused_across_requests(self):
+        client = Boltz2Client(api_key="nvapi-test")
+        session = client._session
+        assert client._session is session
+        client.close()
+
+    def test_https_adapter_has_retries(self):
+        client = Boltz2Client(api_key="nvapi-test")
+        adapter = client._session.get_adapter("https://health.api.nvidia.com/")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 429 in adapter.max_retries.status_forcelist
+        client.close()
+
+    def test_post_is_only_retried_on_rate_limit(self):
+        client = Boltz2Client(api_key="nvapi-test")
+        retry = client._session.get_adapter("https://health.api.nvidia.com/").max_retries
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 503)
+        assert retry.is_retry("GET", 503)
+        client.close()
+
+    def test_post_is_not_retried_after_read_error(self):
+        from urllib3.exceptions import ReadTimeoutError
+
+        client = Boltz2Client(api_key="nvapi-test")
+        retry = client._session.get_adapter("https://health.api.nvidia.com/").max_retries
+        with pytest.raises(ReadTimeoutError):
+            retry.increment(method="POST", error=ReadTimeoutError(None, "/", "timed out"))
+        client.close()
+
+    def test_session_carries_auth_headers(self):
+        with Boltz2Client(api_key="nvapi-test") as client:
+            assert client._session.headers["Authorization"] == "Bearer nvapi-test"
+
+    def test_session_accepts_compressed_responses(self):
+        with Boltz2Client(api_key="nvapi-test") as client:
+            assert "gzip" in client._session.headers["accept-encoding"]
+
+    def test_context_manager_closes_session(self, monkeypatch):
+        closed = []
+        with Boltz2Client(api_key="nvapi-test") as client:
+            monkeypatch.setattr(client._session, "close", lambda: closed.append(True))
+        assert closed == [True]
+
+    def test_pool_size_follows_max_connections(self):
+        with Boltz2Client(api_key="nvapi-test", max_connections=32) as client:
+            adapter = client._session.get_adapter("https://health.api.nvidia.com/")
+            assert adapter._pool_maxsize == 32
+
+
+class TestPredictToFile:
+    def test_streams_raw_body_to_disk(self, client, tmp_path):
+        json_path = tmp_path / "run.json"
+        result = client.predict_to_file({"polymers": []}, json_path)
+
+        assert result == RESPONSE
+        assert json_path.read_bytes() == json.dumps(RESPONSE).encode("utf-8")
+
+    def test_error_raises_without_writing(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            client._session, "post",
+            lambda *a, **kw: _fake_response(b'{"detail": "bad"}', status=422),
+        )
+        json_path = tmp_path / "run.json"
+
+        with pytest.raises(RuntimeError, match="422"):
+            client.predict_to_file({"polymers": []}, json_path)
+        assert not json_path.exists()
+
+    def test_interrupted_stream_leaves_no_file(self, client, tmp_path, monkeypatch):
+        def broken_stream(*args, **kwargs):
+            yield b'{"structures": ['
+            raise requests.exceptions.ChunkedEncodingError("connection dropped")
+
+        response = _fake_response(b"")
+        monkeypatch.setattr(response, "iter_content", broken_stream)
+        monkeypatch.setattr(client._session, "post", lambda *a, **kw: response)
+        json_path = tmp_path / "run.json"
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.predict_to_file({"polymers": []}, json_path)
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestGenerateFromPayload:
+    def test_saves_numbered_samples(self, client, tmp_path):
+        result = client.generate_from_payload(
+            {"polymers": []}, output_dir=tmp_path, output_name="run"
+        )
+
+        assert [p.name for p in result["mmcifs"]] == ["run_1.mmcif", "run_2.mmcif"]
+        assert result["mmcifs"][1].read_text(encoding="utf-8") == "data_two\nATOM 1 CA"
+        assert result["json"] == tmp_path / "run" / "run.json"
+        assert result["response"] == RESPONSE
+
+    def test_without_full_response(self, client, tmp_path):
+        result = client.generate_from_payload(
+            {"polymers": []}, output_dir=tmp_path, output_name="run", full_response=False
+        )
+
+        assert result["response"] is None
+        assert [p.read_text(encoding="utf-8") for p in result["mmcifs"]] == [
+            "data_one\nATOM 1 CA",
+            "data_two\nATOM 1 CA",
+        ]
+
+    def test_split_outputs_per_sample(self, client, tmp_path):
+        result = client.generate_from_payload(
+            {"polymers": []}, output_dir=tmp_path, output_name="run", split_outputs=True
+        )
+
+        sample = result["artifacts"]["sample_2"]
+        assert sample["mmcif"] == result["mmcifs"][1]
+        assert sample["protein_mmcif"].read_text(encoding="utf-8") == "data_two\nATOM 1 CA"
+
+
+    def test_bundle_outputs_writes_single_archive(self, client, tmp_path):
+        client.bundle_outputs = True
+        result = client.generate_from_payload(
+            {"polymers": []}, output_dir=tmp_path, output_name="run", split_outputs=True
+        )
+
+        run_dir = tmp_path / "run"
+        assert result["bundle"] == run_dir / "run.mmcif.tar"
+        assert not result["mmcifs"][0].exists()
+        with tarfile.open(result["bundle"]) as tar:
+            names = tar.getnames()
+            assert tar.extractfile("run_2.mmcif").read() == b"data_two\nATOM 1 CA"
+        assert "run_1.mmcif" in names
+        assert result["artifacts"]["sample_2"]["protein_mmcif"].name in names
+
+class TestGenerateFromPayloads:
+    def test_results_follow_input_order(self, client, tmp_path):
+        results = client.generate_from_payloads(
+            [{"polymers": []}] * 3,
+            output_dir=tmp_path,
+            output_names=["a", "b", "c"],
+            max_workers=3,
+        )
+
+        assert [r["name"] for r in results] == ["a", "b", "c"]
+
+    def test_failure_is_returned_not_raised(self, client, tmp_path, monkeypatch):
+        def post(*args, **kwargs):
+            if json.loads(kwargs["data"]).get("fail"):
+                return _fake_response(b"bad request", status=400)
+            return _fake_response(json.dumps(RESPONSE).encode("utf-8"))
+
+        monkeypatch.setattr(client._session, "post", post)
+        results = client.generate_from_payloads(
+            [{"fail": True}, {"polymers": []}],
+            output_dir=tmp_path,
+            output_names=["bad", "good"],
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1]["name"] == "good"
+
+    def test_mismatched_names_raise(self, client, tmp_path):
+        with pytest.raises(ValueError):
+            client.generate_from_payloads([{}], output_dir=tmp_path, output_names=[])
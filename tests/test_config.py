@@ -0,0 +1,71 @@
+"""Tests for boltz2.config module."""
+
+import copy
+import dataclasses
+import pickle
+
+import dotenv
+import pytest
+
+from boltz2 import config as config_module
+from boltz2.config import load_config
+
+
+@pytest.fixture
+def dotenv_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args: calls.append(args))
+    monkeypatch.setattr(config_module, "_dotenv_loaded", False)
+    monkeypatch.delenv("BOLTZ2_API_KEY", raising=False)
+    monkeypatch.delenv("BOLTZ2_API_URL", raising=False)
+    return calls
+
+
+class TestLoadConfig:
+    def test_explicit_values_skip_dotenv(self, dotenv_calls):
+        config = load_config(api_key="nvapi-test", base_url="https://example.invalid")
+        assert config.api_key == "nvapi-test"
+        assert dotenv_calls == []
+
+    def test_default_search_runs_once(self, dotenv_calls):
+        load_config(api_key="nvapi-test")
+        load_config(api_key="nvapi-test")
+        assert dotenv_calls == [()]
+
+    def test_explicit_env_path_is_always_read(self, dotenv_calls, tmp_path):
+        env_path = tmp_path / ".env"
+        load_config(env_path=env_path, api_key="nvapi-test")
+        load_config(env_path=env_path, api_key="nvapi-test")
+        assert dotenv_calls == [(env_path,), (env_path,)]
+
+    def test_missing_key_raises(self, dotenv_calls):
+        with pytest.raises(ValueError, match="BOLTZ2_API_KEY"):
+            load_config()
+
+
+class TestHeaders:
+    def test_headers_are_reused(self):
+        config = load_config(api_key="nvapi-test", base_url="https://example.invalid")
+        config.headers
+        cached = config._headers
+        assert config.headers["Authorization"] == "Bearer nvapi-test"
+        assert config._headers is cached
+
+    def test_headers_follow_api_key(self):
+        config = load_config(api_key="nvapi-test", base_url="https://example.invalid")
+        config.api_key = "nvapi-other"
+        assert config.headers["Authorization"] == "Bearer nvapi-other"
+
+    def test_modifying_returned_headers_does_not_leak(self):
+        config = load_config(api_key="nvapi-test", base_url="https://example.invalid")
+        headers = config.headers
+        headers["accept"] = "text/plain"
+        assert config.headers["accept"] == "application/json"
+
+    def test_config_stays_copyable_after_headers_access(self):
+        config = load_config(api_key="nvapi-test", base_url="https://example.invalid")
+        config.headers
+
+        assert copy.deepcopy(config).headers == config.headers
+        assert pickle.loads(pickle.dumps(config)).api_key == "nvapi-test"
+        assert dataclasses.asdict(config)["api_key"] == "nvapi-test"
@@ -0,0 +1,145 @@
+"""Tests for boltz2.io module."""
+
+import json
+import tarfile
+
+import pytest
+
+from boltz2.io import (
+    atomic_write,
+    atomic_write_json,
+    bundle_output_path,
+    create_run_directory,
+    decode_json,
+    encode_json,
+    find_yaml_files,
+    load_json,
+    mmcif_output_paths,
+    save_json,
+    write_text_bundle,
+    write_text_files,
+)
+
+
+class TestCreateRunDirectory:
+    def test_creates_missing_base_directory(self, tmp_path):
+        run_dir, name = create_run_directory(tmp_path / "a" / "b", "my run")
+        assert name == "my_run"
+        assert run_dir == tmp_path / "a" / "b" / "my_run"
+        assert run_dir.is_dir()
+
+
+class TestFindYamlFiles:
+    def test_finds_nested_yaml_sorted(self, tmp_path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "deep").mkdir(parents=True)
+        (tmp_path / "b" / "two.yaml").write_text("x: 1\n")
+        (tmp_path / "a" / "deep" / "one.yaml").write_text("x: 1\n")
+        (tmp_path / "top.yaml").write_text("x: 1\n")
+        (tmp_path / "notes.txt").write_text("ignored\n")
+        (tmp_path / "other.yml").write_text("ignored\n")
+
+        result = find_yaml_files(tmp_path)
+
+        assert result == sorted(tmp_path.rglob("*.yaml"))
+        assert len(result) == 3
+
+    def test_empty_directory(self, tmp_path):
+        assert find_yaml_files(tmp_path) == []
+
+
+class TestJson:
+    def test_save_and_load_round_trip(self, tmp_path):
+        data = {"scores": [0.9, 0.75], "name": "run", "nested": {"ok": True}}
+        path = save_json(data, tmp_path / "out.json")
+        assert load_json(path) == data
+
+    def test_indent_matches_stdlib(self):
+        data = {"a": [1, 2], "b": {"c": "d"}}
+        assert encode_json(data).decode("utf-8") == json.dumps(data, indent=2)
+
+    def test_invalid_json_raises_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            decode_json(b"{not json")
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr("boltz2.io.orjson", None)
+        data = {"a": [1, 2]}
+        assert decode_json(encode_json(data)) == data
+
+    def test_load_empty_file_raises_decode_error(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(path)
+
+
+class TestAtomicWrite:
+    def test_writes_json(self, tmp_path):
+        path = atomic_write_json(tmp_path / "entry.json", {"a": [1, 2]})
+        assert json.loads(path.read_bytes()) == {"a": [1, 2]}
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_keeps_old_file_and_removes_temp(self, tmp_path):
+        path = tmp_path / "entry.json"
+        path.write_bytes(b"old")
+
+        def fail(f):
+            f.write(b"partial")
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            atomic_write(path, fail)
+
+        assert path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_unserializable_json_raises_type_error(self, tmp_path):
+        with pytest.raises(TypeError):
+            atomic_write_json(tmp_path / "entry.json", {"a": object()})
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestMmcifOutputPaths:
+    def test_single_structure_is_unnumbered(self, tmp_path):
+        assert mmcif_output_paths(tmp_path, "run", 1) == [tmp_path / "run.mmcif"]
+
+    def test_multiple_structures_are_numbered_in_order(self, tmp_path):
+        paths = mmcif_output_paths(tmp_path, "run", 5)
+        assert [p.name for p in paths] == [f"run_{i}.mmcif" for i in range(1, 6)]
+
+    def test_no_structures_still_gets_one_path(self, tmp_path):
+        assert mmcif_output_paths(tmp_path, "run", 0) == [tmp_path / "run.mmcif"]
+
+
+class TestWriteTextFiles:
+    def test_writes_text_and_bytes_in_order(self, tmp_path):
+        files = [
+            (tmp_path / "a.mmcif", "data_a\n"),
+            (tmp_path / "a_confidence.json", b'{\n  "confidence_scores": [0.9]\n}'),
+            (tmp_path / "a_matrices.json", b"{}"),
+        ]
+
+        paths = write_text_files(files)
+
+        assert paths == [path for path, _ in files]
+        assert paths[0].read_bytes() == b"data_a\n"
+        assert json.loads(paths[1].read_bytes()) == {"confidence_scores": [0.9]}
+        assert paths[2].read_bytes() == b"{}"
+
+    def test_single_file_is_written_inline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("boltz2.io.ThreadPoolExecutor", None)
+        assert write_text_files([(tmp_path / "a.json", b"[]")]) == [tmp_path / "a.json"]
+
+
+class TestWriteTextBundle:
+    def test_members_are_written_in_order(self, tmp_path):
+        files = [("run_1.mmcif", "data_one"), ("run_1_confidence.json", b"{}")]
+        bundle = write_text_bundle(bundle_output_path(tmp_path, "run"), files)
+
+        assert bundle == tmp_path / "run.mmcif.tar"
+        with tarfile.open(bundle) as tar:
+            assert tar.getnames() == ["run_1.mmcif", "run_1_confidence.json"]
+            contents = [tar.extractfile(m).read() for m in tar.getmembers()]
+        assert contents == [b"data_one", b"{}"]
+        assert not (tmp_path / "run_1.mmcif").exists()
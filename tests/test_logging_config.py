@@ -0,0 +1,57 @@
+"""Tests for boltz2.logging_config module."""
+
+import importlib
+import io
+import logging
+
+import pytest
+
+import boltz2.logging_config as logging_config
+
+
+@pytest.fixture
+def restore_logger():
+    logger = logging_config.logger
+    handlers, level = list(logger.handlers), logger.level
+    yield logger
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+class TestSetupLogging:
+    def test_same_configuration_keeps_handler(self, restore_logger):
+        stream = io.StringIO()
+        logging_config.setup_logging(level="DEBUG", stream=stream)
+        handler = restore_logger.handlers[0]
+
+        logging_config.setup_logging(level="DEBUG", stream=stream)
+
+        assert restore_logger.handlers == [handler]
+
+    def test_changed_level_replaces_handler(self, restore_logger):
+        stream = io.StringIO()
+        logging_config.setup_logging(level="DEBUG", stream=stream)
+        handler = restore_logger.handlers[0]
+
+        logging_config.setup_logging(level="WARNING", stream=stream)
+
+        assert restore_logger.handlers != [handler]
+        assert restore_logger.level == logging.WARNING
+
+    def test_reload_keeps_user_handlers(self, restore_logger):
+        user_handler = logging.NullHandler()
+        restore_logger.handlers[:] = [user_handler]
+
+        importlib.reload(logging_config)
+
+        assert restore_logger.handlers == [user_handler]
+
+
+class TestConfigureOnce:
+    def test_leaves_global_logging_flags_alone(self, restore_logger, monkeypatch):
+        monkeypatch.setattr(logging_config, "_configured", False)
+        before = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing)
+
+        logging_config.configure_once(level="INFO")
+
+        assert (logging.logThreads, logging.logProcesses, logging.logMultiprocessing) == before
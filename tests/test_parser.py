@@ -1,14 +1,19 @@
 """Tests for boltz2.parser module."""
 
 import json
+import sys
+
 import pytest
 
 from boltz2.parser import (
+    _split_response,
     extract_all_mmcifs,
     extract_confidence_data,
     extract_affinity_data,
     extract_matrix_data,
     split_structure_file,
+    load_mmcifs_from_json,
+    remove_hetatm_lines,
 )
 
 
@@ -55,6 +60,25 @@ class TestExtractAllMmcifs:
         assert len(result) == 1
         assert result[0] == "data_test"
 
+    def test_from_json_bytes(self):
+        response = {"structures": [{"structure": "data_a"}, {"structure": "data_b"}]}
+        assert extract_all_mmcifs(json.dumps(response).encode("utf-8")) == ["data_a", "data_b"]
+
+    def test_json_after_long_leading_whitespace(self):
+        text = " " * 100 + json.dumps({"structures": [{"structure": "data_a"}]})
+        assert extract_all_mmcifs(text) == ["data_a"]
+
+    def test_large_json_is_streamed(self, monkeypatch):
+        monkeypatch.setattr("boltz2.parser.STREAM_THRESHOLD", 0)
+        monkeypatch.setattr("boltz2.parser.decode_json", pytest.fail)
+        response = {"structures": [{"structure": "data_a"}], "pae": [[0.1, 0.2]]}
+        assert extract_all_mmcifs(json.dumps(response)) == ["data_a"]
+
+    def test_large_invalid_json_is_raw_mmcif(self, monkeypatch):
+        monkeypatch.setattr("boltz2.parser.STREAM_THRESHOLD", 0)
+        text = "{not json\ndata_test"
+        assert extract_all_mmcifs(text) == [text]
+
 
 class TestExtractConfidenceData:
     def test_extracts_present_keys(self):
@@ -96,6 +120,43 @@ class TestExtractMatrixData:
         assert "other_key" not in result
 
 
+class TestRemoveHetatmLines:
+    @pytest.mark.parametrize("text", [
+        "",
+        "HETATM 1",
+        "HETATM 1\nHETATM 2\nATOM 3\n",
+        "data_x\nATOM 1\nHETATM 2\n",
+        "data_x\nHETATM 2\n\nATOM 3",
+        "data_x\nATOM 1 HETATM\n\n",
+        "data_x\r\nHETATM 2\r\nATOM 3\r\n",
+        "data_\u00e5\nHETATM 2\nATOM 3\n",
+        "data_x\nATOM 1\nATOM 2\n",
+        "data_x\nATOM 1\nATOM 2",
+    ])
+    def test_matches_line_by_line_filter(self, text):
+        expected = "\n".join(ln for ln in text.splitlines() if not ln.startswith("HETATM"))
+        assert remove_hetatm_lines(text) == expected
+
+
+class TestSplitResponse:
+    def test_matches_individual_extractors(self):
+        response = {
+            "structures": [{"structure": "data_x"}],
+            "complex_iplddt_scores": [0.7],
+            "confidence_scores": [0.9],
+            "affinities": {"L": {"affinity_pic50": [6.1]}},
+            "pair_chains_iptm_scores": [[1.0]],
+            "ptm_scores": None,
+        }
+
+        confidence, affinity, matrices = _split_response(response)
+
+        assert confidence == extract_confidence_data(response)
+        assert affinity == extract_affinity_data(response)
+        assert matrices == extract_matrix_data(response)
+        assert "complex_iplddt_scores" in confidence and "complex_iplddt_scores" in matrices
+
+
 class TestSplitStructureFile:
     def test_mmcif_input_does_not_write_another_full_mmcif(self, tmp_path):
         input_path = tmp_path / "prod-PDE3A-ensifentrine.mmcif"
@@ -113,3 +174,129 @@ class TestSplitStructureFile:
         assert artifacts["protein_mmcif"] == protein_path
         assert protein_path.exists()
         assert "HETATM" not in protein_path.read_text(encoding="utf-8")
+
+
+    @pytest.mark.parametrize("text", [
+        "data_test\nATOM 1 CA\nHETATM 2 C1\nATOM 3 CB\n",
+        "data_test\nHETATM 1 C1\nHETATM 2 C2",
+        "data_test\r\nATOM 1 CA\r\nHETATM 2 C1\r\n",
+        "data_\u00e5\nATOM 1 CA\nHETATM 2 C1\n",
+    ])
+    def test_protein_mmcif_matches_in_memory_filter(self, tmp_path, monkeypatch, text):
+        monkeypatch.setattr("boltz2.parser._STREAM_BLOCK_SIZE", 8)
+        input_path = tmp_path / "run.mmcif"
+        input_path.write_bytes(text.encode("utf-8"))
+
+        artifacts = split_structure_file(input_path)
+
+        protein = artifacts["protein_mmcif"].read_bytes().decode("utf-8")
+        assert protein == remove_hetatm_lines(text.replace("\r\n", "\n"))
+
+    def test_json_sidecar_artifacts(self, tmp_path):
+        input_path = tmp_path / "run.mmcif"
+        input_path.write_text("data_test\nATOM 1 CA ALA A 1\n", encoding="utf-8")
+        response = {
+            "structures": [{"structure": "data_test\nATOM 1 CA ALA A 1\n"}],
+            "confidence_scores": [0.91],
+            "pair_chains_iptm_scores": [[1.0, 0.75], [0.75, 1.0]],
+        }
+        (tmp_path / "run.json").write_text(json.dumps(response), encoding="utf-8")
+
+        artifacts = split_structure_file(input_path)
+
+        confidence = json.loads(artifacts["confidence_json"].read_text(encoding="utf-8"))
+        matrices = json.loads(artifacts["matrices_json"].read_text(encoding="utf-8"))
+        assert confidence == {"confidence_scores": [0.91]}
+        assert matrices == {"pair_chains_iptm_scores": [[1.0, 0.75], [0.75, 1.0]]}
+        assert "affinity_json" not in artifacts
+
+    def test_raw_text_is_cut_at_entry_id(self, tmp_path):
+        input_path = tmp_path / "run.txt"
+        input_path.write_text("header\n_entry.id test\nATOM 1 CA\n", encoding="utf-8")
+
+        artifacts = split_structure_file(input_path)
+
+        assert artifacts["mmcif"].read_text(encoding="utf-8") == "_entry.id test\nATOM 1 CA\n"
+
+    def test_raw_text_without_mmcif_raises(self, tmp_path):
+        input_path = tmp_path / "run.txt"
+        input_path.write_text("nothing here\n", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            split_structure_file(input_path)
+
+    def test_compact_json_artifacts(self, tmp_path):
+        input_path = tmp_path / "run.json"
+        response = {
+            "structures": [{"structure": "data_test\nATOM 1 CA\n"}],
+            "pair_chains_iptm_scores": [[1.0, 0.75], [0.75, 1.0]],
+        }
+        input_path.write_text(json.dumps(response), encoding="utf-8")
+
+        artifacts = split_structure_file(input_path, compact_json=True)
+
+        text = artifacts["matrices_json"].read_text(encoding="utf-8")
+        assert "\n" not in text
+        assert json.loads(text) == {"pair_chains_iptm_scores": [[1.0, 0.75], [0.75, 1.0]]}
+
+    def test_binary_matrices(self, tmp_path):
+        np = pytest.importorskip("numpy")
+        input_path = tmp_path / "run.json"
+        response = {
+            "structures": [{"structure": "data_test\nATOM 1 CA\n"}],
+            "pair_chains_iptm_scores": [[1.0, 0.75], [0.75, 1.0]],
+        }
+        input_path.write_text(json.dumps(response), encoding="utf-8")
+
+        artifacts = split_structure_file(input_path, binary_matrices=True)
+
+        assert "matrices_json" not in artifacts
+        with np.load(artifacts["matrices_npz"]) as npz:
+            matrix = npz["pair_chains_iptm_scores"]
+        assert matrix.dtype == np.float32
+        assert matrix.tolist() == [[1.0, 0.75], [0.75, 1.0]]
+
+    def test_binary_matrices_without_numpy_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        input_path = tmp_path / "run.json"
+        response = {
+            "structures": [{"structure": "data_test\nATOM 1 CA\n"}],
+            "pair_chains_iptm_scores": [[1.0]],
+        }
+        input_path.write_text(json.dumps(response), encoding="utf-8")
+
+        with pytest.raises(RuntimeError, match="numpy"):
+            split_structure_file(input_path, binary_matrices=True)
+
+    def test_sidecar_structure_skips_reading_input(self, tmp_path, monkeypatch):
+        input_path = tmp_path / "run.mmcif"
+        input_path.write_text("data_test\nATOM 1 CA ALA A 1\n", encoding="utf-8")
+        response = {"structures": [{"structure": "data_test\nHETATM 2 C1 LIG L 1\n"}]}
+        (tmp_path / "run.json").write_text(json.dumps(response), encoding="utf-8")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("input file should not be read")
+
+        monkeypatch.setattr(type(input_path), "read_text", fail)
+        artifacts = split_structure_file(input_path)
+        monkeypatch.undo()
+
+        assert artifacts["protein_mmcif"].read_text(encoding="utf-8") == "data_test"
+
+
+class TestLoadMmcifsFromJson:
+    RESPONSE = {
+        "structures": [{"structure": "data_a"}, {"format": "mmcif"}, {"structure": "data_b"}],
+        "pae": [[0.1, 0.2], [0.3, 0.4]],
+    }
+
+    def test_reads_structures(self, tmp_path):
+        path = tmp_path / "run.json"
+        path.write_text(json.dumps(self.RESPONSE), encoding="utf-8")
+        assert load_mmcifs_from_json(path) == ["data_a", "data_b"]
+
+    def test_without_ijson(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("boltz2.parser.ijson", None)
+        path = tmp_path / "run.json"
+        path.write_text(json.dumps(self.RESPONSE), encoding="utf-8")
+        assert load_mmcifs_from_json(path) == ["data_a", "data_b"]
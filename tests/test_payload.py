@@ -1,21 +1,76 @@
 """Tests for boltz2.payload module."""
 
+import copy
+
 import pytest
 
-from boltz2.payload import build_payload, build_protein_only_payload, build_payload_from_config
+import boltz2.payload as payload_module
+from boltz2.payload import (
+    build_payload,
+    build_payload_from_config,
+    build_protein_only_payload,
+    extract_metadata_name,
+    load_payload_and_meta,
+    load_payload_from_yaml,
+)
 
 
-class TestBuildPayload:
-    def test_basic_payload(self):
-        payload = build_payload(
-            sequence="MGDVEKGKKIVGAVIL",
-            ligand_smiles="C1=CC=C(C=C1)C(=O)N",
-        )
+# Shared config inputs; build_payload_from_config does not modify them
+_PROTEIN_LIGAND_CFG = {
+    "sequences": [
+        {"protein": {"id": "A", "sequence": "MGDVEKGKKIVGAVIL"}},
+        {"ligand": {"id": "B", "smiles": "CCO"}},
+    ]
+}
+_PROTEIN_ONLY_CFG = {
+    "sequences": [
+        {"protein": {"id": "A", "sequence": "ACDEF"}},
+    ]
+}
+_MULTI_CHAIN_CFG = {
+    "sequences": [
+        {"protein": {"id": "A", "sequence": "MGDVEK"}},
+        {"protein": {"id": "B", "sequence": "ACDEF"}},
+        {"ligand": {"id": "C", "smiles": "CCO"}},
+    ]
+}
+_CUSTOM_PARAMS_CFG = {
+    "sequences": [
+        {"protein": {"id": "A", "sequence": "ACDEF"}},
+    ],
+    "sampling_steps": 100,
+    "recycling_steps": 5,
+}
+_CCD_CFG = {
+    "sequences": [
+        {"protein": {"id": "A", "sequence": "ACDEF"}},
+        {"ligand": {"id": "B", "ccd": "ATP"}},
+    ]
+}
+
+
+# Payloads are built once per module; tests only read them
+@pytest.fixture(scope="module")
+def protein_ligand_payload():
+    return build_payload(
+        sequence="MGDVEKGKKIVGAVIL",
+        ligand_smiles="C1=CC=C(C=C1)C(=O)N",
+    )
+
+
+@pytest.fixture(scope="module")
+def protein_only_payload():
+    return build_protein_only_payload(sequence="MGDVEKGKKIVGAVIL")
 
-        assert payload["polymers"][0]["sequence"] == "MGDVEKGKKIVGAVIL"
-        assert payload["polymers"][0]["molecule_type"] == "protein"
-        assert payload["ligands"][0]["smiles"] == "C1=CC=C(C=C1)C(=O)N"
-        assert payload["output_format"] == "mmcif"
+
+@pytest.mark.xdist_group(name="payload")
+class TestBuildPayload:
+    def test_basic_payload(self, protein_ligand_payload, assert_subset):
+        assert_subset(protein_ligand_payload, {
+            "polymers": [{"sequence": "MGDVEKGKKIVGAVIL", "molecule_type": "protein"}],
+            "ligands": [{"smiles": "C1=CC=C(C=C1)C(=O)N"}],
+            "output_format": "mmcif",
+        })
 
     def test_custom_ligand_name(self):
         payload = build_payload(
@@ -25,14 +80,14 @@ class TestBuildPayload:
         )
         assert payload["ligands"][0]["name"] == "ethanol"
 
-    def test_overrides(self):
+    def test_overrides(self, assert_subset):
+        overrides = {"sampling_steps": 100, "custom_key": "value"}
         payload = build_payload(
             sequence="ACDEF",
             ligand_smiles="CCO",
-            overrides={"sampling_steps": 100, "custom_key": "value"},
+            overrides=overrides,
         )
-        assert payload["sampling_steps"] == 100
-        assert payload["custom_key"] == "value"
+        assert_subset(payload, overrides)
 
     def test_cyclic_protein(self):
         payload = build_payload(
@@ -42,13 +97,34 @@ class TestBuildPayload:
         )
         assert payload["polymers"][0]["cyclic"] is True
 
+    def test_stereo_smiles_accepted(self):
+        payload = build_payload("ACDEF", r"C[C@H](N)C(=O)O.[Na+]/C=C\C")
+        assert payload["ligands"][0]["smiles"].startswith("C[C@H]")
+
+    @pytest.mark.parametrize("sequence", ["", "ACD EF", "ACD1"])
+    def test_invalid_sequence_raises(self, sequence):
+        with pytest.raises(ValueError, match="protein sequence"):
+            build_payload(sequence, "CCO")
+
+    def test_lowercase_sequence_is_uppercased(self):
+        payload = build_payload("acdef", "CCO")
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+
+    @pytest.mark.parametrize("smiles", ["", "CC O", "CCO;"])
+    def test_invalid_smiles_raises(self, smiles):
+        with pytest.raises(ValueError, match="SMILES"):
+            build_payload("ACDEF", smiles)
+
 
+@pytest.mark.xdist_group(name="payload")
 class TestBuildProteinOnlyPayload:
-    def test_basic_payload(self):
-        payload = build_protein_only_payload(sequence="MGDVEKGKKIVGAVIL")
+    def test_basic_payload(self, protein_only_payload, assert_subset):
+        assert_subset(protein_only_payload, {"polymers": [{"sequence": "MGDVEKGKKIVGAVIL"}]})
+        assert "ligands" not in protein_only_payload
 
-        assert payload["polymers"][0]["sequence"] == "MGDVEKGKKIVGAVIL"
-        assert "ligands" not in payload
+    def test_invalid_sequence_raises(self):
+        with pytest.raises(ValueError):
+            build_protein_only_payload(sequence="ACDEF\n")
 
     def test_overrides(self):
         payload = build_protein_only_payload(
@@ -57,67 +133,178 @@ class TestBuildProteinOnlyPayload:
         )
         assert payload["recycling_steps"] == 5
 
+    def test_parameter_order_and_unknown_keys(self):
+        config = {"affinity_mw_correction": True, "recycling_steps": 5, "unknown": 1}
+        payload = build_payload_from_config(config)
+
+        assert list(payload) == [
+            "recycling_steps",
+            "sampling_steps",
+            "diffusion_samples",
+            "step_scale",
+            "without_potentials",
+            "output_format",
+            "concatenate_msas",
+            "sampling_steps_affinity",
+            "diffusion_samples_affinity",
+            "affinity_mw_correction",
+        ]
+        assert payload["affinity_mw_correction"] is True
+
 
+@pytest.mark.xdist_group(name="payload")
 class TestBuildPayloadFromConfig:
-    def test_protein_ligand_config(self):
-        config = {
-            "sequences": [
-                {"protein": {"id": "A", "sequence": "MGDVEKGKKIVGAVIL"}},
-                {"ligand": {"id": "B", "smiles": "CCO"}},
-            ]
-        }
-        payload = build_payload_from_config(config)
+    def test_protein_ligand_config(self, assert_subset):
+        payload = build_payload_from_config(_PROTEIN_LIGAND_CFG)
 
-        assert len(payload["polymers"]) == 1
-        assert payload["polymers"][0]["sequence"] == "MGDVEKGKKIVGAVIL"
-        assert len(payload["ligands"]) == 1
-        assert payload["ligands"][0]["smiles"] == "CCO"
+        assert_subset(payload, {
+            "polymers": [{"sequence": "MGDVEKGKKIVGAVIL"}],
+            "ligands": [{"smiles": "CCO"}],
+        })
 
     def test_protein_only_config(self):
-        config = {
-            "sequences": [
-                {"protein": {"id": "A", "sequence": "ACDEF"}},
-            ]
-        }
-        payload = build_payload_from_config(config)
+        payload = build_payload_from_config(_PROTEIN_ONLY_CFG)
 
         assert len(payload["polymers"]) == 1
-        assert "ligands" not in payload or len(payload["ligands"]) == 0
+        assert "ligands" not in payload
 
     def test_multi_chain_config(self):
-        config = {
-            "sequences": [
-                {"protein": {"id": "A", "sequence": "MGDVEK"}},
-                {"protein": {"id": "B", "sequence": "ACDEF"}},
-                {"ligand": {"id": "C", "smiles": "CCO"}},
-            ]
-        }
-        payload = build_payload_from_config(config)
+        payload = build_payload_from_config(_MULTI_CHAIN_CFG)
 
         assert len(payload["polymers"]) == 2
         assert len(payload["ligands"]) == 1
 
-    def test_custom_parameters(self):
-        config = {
-            "sequences": [
-                {"protein": {"id": "A", "sequence": "ACDEF"}},
-            ],
-            "sampling_steps": 100,
-            "recycling_steps": 5,
-        }
-        payload = build_payload_from_config(config)
+    def test_custom_parameters(self, assert_subset):
+        payload = build_payload_from_config(_CUSTOM_PARAMS_CFG)
 
-        assert payload["sampling_steps"] == 100
-        assert payload["recycling_steps"] == 5
+        assert_subset(payload, {"sampling_steps": 100, "recycling_steps": 5})
 
     def test_ligand_with_ccd(self):
-        config = {
-            "sequences": [
-                {"protein": {"id": "A", "sequence": "ACDEF"}},
-                {"ligand": {"id": "B", "ccd": "ATP"}},
-            ]
-        }
-        payload = build_payload_from_config(config)
+        payload = build_payload_from_config(_CCD_CFG)
 
         assert payload["ligands"][0]["ccd"] == "ATP"
         assert "smiles" not in payload["ligands"][0]
+
+    def test_config_sequence_is_uppercased(self):
+        config = {"sequences": [{"protein": {"id": "A", "sequence": "acdef"}}]}
+        payload = build_payload_from_config(config)
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+
+    def test_config_invalid_sequence_raises(self):
+        config = {"sequences": [{"protein": {"id": "A", "sequence": "ACD1"}}]}
+        with pytest.raises(ValueError, match="protein sequence"):
+            build_payload_from_config(config)
+
+    def test_config_invalid_smiles_raises(self):
+        config = {"sequences": [{"ligand": {"id": "L", "smiles": "CCO;"}}]}
+        with pytest.raises(ValueError, match="SMILES"):
+            build_payload_from_config(config)
+
+    @pytest.mark.parametrize(
+        "config",
+        [_PROTEIN_LIGAND_CFG, _PROTEIN_ONLY_CFG, _MULTI_CHAIN_CFG, _CUSTOM_PARAMS_CFG, _CCD_CFG],
+    )
+    def test_config_not_mutated(self, config):
+        snapshot = copy.deepcopy(config)
+        build_payload_from_config(config)
+        assert config == snapshot
+
+
+class TestExtractMetadataName:
+    def test_reads_meta_name(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("meta:\n  name: my-run\nsequences: []\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) == "my-run"
+
+    def test_reads_non_ascii_meta_name(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("meta:\n  name: l\u00e4uft\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) == "l\u00e4uft"
+
+    def test_missing_meta_returns_none(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("sequences: []\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert extract_metadata_name(tmp_path / "missing.yaml") is None
+
+    def test_rereads_modified_file(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("meta:\n  name: first\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) == "first"
+
+        yaml_path.write_text("meta:\n  name: second-run\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) == "second-run"
+
+    def test_reads_name_when_payload_is_invalid(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(
+            "meta:\n  name: my_run\nsequences:\n  - protein:\n      sequence: \"MKT AY*\"\n",
+            encoding="utf-8",
+        )
+        assert extract_metadata_name(yaml_path) == "my_run"
+        with pytest.raises(ValueError, match="protein sequence"):
+            load_payload_and_meta(yaml_path)
+
+    def test_invalid_yaml_returns_none(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("meta: [unclosed\n", encoding="utf-8")
+        assert extract_metadata_name(yaml_path) is None
+
+
+class TestLoadPayloadAndMeta:
+    YAML_TEXT = (
+        "meta:\n  name: my-run\n"
+        "sequences:\n  - protein:\n      id: A\n      sequence: ACDEF\n"
+    )
+
+    def test_returns_payload_and_meta(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(self.YAML_TEXT, encoding="utf-8")
+
+        payload, meta_name = load_payload_and_meta(yaml_path)
+
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+        assert meta_name == "my-run"
+
+    def test_returned_payload_is_a_copy(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(self.YAML_TEXT, encoding="utf-8")
+
+        first, _ = load_payload_and_meta(yaml_path)
+        first["polymers"][0]["sequence"] = "MUTATED"
+        second, _ = load_payload_and_meta(yaml_path)
+
+        assert second["polymers"][0]["sequence"] == "ACDEF"
+
+    def test_non_mapping_raises(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text("- just\n- a list\n", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_payload_and_meta(yaml_path)
+
+
+class TestLoadPayloadFromYaml:
+    def test_metadata_lookup_and_load_parse_once(self, tmp_path, monkeypatch):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(
+            "meta:\n  name: once\nsequences:\n  - protein:\n      sequence: ACDEF\n",
+            encoding="utf-8",
+        )
+        calls = []
+        real_load = payload_module.yaml.load
+        monkeypatch.setattr(
+            payload_module.yaml, "load", lambda *a, **kw: calls.append(a) or real_load(*a, **kw)
+        )
+
+        assert extract_metadata_name(yaml_path) == "once"
+        payload = load_payload_from_yaml(yaml_path)
+
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+        assert len(calls) == 1
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_payload_from_yaml(tmp_path / "missing.yaml")
@@ -0,0 +1,34 @@
+"""Tests for scripts/print_subsequence.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "print_subsequence.py"
+
+
+def _run(fasta, *args):
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), str(fasta), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+class TestPrintSubsequence:
+    @pytest.mark.parametrize("index_args", [(), ("--no-index",)])
+    def test_regular_file(self, tmp_path, index_args):
+        fasta = tmp_path / "seq.fasta"
+        fasta.write_bytes(b">a\nACDE\nFGHI\nK\n")
+        assert _run(fasta, "3", "9", *index_args) == "DEFGHIK\n"
+
+    @pytest.mark.parametrize("index_args", [(), ("--no-index",)])
+    def test_trailing_whitespace_is_not_a_residue(self, tmp_path, index_args):
+        fasta = tmp_path / "seq.fasta"
+        fasta.write_bytes(b">a\nACDE \nFGHI\n")
+        assert _run(fasta, "1", "8", *index_args) == "ACDEFGHI\n"
+        assert not (tmp_path / "seq.fasta.fai").exists()
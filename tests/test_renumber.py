@@ -0,0 +1,244 @@
+"""Tests for boltz2.renumber module."""
+
+import pytest
+
+from boltz2.renumber import (
+    detect_file_format,
+    find_field_positions,
+    renumber_mmcif,
+    renumber_pdb,
+    renumber_structures,
+    replace_field_preserve_format,
+)
+
+
+MMCIF_TEXT = """\
+data_model
+#
+loop_
+_entity_poly_seq.entity_id
+_entity_poly_seq.num
+_entity_poly_seq.mon_id
+1 1 MET
+1 2 LYS
+#
+loop_
+_pdbx_poly_seq_scheme.asym_id
+_pdbx_poly_seq_scheme.seq_id
+_pdbx_poly_seq_scheme.pdb_seq_num
+_pdbx_poly_seq_scheme.auth_seq_num
+A 1 1 1
+A 2 2 2
+B 1 1 ?
+#
+loop_
+_atom_site.group_PDB
+_atom_site.id
+_atom_site.label_atom_id
+_atom_site.label_comp_id
+_atom_site.label_asym_id
+_atom_site.label_seq_id
+_atom_site.auth_seq_id
+ATOM   1 N     MET A 1 1
+ATOM   2 "C1'" LYS A 2 2
+ATOM   3 CA    GLY B 1 1
+HETATM 4 C1    LIG C . 1
+#
+loop_
+_ma_qa_metric_local.ordinal_id
+_ma_qa_metric_local.label_asym_id
+_ma_qa_metric_local.label_seq_id
+_ma_qa_metric_local.metric_value
+1 A 1 85.20
+2 B 1 70.00
+#
+"""
+
+PDB_TEXT = """\
+ATOM      1  N   MET A   1      10.000  11.000  12.000  1.00 85.20           N
+TER       2      MET A   1
+ATOM      3  N   GLY B   1      11.000  12.000  13.000  1.00 80.00           N
+HETATM    4  C1  LIG C   1      30.000  31.000  32.000  1.00 60.00           C
+"""
+
+
+def _renumber_mmcif_text(tmp_path, text, start, chain_id=None):
+    input_path = tmp_path / "in.mmcif"
+    output_path = tmp_path / "out.mmcif"
+    input_path.write_text(text, encoding="utf-8")
+    renumber_mmcif(input_path, start, output_path, chain_id)
+    return output_path.read_text(encoding="utf-8").splitlines()
+
+
+class TestFindFieldPositions:
+    def test_quoted_and_unquoted_fields(self):
+        fields = find_field_positions("ATOM\t1 \"C1'\"  'a b'")
+        assert fields == [(0, 4, "ATOM"), (5, 6, "1"), (7, 12, "\"C1'\""), (14, 19, "'a b'")]
+
+    def test_tabs_and_repeated_spaces(self):
+        fields = find_field_positions("  ATOM\t \t1   CA ")
+        assert fields == [(2, 6, "ATOM"), (9, 10, "1"), (13, 15, "CA")]
+
+    def test_unterminated_quote_runs_to_end_of_line(self):
+        assert find_field_positions("A 'b c") == [(0, 1, "A"), (2, 6, "'b c")]
+
+    def test_quote_inside_unquoted_field(self):
+        assert find_field_positions("C1' N") == [(0, 3, "C1'"), (4, 5, "N")]
+
+
+class TestRenumberMmcif:
+    def test_atom_site_renumbered_preserving_format(self, tmp_path):
+        lines = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672)
+        assert "ATOM   1 N     MET A 672 672" in lines
+        assert "ATOM   2 \"C1'\" LYS A 673 673" in lines
+
+    def test_hetatm_untouched(self, tmp_path):
+        lines = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672)
+        assert "HETATM 4 C1    LIG C . 1" in lines
+
+    def test_other_sections_renumbered(self, tmp_path):
+        lines = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672)
+        assert "1 673 LYS" in lines
+        assert "A 673 673 673" in lines
+        assert "B 672 672 ?" in lines
+        assert "1 A 672 85.20" in lines
+
+    def test_chain_filter(self, tmp_path):
+        lines = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672, chain_id="A")
+        assert "ATOM   1 N     MET A 672 672" in lines
+        assert "ATOM   3 CA    GLY B 1 1" in lines
+        assert "B 1 1 ?" in lines
+        assert "2 B 1 70.00" in lines
+
+    def test_start_one_is_identity(self, tmp_path):
+        lines = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 1)
+        assert lines == MMCIF_TEXT.splitlines()
+
+    def test_output_has_no_trailing_newline(self, tmp_path):
+        _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672)
+        assert not (tmp_path / "out.mmcif").read_text(encoding="utf-8").endswith("\n")
+
+    def test_file_without_sections_copied_through(self, tmp_path):
+        input_path = tmp_path / "in.mmcif"
+        output_path = tmp_path / "out.mmcif"
+        input_path.write_bytes(b"data_ligand\r\n#\r\n_chem_comp.id LIG\f1 2\n")
+
+        renumber_mmcif(input_path, 672, output_path)
+
+        assert output_path.read_bytes() == b"data_ligand\n#\n_chem_comp.id LIG\n1 2"
+
+    def test_in_place_matches_separate_output(self, tmp_path):
+        expected = _renumber_mmcif_text(tmp_path, MMCIF_TEXT, 672)
+        path = tmp_path / "in.mmcif"
+
+        renumber_mmcif(path, 672, path)
+
+        assert path.read_text(encoding="utf-8").splitlines() == expected
+
+
+class TestRenumberLoopRows:
+    def test_non_numeric_value_leaves_row_unchanged(self, tmp_path):
+        text = (
+            "data_model\n#\nloop_\n"
+            "_pdbx_poly_seq_scheme.asym_id\n"
+            "_pdbx_poly_seq_scheme.seq_id\n"
+            "_pdbx_poly_seq_scheme.pdb_seq_num\n"
+            "A 1   x\n"
+            "A 2   2\n"
+            "#"
+        )
+        input_path = tmp_path / "in.mmcif"
+        output_path = tmp_path / "out.mmcif"
+        input_path.write_text(text, encoding="utf-8")
+
+        renumber_mmcif(input_path, 10, output_path)
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert lines[6] == "A 1   x"
+        assert lines[7] == "A 11   11"
+
+    def test_replace_field_reuses_given_fields(self):
+        line = "ATOM   1 CA"
+        fields = find_field_positions(line)
+        assert replace_field_preserve_format(line, 1, "100", fields) == "ATOM   100 CA"
+
+
+class TestRenumberPdb:
+    def test_renumbers_atom_and_ter(self, tmp_path):
+        input_path = tmp_path / "in.pdb"
+        output_path = tmp_path / "out.pdb"
+        input_path.write_text(PDB_TEXT, encoding="utf-8")
+
+        renumber_pdb(input_path, 100, output_path, chain_id="A")
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+
+        assert lines[0][22:26] == " 100"
+        assert lines[1][22:26] == " 100"
+        assert lines[2][22:26] == "   1"
+        assert lines[3][22:26] == "   1"
+
+    def test_non_ascii_input_matches_ascii_output(self, tmp_path):
+        input_path = tmp_path / "in.pdb"
+        ascii_out = tmp_path / "ascii.pdb"
+        text_out = tmp_path / "text.pdb"
+
+        input_path.write_text(PDB_TEXT, encoding="utf-8")
+        renumber_pdb(input_path, 100, ascii_out)
+        input_path.write_text(PDB_TEXT + "REMARK   1 Å\n", encoding="utf-8")
+        renumber_pdb(input_path, 100, text_out)
+
+        ascii_lines = ascii_out.read_text(encoding="utf-8").splitlines()
+        text_lines = text_out.read_text(encoding="utf-8").splitlines()
+        assert text_lines[:-1] == ascii_lines
+        assert text_lines[-1] == "REMARK   1 Å"
+
+
+class TestDetectFileFormat:
+    def test_mmcif_content(self, tmp_path):
+        path = tmp_path / "model.txt"
+        path.write_text(MMCIF_TEXT, encoding="utf-8")
+        assert detect_file_format(path) == "mmcif"
+
+    def test_pdb_content(self, tmp_path):
+        path = tmp_path / "model.cif"
+        path.write_text("\n" + PDB_TEXT, encoding="utf-8")
+        assert detect_file_format(path) == "pdb"
+
+    def test_falls_back_to_extension(self, tmp_path):
+        path = tmp_path / "model.mmcif"
+        path.write_text("unrecognised\n", encoding="utf-8")
+        assert detect_file_format(path) == "mmcif"
+
+    def test_only_reads_start_of_file(self, tmp_path):
+        path = tmp_path / "model.pdb"
+        path.write_text(PDB_TEXT + "REMARK\n" * 20000 + "data_late\n", encoding="utf-8")
+        assert detect_file_format(path) == "pdb"
+
+
+class TestRenumberStructures:
+    def _write_inputs(self, tmp_path):
+        mmcif_path = tmp_path / "a.mmcif"
+        pdb_path = tmp_path / "b.pdb"
+        mmcif_path.write_text(MMCIF_TEXT, encoding="utf-8")
+        pdb_path.write_text(PDB_TEXT, encoding="utf-8")
+        return [mmcif_path, pdb_path]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_outputs_in_input_order(self, tmp_path, max_workers):
+        inputs = self._write_inputs(tmp_path)
+        output_dir = tmp_path / "out"
+
+        outputs = renumber_structures(inputs, 672, output_dir, max_workers=max_workers)
+
+        assert outputs == [output_dir / "a_renumbered.mmcif", output_dir / "b_renumbered.pdb"]
+        assert "ATOM   1 N     MET A 672 672" in outputs[0].read_text(encoding="utf-8").splitlines()
+        assert outputs[1].read_text(encoding="utf-8").splitlines()[0][22:26] == " 672"
+
+    def test_default_outputs_next_to_inputs(self, tmp_path):
+        inputs = self._write_inputs(tmp_path)
+
+        outputs = renumber_structures(inputs, 10, max_workers=1)
+
+        assert outputs == [tmp_path / "a_renumbered.mmcif", tmp_path / "b_renumbered.pdb"]
+        assert all(path.exists() for path in outputs)
+
@@ -2,49 +2,61 @@
 
 import pytest
 
-from boltz2.utils import sanitize_name, generate_run_name
+from boltz2 import utils
+from boltz2.utils import sanitize_name, generate_run_name, generate_timestamp
 
 
+@pytest.mark.xdist_group(name="utils")
 class TestSanitizeName:
-    def test_basic_name(self):
-        assert sanitize_name("my_protein") == "my_protein"
-
-    def test_spaces_replaced(self):
-        assert sanitize_name("my protein name") == "my_protein_name"
-
-    def test_special_chars_removed(self):
-        assert sanitize_name("protein@#$%test") == "proteintest"
-
-    def test_keeps_allowed_chars(self):
-        assert sanitize_name("protein-1_v2.0") == "protein-1_v2.0"
-
-    def test_strips_whitespace(self):
-        assert sanitize_name("  protein  ") == "protein"
-
-    def test_empty_string(self):
-        assert sanitize_name("") == ""
-
-    def test_only_special_chars(self):
-        assert sanitize_name("@#$%") == ""
-
-
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("my_protein", "my_protein"),
+            ("my protein name", "my_protein_name"),
+            ("protein@#$%test", "proteintest"),
+            ("protein-1_v2.0", "protein-1_v2.0"),
+            ("  protein  ", "protein"),
+            ("", ""),
+            ("@#$%", ""),
+            ("Protéine α (v2)", "Protéine_α_v2"),
+        ],
+    )
+    def test_sanitize_name(self, name, expected):
+        assert sanitize_name(name) == expected
+
+
+@pytest.mark.xdist_group(name="utils")
 class TestGenerateRunName:
-    def test_with_output_name(self):
-        result = generate_run_name(output_name="my_run")
-        assert result == "my_run"
-
-    def test_with_output_name_sanitized(self):
-        result = generate_run_name(output_name="my run@test")
-        assert result == "my_runtest"
-
-    def test_without_output_name_uses_prefix(self):
-        result = generate_run_name(prefix="test_prefix")
-        assert result.startswith("test_prefix_")
-
-    def test_empty_output_name_falls_back(self):
-        result = generate_run_name(prefix="fallback", output_name="")
-        assert result.startswith("fallback_")
-
-    def test_special_chars_only_falls_back(self):
-        result = generate_run_name(prefix="fallback", output_name="@#$%")
-        assert result.startswith("fallback_")
+    @pytest.mark.parametrize(
+        "output_name, expected",
+        [
+            ("my_run", "my_run"),
+            ("my run@test", "my_runtest"),
+        ],
+    )
+    def test_uses_sanitized_output_name(self, output_name, expected):
+        assert generate_run_name(output_name=output_name) == expected
+
+    @pytest.mark.parametrize(
+        "prefix, output_name",
+        [
+            ("test_prefix", None),
+            ("fallback", ""),
+            ("fallback", "@#$%"),
+        ],
+    )
+    def test_falls_back_to_prefix(self, prefix, output_name):
+        result = generate_run_name(prefix=prefix, output_name=output_name)
+        assert result.startswith(f"{prefix}_")
+
+
+class TestGenerateTimestamp:
+    def test_matches_utc_format(self, monkeypatch):
+        monkeypatch.setattr(utils.time, "time", lambda: 1704110400.5)
+        assert generate_timestamp() == "20240101T120000Z"
+
+    def test_follows_clock_across_seconds(self, monkeypatch):
+        monkeypatch.setattr(utils.time, "time", lambda: 1704110400.0)
+        first = generate_timestamp()
+        monkeypatch.setattr(utils.time, "time", lambda: 1704110401.0)
+        assert generate_timestamp() != first
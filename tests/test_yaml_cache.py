@@ -0,0 +1,100 @@
+"""Tests for boltz2.yaml_cache module."""
+
+import os
+
+import pytest
+
+from boltz2.yaml_cache import load_payload_from_yaml_cached
+
+
+YAML_TEXT = """\
+meta:
+  name: cached-run
+sequences:
+  - protein:
+      id: A
+      sequence: ACDEF
+  - ligand:
+      id: L1
+      smiles: CCO
+"""
+
+
+class TestLoadPayloadFromYamlCached:
+    def test_returns_payload_and_meta_name(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+
+        payload, meta_name = load_payload_from_yaml_cached(yaml_path, cache_dir=tmp_path / "cache")
+
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+        assert payload["ligands"][0]["smiles"] == "CCO"
+        assert meta_name == "cached-run"
+
+    def test_second_load_hits_cache(self, tmp_path, monkeypatch):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        first = load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be re-parsed on a cache hit")
+
+        monkeypatch.setattr("boltz2.yaml_cache.load_payload_and_meta_for_identity", fail)
+        second = load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+
+        assert second == first
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+
+        yaml_path.write_text(YAML_TEXT.replace("ACDEF", "MKTAYIAK"), encoding="utf-8")
+        st = yaml_path.stat()
+        os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        payload, _ = load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+        assert payload["polymers"][0]["sequence"] == "MKTAYIAK"
+
+    def test_invalid_yaml_raises(self, tmp_path):
+        yaml_path = tmp_path / "empty.yaml"
+        yaml_path.write_text("", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            load_payload_from_yaml_cached(yaml_path, cache_dir=tmp_path / "cache")
+
+    def test_no_cache_skips_cache_dir(self, tmp_path):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        payload, meta_name = load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir, use_cache=False)
+
+        assert payload["polymers"][0]["sequence"] == "ACDEF"
+        assert meta_name == "cached-run"
+        assert not cache_dir.exists()
+
+    def test_version_change_invalidates_entry(self, tmp_path, monkeypatch):
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+
+        monkeypatch.setattr("boltz2.yaml_cache.__version__", "0.0.0-test")
+        load_payload_from_yaml_cached(yaml_path, cache_dir=cache_dir)
+
+        assert len(list(cache_dir.glob("*.json"))) == 2
+
+    def test_default_cache_dir_is_private_per_user(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        yaml_path = tmp_path / "input.yaml"
+        yaml_path.write_text(YAML_TEXT, encoding="utf-8")
+
+        load_payload_from_yaml_cached(yaml_path)
+
+        cache_dir = tmp_path / "xdg" / "boltz2" / "yaml"
+        assert list(cache_dir.glob("*.json"))
+        assert cache_dir.stat().st_mode & 0o777 == 0o700